@@ -0,0 +1,598 @@
+"""Frozen model module for altherma_ebla_edla_d_9_16_monobloc.json.
+
+Generated by tools/convert_altherma_header.py --frozen; load with
+``DaikinConverter.from_model_module``. DO NOT EDIT BY HAND.
+"""
+
+from struct import pack as _pack
+
+from daikin_converters import _bytes_to_registers as _b
+from daikin_converters import convert_raw_value as _c
+
+# Binary model (tools/compile_model.py format): stays in flash when frozen
+MODEL = (
+    b'DKMB\x01\x08\xde\x00\xfc\x0fSensor Data QtyINV compressor QtySTD compressor QtyFan Data QtyEx'
+    b'pansion Valve Data Qty4 Way Valve Data QtyCrank Case Heater QtySolenoid valve QtyMax. connect'
+    b'able indoor unitsConnected Indoor Unit QtyO/U MPU ID (xx)O/U MPU ID (yy)O/U capacity (kW)Oper'
+    b'ation ModeThermostat ON/OFFRestart standbyStartup ControlDefrost OperationOil Return Operatio'
+    b'nPressure equalizing operationDemand SignalLow noise controlError typeError CodeTarget Evap. '
+    b'Temp.Target Cond. Temp.Discharge Temp. DropDischarge Temp. Protection Retry QtyComp. INV Curr'
+    b'ent DropComp. INV Current Protection Retry QtyHP Drop ControlHP Protection Retry QtyLP Drop C'
+    b'ontrolLP Protection Retry QtyFin Temp. Drop ControlFin Temp. Protection Retry QtyOther Drop C'
+    b'ontrolNot in useO/U EEPROM (1st digit)O/U EEPROM (3rd 4th digit)O/U EEPROM (5th 6th digit)O/U'
+    b' EEPROM (7th 8th digit)O/U EEPROM (10th digit)O/U EEPROM (11th digit)NextDataGridR1T-Outdoor '
+    b'air temp.O/U Heat Exch. Temp.(R4T)Discharge pipe temp.(R2T)Suction pipe temp.(R3T)Heat exchan'
+    b'ger mid-temp.(R5T)Liquid pipe temp.(R6T)High PressureHigh Pressure(T)Low PressureLow Pressure'
+    b'(T)INV primary current (A)INV secondary current (A)INV fin temp.Fan1 Fin temp.Fan2 Fin temp.C'
+    b'ompressor outlet temperatureINV frequency (rps)Fan 1 (step)Fan 2 (step)Expansion valve 1 (pls'
+    b')Expansion valve 2 (pls)Expansion valve 3 (pls)Expansion valve 4 (pls)4 Way ValveCrank case h'
+    b'eaterHot gas bypass valve (Y3S)LP bypass valve (Y2S)Y3SIn-Out separatorSuction tempOutdoor he'
+    b'at exchanger temp.Liquid pipe temp.PressureO/U MPU IDHPS operationSafeguard operationSolenoid'
+    b' Valve 3Solenoid Valve 2Solenoid Valve 14 way valve (Y1S)52C OutputDuring emergency operation'
+    b'Indoor unit blowout 50 C flagPowerful bit (MT setting bit)Compressor port temperature(Raw dat'
+    b'a)Water heat exchanger inlet temp.(Raw data)Water heat exchanger outlet temp.Liquid INJ solen'
+    b'oid valve (Y4S)Bottom Plate HeaterPHE HeaterTarget Discharge Temp.Target port temperatureMono'
+    b'bloc settingMinichiller settingMT settingGSHP settingHydro split settingAlterma LT settingDat'
+    b'a Enable/DisableIndoor Unit AddressI/U operation modeExt. Thermostat ON/OFFFreeze ProtectionS'
+    b'ilent ModeFreeze Protection for water pipingError detailed codeI/U capacity codeDHW setpointL'
+    b'W setpoint (main)Water flow switchThermal protector (Q1L) BUHThermal protector BSHBenefit kWh'
+    b' rate power supplySolar inputSmartGridContact2SmartGridContact1Bivalent Operation2way valve(O'
+    b'n:Heat_Off:Cool)3way valve(On:DHW_Off:Space)BSHBUH Step1BUH Step2Floor loop shut off valveWat'
+    b'er pump operationSolar pump operationIndoor Option CodeI/U Software ID (xx)I/U Software ID (y'
+    b'y)I/U EEPROM Ver.Leaving water temp. before BUH (R1T)Leaving water temp. after BUH (R2T)Refri'
+    b'g. Temp. liquid side (R3T)Inlet water temp.(R4T)DHW tank temp. (R5T)Indoor ambient temp. (R1T'
+    b')Ext. indoor ambient sensor (R6T)Reheat ON/OFFStorage ECO ON/OFFStorage comfort ON/OFFPowerfu'
+    b'l DHW Operation. ON/OFFSpace heating Operation ON/OFFSystem OFF (ON:System off)Emergency (ind'
+    b'oor) active/not activeLW setpoint (add)RT setpointAdd. Ext. RT Input Cool.Add. Ext. RT Input '
+    b'Heat.Main RT CoolingMain RT HeatingPwr consumption limit 4Pwr consumption limit 3Pwr consumpt'
+    b'ion limit 2Pwr consumption limit 1NoneTank preheat ON/OFFCirculation pump operationAlarm outp'
+    b'utSpace H Operation outputFlow sensor (l/min)Water pressureWater pump signal (0:max-100:stop)'
+    b'[Future] 3 way Valve Mixing 1[Future] 3 way Valve Mixing 2Refrigerant pressure sensorI/U EEPR'
+    b'OM (3rd digit)I/U EEPROM (4th 5th digit)I/U EEPROM (6th 7th digit)I/U EEPROM (8th 9th digit)I'
+    b'/U EEPROM (11th digit)I/U EEPROM (12th digit)(rev.)BUH output capacityCurrent measured by CT '
+    b'sensor of L1Current measured by CT sensor of L2HP Forced FGCurrent measured by CT sensor of L'
+    b'3Hybrid Op. ModeBoiler Operation DemandBoiler DHW DemandBypass Valve OutputBE_COPHybrid Heati'
+    b'ng Target Temp.Boiler Heating Target Temp.Add pumpMain pumpMixed water temp.2nd Domestic hot '
+    b'water temperatureTarget delta T heatingTarget delta T coolingOutlet water heat exchanger temp'
+    b' (hydro split model) DLWB2[EKMIK] Bizone kit mixed leaving water temperature R1T[EKMIK] Bizon'
+    b'e kit mix valve position M1S\x00\x00\x98\x00\x01\x0f\x00\x00\x00\x01\x98\x00\x01\x12\x0f\x00'
+    b'\x00\x02\x98\x00\x01\x12!\x00\x00\x03\x98\x00\x01\x0c3\x00\x00\x04\x98\x00\x01\x18?\x00\x00'
+    b'\x05\x98\x00\x01\x14W\x00\x00\x06\x98\x00\x01\x15k\x00\x00\x07\x98\x00\x01\x12\x80\x00\x00'
+    b'\x08\x98\x00\x01\x1d\x92\x00\x00\t\x98\x00\x01\x19\xaf\x00\x00\n\x98\x00\x01\x0f\xc8\x00\x00'
+    b'\x0b\x98\x00\x01\x0f\xd7\x00\x00\x0ci\x00\x01\x11\xe6\x00\x10\x00\xd9\x00\x01\x0e\xf7\x00\x10'
+    b'\x013\x01\x01\x11\x05\x01\x10\x012\x01\x01\x0f\x16\x01\x10\x011\x01\x01\x0f%\x01\x10\x010\x01'
+    b'\x01\x114\x01\x10\x01/\x01\x01\x14E\x01\x10\x01.\x01\x01\x1dY\x01\x10\x01-\x01\x01\rv\x01\x10'
+    b'\x01,\x01\x01\x11\x83\x01\x10\x04\xcb\x00\x01\n\x94\x01\x10\x05\xcc\x00\x01\n\x9e\x01\x10\x06'
+    b'r\x00\x02\x12\xa8\x01\x10\x08r\x00\x02\x12\xba\x01\x10\n3\x01\x01\x14\xcc\x01\x10\n6\x01\x01$'
+    b'\xe0\x01\x10\n/\x01\x01\x16\x04\x02\x10\n7\x01\x01&\x1a\x02\x10\x0b3\x01\x01\x0f@\x02\x10\x0b'
+    b'6\x01\x01\x17O\x02\x10\x0b/\x01\x01\x0ff\x02\x10\x0b7\x01\x01\x17u\x02\x10\x0c3\x01\x01\x16'
+    b'\x8c\x02\x10\x0c6\x01\x01\x1e\xa2\x02\x10\x0c/\x01\x01\x12\xc0\x02\x10\x0c7\x01\x01\n\xd2\x02'
+    b'\x11\x00\xd7\x00\x01\x16\xdc\x02\x11\x01\xd7\x00\x01\x1a\xf2\x02\x11\x02\xd7\x00\x01\x1a\x0c'
+    b'\x03\x11\x03\xd7\x00\x01\x1a&\x03\x11\x04\xd7\x00\x01\x17@\x03\x11\x05\xd6\x00\x01\x17W\x03'
+    b'\x00\x00\xe3\x03\x01\x0cn\x03 \x00i\x00\x02\x15z\x03 \x02i\x00\x02\x19\x8f\x03 \x04i\x00\x02'
+    b'\x19\xa8\x03 \x06i\x00\x02\x17\xc1\x03 \x08i\x00\x02\x1d\xd8\x03 \ni\x00\x02\x16\xf5\x03 \x0c'
+    b'i\x00\x02\r\x0b\x04 \x0c\x95\x01\x02\x10\x18\x04 \x0ei\x00\x02\x0c(\x04 \x0e\x95\x01\x02\x0f4'
+    b'\x04!\x00i\x00\x02\x17C\x04!\x02i\x00\x02\x19Z\x04!\x04i\x00\x02\rs\x04!\x06i\x00\x02\x0e\x80'
+    b'\x04!\x08i\x00\x02\x0e\x8e\x04!\ni\x00\x02\x1d\x9c\x04\x00\x00\xe3\x03\x01\x0cn\x030\x00\x98'
+    b'\x00\x01\x13\xb9\x040\x01\xd3\x00\x01\x0c\xcc\x040\x02\xd3\x00\x01\x0c\xd8\x040\x03\x97\x00'
+    b'\x02\x17\xe4\x040\x05\x97\x00\x02\x17\xfb\x040\x07\x97\x00\x02\x17\x12\x050\t\x97\x00\x02\x17'
+    b')\x050\x0b3\x01\x01\x0b@\x050\x0c3\x01\x01\x11K\x050\r3\x01\x01\x1a\\\x050\r2\x01\x01\x15v'
+    b'\x050\r1\x01\x01\x03\x8b\x05\x00\x00\xe6\x03\x01\x10\x8e\x05\xa0\x00w\x00\x02\x0c\x9e\x05\xa0'
+    b'\x02w\x00\x02\x1c\xaa\x05\xa0\x04w\x00\x02\x11\xc6\x05\xa0\x06w\x00\x02\x08\xd7\x05\xa0\x08'
+    b'\x97\x00\x02\x17\x12\x05\xa0\n\x98\x00\x01\n\xdf\x05\xa0\x0b\x98\x00\x01\n\xdf\x05\xa0\x0c3'
+    b'\x01\x01\r\xe9\x05\xa0\x0c2\x01\x01\x13\xf6\x05\xa0\x0c1\x01\x01\x11K\x05\xa0\x0c0\x01\x01'
+    b'\x10\t\x06\xa0\x0c/\x01\x01\x10\x19\x06\xa0\x0c.\x01\x01\x10)\x06\xa0\x0c-\x01\x01\x119\x06'
+    b'\xa0\x0c,\x01\x01\nJ\x06\xa0\r/\x01\x01\x14\xcc\x01\xa0\r.\x01\x01\x1aT\x06\xa0\r-\x01\x01'
+    b'\x1dn\x06\xa0\r,\x01\x01\x1d\x8b\x06\xa0\x0ei\x00\x02\x1b\xa8\x06\xa1\x00w\x00\x02*\xc3\x06'
+    b'\xa1\x02w\x00\x02+\xed\x06\xa1\x04.\x01\x01\x1f\x18\x07\xa1\x04-\x01\x01\x137\x07\xa1\x04,'
+    b'\x01\x01\nJ\x07\xa1\x05r\x00\x02\x16T\x07\xa1\x07r\x00\x02\x17j\x07\xa1\t1\x01\x01\x10\x81'
+    b'\x07\xa1\t0\x01\x01\x13\x91\x07\xa1\t/\x01\x01\n\xa4\x07\xa1\t.\x01\x01\x0c\xae\x07\xa1\t-'
+    b'\x01\x01\x13\xba\x07\xa1\t,\x01\x01\x12\xcd\x07`\x000\x01\x01\x13\xdf\x07`\x01\x98\x00\x01'
+    b'\x13\xf2\x07`\x02;\x01\x01\x12\x05\x08`\x02/\x01\x01\x16\x17\x08`\x02.\x01\x01\x11-\x08`\x02-'
+    b'\x01\x01\x0b>\x08`\x02,\x01\x01"I\x08`\x03\xcc\x00\x01\n\x9e\x01`\x04\x98\x00\x01\x13k\x08`'
+    b'\x05\xcb\x00\x01\n\x94\x01`\x06\xdb\x00\x01\x11~\x08`\x07i\x00\x02\x0c\x8f\x08`\ti\x00\x02'
+    b'\x12\x9b\x08`\x0b3\x01\x01\x11\xad\x08`\x0b2\x01\x01\x1b\xbe\x08`\x0b1\x01\x01\x15\xd9\x08`'
+    b"\x0b0\x01\x01\x1d\xee\x08`\x0b/\x01\x01\x0b\x0b\t`\x0b.\x01\x01\x11\x16\t`\x0b-\x01\x01\x11'"
+    b'\t`\x0b,\x01\x01\x128\t`\x0c3\x01\x01\x1cJ\t`\x0c2\x01\x01\x1cf\t`\x0c1\x01\x01\x03\x82\t`'
+    b'\x0c0\x01\x01\t\x85\t`\x0c/\x01\x01\t\x8e\t`\x0c.\x01\x01\x19\x97\t`\x0c-\x01\x01\x14\xb0\t`'
+    b'\x0c,\x01\x01\x14\xc4\t`\r\x98\x00\x01\x12\xd8\t`\x0f\xd7\x00\x01\x14\xea\t`\x0e\xd7\x00\x01'
+    b'\x14\xfe\t`\x10\x98\x00\x01\x0f\x12\na\x003\x01\x01\x13\xdf\x07a\x01\x98\x00\x01\x13\xf2\x07a'
+    b'\x02i\x00\x02$!\na\x04i\x00\x02#E\na\x06i\x00\x02\x1fh\na\x08i\x00\x02\x16\x87\na\ni\x00\x02'
+    b'\x14\x9d\na\x0ci\x00\x02\x1a\xb1\na\x0ei\x00\x02 \xcb\nb\x003\x01\x01\x13\xdf\x07b\x01\x98'
+    b'\x00\x01\x13\xf2\x07b\x023\x01\x01\r\xeb\nb\x022\x01\x01\x12\xf8\nb\x021\x01\x01\x16\n\x0bb'
+    b'\x020\x01\x01\x1e \x0bb\x02/\x01\x01\x1e>\x0bb\x02.\x01\x01\x1a\\\x0bb\x02-\x01\x01\n\xd2\x02'
+    b'b\x02,\x01\x01$v\x0bb\x03i\x00\x02\x11\x9a\x0bb\x05i\x00\x02\x0b\xab\x0bb\x073\x01\x01\x18'
+    b'\xb6\x0bb\x072\x01\x01\x18\xce\x0bb\x071\x01\x01\x0f\xe6\x0bb\x070\x01\x01\x0f\xf5\x0bb\x07/'
+    b'\x01\x01\x17\x04\x0cb\x07.\x01\x01\x17\x1b\x0cb\x07-\x01\x01\x172\x0cb\x07,\x01\x01\x17I\x0cb'
+    b'\x083\x01\x01\x04`\x0cb\x082\x01\x01\n\xd2\x02b\x081\x01\x01\n\xd2\x02b\x080\x01\x01\nJ\x07b'
+    b'\x08/\x01\x01\x13d\x0cb\x08.\x01\x01\x1aw\x0cb\x08-\x01\x01\x0c\x91\x0cb\x08,\x01\x01\x18\x9d'
+    b'\x0cb\ti\x00\x02\x13\xb5\x0cb\x0bi\x00\x01\x0e\xc8\x0cb\x0c\x98\x00\x01"\xd6\x0cb\r\x98\x00'
+    b'\x01\x1d\xf8\x0cb\x0e\x98\x00\x01\x1d\x15\rb\x0fi\x00\x02\x1b2\rc\x003\x01\x01\x13\xdf\x07c'
+    b'\x01\x98\x00\x01\x13\xf2\x07c\x02\xd7\x00\x01\x16M\rc\x03\xd7\x00\x01\x1ac\rc\x04\xd7\x00\x01'
+    b'\x1a}\rc\x05\xd7\x00\x01\x1a\x97\rc\x06\xd7\x00\x01\x17\xb1\rc\x07\xd7\x00\x01\x1d\xc8\rc\x08'
+    b'\xd7\x00\x01\n\xd2\x02c\t\xd7\x00\x01\n\xd2\x02c\n\xd7\x00\x01\n\xd2\x02c\x0b\xd7\x00\x01\n'
+    b'\xd2\x02c\x0c\xd7\x00\x01\n\xd2\x02c\r7\x01\x01\x13\xe5\rc\x0e\xa1\x00\x01#\xf8\rc\x0f\xa1'
+    b'\x00\x01#\x1b\x0ec\x103\x01\x01\x0c>\x0ec\x10\xa1\x00\x01#J\x0ed\x003\x01\x01\x13\xdf\x07d'
+    b'\x01\x98\x00\x01\x13\xf2\x07d\x02<\x01\x01\x0fm\x0ed\x02/\x01\x01\x17|\x0ed\x02.\x01\x01\x11'
+    b'\x93\x0ed\x02-\x01\x01\x13\xa4\x0ed\x03i\x00\x02\x06\xb7\x0ed\x05i\x00\x02\x1b\xbd\x0ed\x07i'
+    b'\x00\x02\x1b\xd8\x0ed\t.\x01\x01\x08\xf3\x0ed\t-\x01\x01\t\xfb\x0ed\nv\x00\x02\x11\x04\x0fd'
+    b'\x0ci\x00\x02"\x15\x0fd\x0e\x98\x00\x01\x167\x0fd\x0f\x98\x00\x01\x16M\x0fe\x003\x01\x01\x13'
+    b'\xdf\x07e\x01\x98\x00\x02\x13\xf2\x07e\x02i\x00\x02:c\x0fe\x04i\x00\x026\x9d\x0fe\x06e\x00'
+    b'\x01)\xd3\x0f'
+)
+
+
+def _decode_0x00(p, start, stop):
+    if len(p) < 13:
+        return None
+    f = _pack(">12f",
+              float(p[1]),
+              float(p[2]),
+              float(p[3]),
+              float(p[4]),
+              float(p[5]),
+              float(p[6]),
+              float(p[7]),
+              float(p[8]),
+              float(p[9]),
+              float(p[10]),
+              float(p[11]),
+              float(p[12]) * 0.1)
+    r = {}
+    if start <= 0 < stop:
+        r[0] = _b(p[0:1])
+    if start <= 1 < stop:
+        r[1] = [f[0] << 8 | f[1], f[2] << 8 | f[3]]
+    if start <= 2 < stop:
+        r[2] = [f[4] << 8 | f[5], f[6] << 8 | f[7]]
+    if start <= 3 < stop:
+        r[3] = [f[8] << 8 | f[9], f[10] << 8 | f[11]]
+    if start <= 4 < stop:
+        r[4] = [f[12] << 8 | f[13], f[14] << 8 | f[15]]
+    if start <= 5 < stop:
+        r[5] = [f[16] << 8 | f[17], f[18] << 8 | f[19]]
+    if start <= 6 < stop:
+        r[6] = [f[20] << 8 | f[21], f[22] << 8 | f[23]]
+    if start <= 7 < stop:
+        r[7] = [f[24] << 8 | f[25], f[26] << 8 | f[27]]
+    if start <= 8 < stop:
+        r[8] = [f[28] << 8 | f[29], f[30] << 8 | f[31]]
+    if start <= 9 < stop:
+        r[9] = [f[32] << 8 | f[33], f[34] << 8 | f[35]]
+    if start <= 10 < stop:
+        r[10] = [f[36] << 8 | f[37], f[38] << 8 | f[39]]
+    if start <= 11 < stop:
+        r[11] = [f[40] << 8 | f[41], f[42] << 8 | f[43]]
+    if start <= 12 < stop:
+        r[12] = [f[44] << 8 | f[45], f[46] << 8 | f[47]]
+    return r
+
+
+def _decode_0x10(p, start, stop):
+    if len(p) < 13:
+        return None
+    r = {}
+    if start <= 0 < stop:
+        r[0] = [p[0]]
+    if start <= 1 < stop:
+        r[1] = [p[1] & 0xFF]
+    if start <= 4 < stop:
+        r[4] = _c(203, p[4:5])
+    if start <= 5 < stop:
+        r[5] = _c(204, p[5:6])
+    if start <= 6 < stop:
+        r[6] = _c(114, p[6:8])
+    if start <= 8 < stop:
+        r[8] = _c(114, p[8:10])
+    if start <= 10 < stop:
+        r[10] = _b(p[10:11])
+    if start <= 11 < stop:
+        r[11] = _b(p[11:12])
+    if start <= 12 < stop:
+        r[12] = _b(p[12:13])
+    return r
+
+
+def _decode_0x11(p, start, stop):
+    if len(p) < 6:
+        return None
+    r = {}
+    if start <= 0 < stop:
+        r[0] = _c(215, p[0:1])
+    if start <= 1 < stop:
+        r[1] = _c(215, p[1:2])
+    if start <= 2 < stop:
+        r[2] = _c(215, p[2:3])
+    if start <= 3 < stop:
+        r[3] = _c(215, p[3:4])
+    if start <= 4 < stop:
+        r[4] = _c(215, p[4:5])
+    if start <= 5 < stop:
+        r[5] = _b(p[5:6])
+    return r
+
+
+def _decode_0x20(p, start, stop):
+    if len(p) < 16:
+        return None
+    f = _pack(">6f",
+              float((((p[1] << 8 | p[0]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[3] << 8 | p[2]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[5] << 8 | p[4]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[7] << 8 | p[6]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[9] << 8 | p[8]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[11] << 8 | p[10]) ^ 0x8000) - 0x8000)) * 0.1)
+    r = {}
+    if start <= 0 < stop:
+        r[0] = [f[0] << 8 | f[1], f[2] << 8 | f[3]]
+    if start <= 2 < stop:
+        r[2] = [f[4] << 8 | f[5], f[6] << 8 | f[7]]
+    if start <= 4 < stop:
+        r[4] = [f[8] << 8 | f[9], f[10] << 8 | f[11]]
+    if start <= 6 < stop:
+        r[6] = [f[12] << 8 | f[13], f[14] << 8 | f[15]]
+    if start <= 8 < stop:
+        r[8] = [f[16] << 8 | f[17], f[18] << 8 | f[19]]
+    if start <= 10 < stop:
+        r[10] = [f[20] << 8 | f[21], f[22] << 8 | f[23]]
+    if start <= 12 < stop:
+        r[12] = _c(405, p[12:14])
+    if start <= 14 < stop:
+        r[14] = _c(405, p[14:16])
+    return r
+
+
+def _decode_0x21(p, start, stop):
+    if len(p) < 12:
+        return None
+    f = _pack(">6f",
+              float((((p[1] << 8 | p[0]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[3] << 8 | p[2]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[5] << 8 | p[4]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[7] << 8 | p[6]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[9] << 8 | p[8]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[11] << 8 | p[10]) ^ 0x8000) - 0x8000)) * 0.1)
+    r = {}
+    if start <= 0 < stop:
+        r[0] = [f[0] << 8 | f[1], f[2] << 8 | f[3]]
+    if start <= 2 < stop:
+        r[2] = [f[4] << 8 | f[5], f[6] << 8 | f[7]]
+    if start <= 4 < stop:
+        r[4] = [f[8] << 8 | f[9], f[10] << 8 | f[11]]
+    if start <= 6 < stop:
+        r[6] = [f[12] << 8 | f[13], f[14] << 8 | f[15]]
+    if start <= 8 < stop:
+        r[8] = [f[16] << 8 | f[17], f[18] << 8 | f[19]]
+    if start <= 10 < stop:
+        r[10] = [f[20] << 8 | f[21], f[22] << 8 | f[23]]
+    return r
+
+
+def _decode_0x30(p, start, stop):
+    if len(p) < 14:
+        return None
+    f = _pack(">5f",
+              float(p[0]),
+              float((p[4] << 8 | p[3])),
+              float((p[6] << 8 | p[5])),
+              float((p[8] << 8 | p[7])),
+              float((p[10] << 8 | p[9])))
+    r = {}
+    if start <= 0 < stop:
+        r[0] = [f[0] << 8 | f[1], f[2] << 8 | f[3]]
+    if start <= 1 < stop:
+        r[1] = [p[1]]
+    if start <= 2 < stop:
+        r[2] = [p[2]]
+    if start <= 3 < stop:
+        r[3] = [f[4] << 8 | f[5], f[6] << 8 | f[7]]
+    if start <= 5 < stop:
+        r[5] = [f[8] << 8 | f[9], f[10] << 8 | f[11]]
+    if start <= 7 < stop:
+        r[7] = [f[12] << 8 | f[13], f[14] << 8 | f[15]]
+    if start <= 9 < stop:
+        r[9] = [f[16] << 8 | f[17], f[18] << 8 | f[19]]
+    if start <= 11 < stop:
+        r[11] = [p[11] >> 7 & 1]
+    if start <= 12 < stop:
+        r[12] = [p[12] >> 7 & 1]
+    if start <= 13 < stop:
+        r[13] = [p[13] & 0xE0]
+    return r
+
+
+def _decode_0x60(p, start, stop):
+    if len(p) < 17:
+        return None
+    f = _pack(">6f",
+              float(p[1]),
+              float(p[4]),
+              float((((p[8] << 8 | p[7]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[10] << 8 | p[9]) ^ 0x8000) - 0x8000)) * 0.1,
+              float(p[13]),
+              float(p[16]))
+    r = {}
+    if start <= 0 < stop:
+        r[0] = [p[0] >> 4 & 1]
+    if start <= 1 < stop:
+        r[1] = [f[0] << 8 | f[1], f[2] << 8 | f[3]]
+    if start <= 2 < stop:
+        r[2] = [p[2] & 0x0F]
+    if start <= 3 < stop:
+        r[3] = _c(204, p[3:4])
+    if start <= 4 < stop:
+        r[4] = [f[4] << 8 | f[5], f[6] << 8 | f[7]]
+    if start <= 5 < stop:
+        r[5] = _c(203, p[5:6])
+    if start <= 6 < stop:
+        r[6] = _b(p[6:7])
+    if start <= 7 < stop:
+        r[7] = [f[8] << 8 | f[9], f[10] << 8 | f[11]]
+    if start <= 9 < stop:
+        r[9] = [f[12] << 8 | f[13], f[14] << 8 | f[15]]
+    if start <= 11 < stop:
+        r[11] = [p[11] & 0xFF]
+    if start <= 12 < stop:
+        r[12] = [p[12] & 0xFF]
+    if start <= 13 < stop:
+        r[13] = [f[16] << 8 | f[17], f[18] << 8 | f[19]]
+    if start <= 14 < stop:
+        r[14] = _c(215, p[14:15])
+    if start <= 15 < stop:
+        r[15] = _c(215, p[15:16])
+    if start <= 16 < stop:
+        r[16] = [f[20] << 8 | f[21], f[22] << 8 | f[23]]
+    return r
+
+
+def _decode_0x61(p, start, stop):
+    if len(p) < 16:
+        return None
+    f = _pack(">8f",
+              float(p[1]),
+              float((((p[3] << 8 | p[2]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[5] << 8 | p[4]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[7] << 8 | p[6]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[9] << 8 | p[8]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[11] << 8 | p[10]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[13] << 8 | p[12]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[15] << 8 | p[14]) ^ 0x8000) - 0x8000)) * 0.1)
+    r = {}
+    if start <= 0 < stop:
+        r[0] = [p[0] >> 7 & 1]
+    if start <= 1 < stop:
+        r[1] = [f[0] << 8 | f[1], f[2] << 8 | f[3]]
+    if start <= 2 < stop:
+        r[2] = [f[4] << 8 | f[5], f[6] << 8 | f[7]]
+    if start <= 4 < stop:
+        r[4] = [f[8] << 8 | f[9], f[10] << 8 | f[11]]
+    if start <= 6 < stop:
+        r[6] = [f[12] << 8 | f[13], f[14] << 8 | f[15]]
+    if start <= 8 < stop:
+        r[8] = [f[16] << 8 | f[17], f[18] << 8 | f[19]]
+    if start <= 10 < stop:
+        r[10] = [f[20] << 8 | f[21], f[22] << 8 | f[23]]
+    if start <= 12 < stop:
+        r[12] = [f[24] << 8 | f[25], f[26] << 8 | f[27]]
+    if start <= 14 < stop:
+        r[14] = [f[28] << 8 | f[29], f[30] << 8 | f[31]]
+    return r
+
+
+def _decode_0x62(p, start, stop):
+    if len(p) < 17:
+        return None
+    f = _pack(">9f",
+              float(p[1]),
+              float((((p[4] << 8 | p[3]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[6] << 8 | p[5]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[10] << 8 | p[9]) ^ 0x8000) - 0x8000)) * 0.1,
+              float(p[11]) * 0.1,
+              float(p[12]),
+              float(p[13]),
+              float(p[14]),
+              float((((p[16] << 8 | p[15]) ^ 0x8000) - 0x8000)) * 0.1)
+    r = {}
+    if start <= 0 < stop:
+        r[0] = [p[0] >> 7 & 1]
+    if start <= 1 < stop:
+        r[1] = [f[0] << 8 | f[1], f[2] << 8 | f[3]]
+    if start <= 2 < stop:
+        r[2] = [p[2] & 0xFF]
+    if start <= 3 < stop:
+        r[3] = [f[4] << 8 | f[5], f[6] << 8 | f[7]]
+    if start <= 5 < stop:
+        r[5] = [f[8] << 8 | f[9], f[10] << 8 | f[11]]
+    if start <= 7 < stop:
+        r[7] = [p[7] & 0xFF]
+    if start <= 8 < stop:
+        r[8] = [p[8] & 0xFF]
+    if start <= 9 < stop:
+        r[9] = [f[12] << 8 | f[13], f[14] << 8 | f[15]]
+    if start <= 11 < stop:
+        r[11] = [f[16] << 8 | f[17], f[18] << 8 | f[19]]
+    if start <= 12 < stop:
+        r[12] = [f[20] << 8 | f[21], f[22] << 8 | f[23]]
+    if start <= 13 < stop:
+        r[13] = [f[24] << 8 | f[25], f[26] << 8 | f[27]]
+    if start <= 14 < stop:
+        r[14] = [f[28] << 8 | f[29], f[30] << 8 | f[31]]
+    if start <= 15 < stop:
+        r[15] = [f[32] << 8 | f[33], f[34] << 8 | f[35]]
+    return r
+
+
+def _decode_0x63(p, start, stop):
+    if len(p) < 17:
+        return None
+    f = _pack(">4f",
+              float(p[1]),
+              float(p[14]) * 0.5,
+              float(p[15]) * 0.5,
+              float(p[16]) * 0.5)
+    r = {}
+    if start <= 0 < stop:
+        r[0] = [p[0] >> 7 & 1]
+    if start <= 1 < stop:
+        r[1] = [f[0] << 8 | f[1], f[2] << 8 | f[3]]
+    if start <= 2 < stop:
+        r[2] = _c(215, p[2:3])
+    if start <= 3 < stop:
+        r[3] = _c(215, p[3:4])
+    if start <= 4 < stop:
+        r[4] = _c(215, p[4:5])
+    if start <= 5 < stop:
+        r[5] = _c(215, p[5:6])
+    if start <= 6 < stop:
+        r[6] = _c(215, p[6:7])
+    if start <= 7 < stop:
+        r[7] = _c(215, p[7:8])
+    if start <= 8 < stop:
+        r[8] = _c(215, p[8:9])
+    if start <= 9 < stop:
+        r[9] = _c(215, p[9:10])
+    if start <= 10 < stop:
+        r[10] = _c(215, p[10:11])
+    if start <= 11 < stop:
+        r[11] = _c(215, p[11:12])
+    if start <= 12 < stop:
+        r[12] = _c(215, p[12:13])
+    if start <= 13 < stop:
+        r[13] = _b(p[13:14])
+    if start <= 14 < stop:
+        r[14] = [f[4] << 8 | f[5], f[6] << 8 | f[7]]
+    if start <= 15 < stop:
+        r[15] = [f[8] << 8 | f[9], f[10] << 8 | f[11]]
+    if start <= 16 < stop:
+        r[16] = [f[12] << 8 | f[13], f[14] << 8 | f[15]]
+    return r
+
+
+def _decode_0x64(p, start, stop):
+    if len(p) < 16:
+        return None
+    f = _pack(">8f",
+              float(p[1]),
+              float((((p[4] << 8 | p[3]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[6] << 8 | p[5]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[8] << 8 | p[7]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[10] << 8 | p[11]) ^ 0x8000) - 0x8000)) * 0.01,
+              float((((p[13] << 8 | p[12]) ^ 0x8000) - 0x8000)) * 0.1,
+              float(p[14]),
+              float(p[15]))
+    r = {}
+    if start <= 0 < stop:
+        r[0] = [p[0] >> 7 & 1]
+    if start <= 1 < stop:
+        r[1] = [f[0] << 8 | f[1], f[2] << 8 | f[3]]
+    if start <= 2 < stop:
+        r[2] = [p[2] & 0x0E]
+    if start <= 3 < stop:
+        r[3] = [f[4] << 8 | f[5], f[6] << 8 | f[7]]
+    if start <= 5 < stop:
+        r[5] = [f[8] << 8 | f[9], f[10] << 8 | f[11]]
+    if start <= 7 < stop:
+        r[7] = [f[12] << 8 | f[13], f[14] << 8 | f[15]]
+    if start <= 9 < stop:
+        r[9] = [p[9] & 0x06]
+    if start <= 10 < stop:
+        r[10] = [f[16] << 8 | f[17], f[18] << 8 | f[19]]
+    if start <= 12 < stop:
+        r[12] = [f[20] << 8 | f[21], f[22] << 8 | f[23]]
+    if start <= 14 < stop:
+        r[14] = [f[24] << 8 | f[25], f[26] << 8 | f[27]]
+    if start <= 15 < stop:
+        r[15] = [f[28] << 8 | f[29], f[30] << 8 | f[31]]
+    return r
+
+
+def _decode_0x65(p, start, stop):
+    if len(p) < 7:
+        return None
+    f = _pack(">4f",
+              float((p[1] << 8 | p[2])),
+              float((((p[3] << 8 | p[2]) ^ 0x8000) - 0x8000)) * 0.1,
+              float((((p[5] << 8 | p[4]) ^ 0x8000) - 0x8000)) * 0.1,
+              float(p[6]))
+    r = {}
+    if start <= 0 < stop:
+        r[0] = [p[0] >> 7 & 1]
+    if start <= 1 < stop:
+        r[1] = [f[0] << 8 | f[1], f[2] << 8 | f[3]]
+    if start <= 2 < stop:
+        r[2] = [f[4] << 8 | f[5], f[6] << 8 | f[7]]
+    if start <= 4 < stop:
+        r[4] = [f[8] << 8 | f[9], f[10] << 8 | f[11]]
+    if start <= 6 < stop:
+        r[6] = [f[12] << 8 | f[13], f[14] << 8 | f[15]]
+    return r
+
+
+def _decode_0xA0(p, start, stop):
+    if len(p) < 16:
+        return None
+    f = _pack(">4f",
+              float((p[9] << 8 | p[8])),
+              float(p[10]),
+              float(p[11]),
+              float((((p[15] << 8 | p[14]) ^ 0x8000) - 0x8000)) * 0.1)
+    r = {}
+    if start <= 0 < stop:
+        r[0] = _c(119, p[0:2])
+    if start <= 2 < stop:
+        r[2] = _c(119, p[2:4])
+    if start <= 4 < stop:
+        r[4] = _c(119, p[4:6])
+    if start <= 6 < stop:
+        r[6] = _c(119, p[6:8])
+    if start <= 8 < stop:
+        r[8] = [f[0] << 8 | f[1], f[2] << 8 | f[3]]
+    if start <= 10 < stop:
+        r[10] = [f[4] << 8 | f[5], f[6] << 8 | f[7]]
+    if start <= 11 < stop:
+        r[11] = [f[8] << 8 | f[9], f[10] << 8 | f[11]]
+    if start <= 12 < stop:
+        r[12] = [p[12] & 0xFF]
+    if start <= 13 < stop:
+        r[13] = [p[13] & 0x0F]
+    if start <= 14 < stop:
+        r[14] = [f[12] << 8 | f[13], f[14] << 8 | f[15]]
+    return r
+
+
+def _decode_0xA1(p, start, stop):
+    if len(p) < 10:
+        return None
+    r = {}
+    if start <= 0 < stop:
+        r[0] = _c(119, p[0:2])
+    if start <= 2 < stop:
+        r[2] = _c(119, p[2:4])
+    if start <= 4 < stop:
+        r[4] = [p[4] & 0x07]
+    if start <= 5 < stop:
+        r[5] = _c(114, p[5:7])
+    if start <= 7 < stop:
+        r[7] = _c(114, p[7:9])
+    if start <= 9 < stop:
+        r[9] = [p[9] & 0x3F]
+    return r
+
+
+# registry_id -> decoder of a complete payload (None if it is shorter)
+DECODERS = {
+    0x00: _decode_0x00,
+    0x10: _decode_0x10,
+    0x11: _decode_0x11,
+    0x20: _decode_0x20,
+    0x21: _decode_0x21,
+    0x30: _decode_0x30,
+    0x60: _decode_0x60,
+    0x61: _decode_0x61,
+    0x62: _decode_0x62,
+    0x63: _decode_0x63,
+    0x64: _decode_0x64,
+    0x65: _decode_0x65,
+    0xA0: _decode_0xA0,
+    0xA1: _decode_0xA1,
+}
@@ -1,51 +1,96 @@
 """
 Heat pump simulator.
 
-Can be done locally using com0com driver on windows: https://sourceforge.net/projects/com0com/
+Command-line front end for the emulator library in tools/hp_emulator.py.
 
-Create a virtual COM ports pair (COM6/7 in this example).
-Connect Daikin DChecker to COM7, this script to COM6 (simulating the HP).
+Linux: serve a pseudo-terminal and point DChecker / ESPAltherma / DaikinSerial
+at the printed device:
+
+    python contrib/hp_emulator.py --pty --model "include/def/PROTOCOL_S.h"
+
+Windows: can be done locally using com0com driver: https://sourceforge.net/projects/com0com/
+Create a virtual COM ports pair (COM7/8 in this example).
+Connect Daikin DChecker to COM7, this script to COM8 (simulating the HP):
+
+    python contrib/hp_emulator.py --port COM8
+
+Without --model, the S protocol heat pump answers registries 0x50 and
+0x53-0x56 with values captured from a Rotex RDLQ014AA6V3.
 """
 
-import time
-import serial
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools"))
+
+from hp_emulator import (  # noqa: E402
+    ROTEX_S_PAYLOADS,
+    HeatPumpEmulator,
+    PtyHeatPump,
+    load_model,
+)
+
+
+class SerialPortHeatPump(HeatPumpEmulator):
+    """Emulated heat pump on a pySerial port (e.g. one end of com0com)."""
+
+    def __init__(self, port, **kwargs):
+        import serial
+
+        self.ser = serial.Serial(port, 9600, timeout=0.1,
+                                 parity=serial.PARITY_EVEN, stopbits=1)
+        super().__init__(self.ser.write, **kwargs)
+
+    def serve_forever(self):
+        while True:
+            data = self.ser.read(100)
+            if data:
+                print(f"Received: {data.hex(' ')}")
+                self._handle_command(data)
+
 
 def main():
-    ser = serial.Serial('COM8', 9600, timeout=0.1,
-                    parity=serial.PARITY_EVEN, stopbits=1)
-    while True:
-        data = ser.read(100)
-        if data:
-            print(f"Received: {data}") 
-            reply = None
-            # Reply to S protocol
-            if data == b'\x02\x53\xaa':
-                print("Match 53!")
-                reply = b"\x53\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xab"
-            elif data == b'\x02\x50\xad':
-                print("Match 50!")
-                # 6 only
-                reply = b"\x50\x01\x00\x00\x00\xae"
-            elif data == b'\x02\x54\xa9':
-                print("Match 54!")
-                reply = b"\x54\xb4\x0d\xa8\x17\xd0\x18\x24\x1d\x3c\x2c\x01\x00\x20\x00\x00\x00\x79"
-            elif data == b'\x02\x55\xa8':
-                print("Match 55!")
-                reply = b"\x55\x01\x00\x00\x00\x00\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8b"
-            elif data == b'\x02\x56\xa7':
-                print("Match 56!")
-                # 6 only
-                reply = b"\x56\x01\x00\x00\x00\xa8"
-            else:
-                print("Error reply...")
-                reply = b"\x15\xea"
-
-            if reply:
-                ser.write(reply)
-
-        else:
-            time.sleep(0.1)
+    parser = argparse.ArgumentParser(description="Daikin heat pump simulator")
+    where = parser.add_mutually_exclusive_group(required=True)
+    where.add_argument("--pty", action="store_true", help="serve a Linux pseudo-terminal")
+    where.add_argument("--port", help="serial port to serve (pySerial), e.g. COM8")
+    parser.add_argument("--model", help="model header from include/def to serve")
+    parser.add_argument("--protocol", choices=("I", "S"),
+                        help="protocol (default: from --model, else S)")
+    parser.add_argument("--strict", action="store_true",
+                        help="answer 0x15 0xEA for registries not in the model")
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--crc-error-rate", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    if args.model:
+        protocol, payloads = load_model(args.model, args.protocol)
+    else:
+        protocol = args.protocol or "S"
+        payloads = ROTEX_S_PAYLOADS if protocol == "S" else None
+
+    kwargs = dict(protocol=protocol, payloads=payloads, strict=args.strict,
+                  latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                  crc_error_rate=args.crc_error_rate, drop_rate=args.drop_rate,
+                  seed=args.seed)
+    if args.pty:
+        hp = PtyHeatPump(**kwargs)
+        print(f"Protocol {protocol} heat pump on {hp.port} (Ctrl-C to stop)")
+        hp.serve_forever()
+        print(f"{hp.requests} requests, {hp.replies} replies, "
+              f"{hp.dropped} dropped, {hp.corrupted} corrupted")
+    else:
+        hp = SerialPortHeatPump(args.port, **kwargs)
+        print(f"Protocol {protocol} heat pump on {args.port}")
+        try:
+            hp.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
 
 if __name__ == "__main__":
     main()
-
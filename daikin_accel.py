@@ -0,0 +1,211 @@
+"""MicroPython native/viper builds of the hot byte loops.
+
+The pure-Python primitives of :mod:`daikin_serial`,
+:mod:`daikin_converters` and :mod:`daikin_modbus_tcp_bridge` run in the
+bytecode interpreter on the ESP32. This module holds the same functions
+compiled with the ``@micropython.viper`` (raw pointer loops on machine
+ints) and ``@micropython.native`` (machine code, Python semantics)
+emitters. Each of those modules imports the functions from here at import
+time and keeps its own definition when that fails: on CPython (no
+``micropython`` module) and on ports built without the native emitter
+(the decorators are then a compile error).
+
+The functions must behave exactly like the pure-Python ones, which stay
+available as ``_py_<name>`` in their module; ``tools/accel_parity.py``
+checks both and times them.
+
+On CPython the decorators are no-ops and ``ptr8`` indexes the buffer
+itself, so the same source runs as plain Python: :data:`NATIVE` is then
+false and the other modules keep their pure versions, but the functions
+can still be checked against them on the host. The bridge's FC3 packing
+loop, :func:`fill_registers`, has no other copy: the bridge always calls
+it from here.
+
+Viper functions read their buffer through ``ptr8``, so they accept
+``bytes``, ``bytearray`` and ``memoryview`` but not lists of ints.
+"""
+
+try:
+    import micropython
+except ImportError:  # CPython: run the same source as plain Python
+    class micropython:  # noqa: N801 - stands in for the module
+        native = staticmethod(lambda func: func)
+        viper = staticmethod(lambda func: func)
+
+    def ptr8(buf):
+        return buf
+
+    NATIVE = False
+else:
+    NATIVE = True
+
+
+# ----------------------------------------------------------------------
+# daikin_serial
+# ----------------------------------------------------------------------
+
+@micropython.viper
+def sum_and_invert(data) -> int:
+    """Daikin "SumAndInvert" checksum: ``(~sum(data)) & 0xFF``."""
+
+    p = ptr8(data)  # noqa: F821 - viper built-in
+    n = int(len(data))
+    total = 0
+    i = 0
+    while i < n:
+        total += p[i]
+        i += 1
+    return 0xFF - (total & 0xFF)  # (~total) & 0xFF
+
+
+@micropython.viper
+def byte_sum(buf, start: int, end: int) -> int:
+    """Return ``sum(buf[start:end])`` without slicing *buf*."""
+
+    p = ptr8(buf)  # noqa: F821 - viper built-in
+    total = 0
+    i = start
+    while i < end:
+        total += p[i]
+        i += 1
+    return total
+
+
+# ----------------------------------------------------------------------
+# daikin_converters
+# ----------------------------------------------------------------------
+
+@micropython.viper
+def get_unsigned_value(data, cnvflg: int) -> int:
+    """Port of Converter::getUnsignedValue (for up to 2 bytes)."""
+
+    n = int(len(data))
+    if n == 0:
+        return 0
+    p = ptr8(data)  # noqa: F821 - viper built-in
+    if n == 1:
+        return p[0]
+    if cnvflg == 0:
+        return (p[1] << 8) | p[0]
+    return (p[0] << 8) | p[1]
+
+
+@micropython.viper
+def get_signed_value(data, cnvflg: int) -> int:
+    """Port of Converter::getSignedValue (two's-complement)."""
+
+    n = int(len(data))
+    if n == 0:
+        return 0
+    p = ptr8(data)  # noqa: F821 - viper built-in
+    if n == 1:
+        return p[0]
+    if cnvflg == 0:
+        num = (p[1] << 8) | p[0]
+    else:
+        num = (p[0] << 8) | p[1]
+    if num & 0x8000:
+        return num - 0x10000
+    return num
+
+
+@micropython.viper
+def read_u_le(data) -> int:
+    n = int(len(data))
+    if n == 0:
+        return 0
+    p = ptr8(data)  # noqa: F821 - viper built-in
+    if n >= 2:
+        return (p[1] << 8) | p[0]
+    return p[0]
+
+
+@micropython.viper
+def read_u_be(data) -> int:
+    n = int(len(data))
+    if n == 0:
+        return 0
+    p = ptr8(data)  # noqa: F821 - viper built-in
+    if n >= 2:
+        return (p[0] << 8) | p[1]
+    return p[0]
+
+
+@micropython.viper
+def read_s_le(data) -> int:
+    n = int(len(data))
+    if n == 0:
+        return 0
+    p = ptr8(data)  # noqa: F821 - viper built-in
+    if n == 1:
+        return p[0]
+    num = (p[1] << 8) | p[0]
+    if num & 0x8000:
+        return num - 0x10000
+    return num
+
+
+@micropython.viper
+def read_s_be(data) -> int:
+    n = int(len(data))
+    if n == 0:
+        return 0
+    p = ptr8(data)  # noqa: F821 - viper built-in
+    if n == 1:
+        return p[0]
+    num = (p[0] << 8) | p[1]
+    if num & 0x8000:
+        return num - 0x10000
+    return num
+
+
+@micropython.native
+def bytes_to_registers(data):
+    """Map raw bytes to 16-bit big-endian register values."""
+
+    regs = []
+    length = len(data)
+    i = 0
+    while i + 1 < length:
+        regs.append((data[i] << 8) | data[i + 1])
+        i += 2
+    if i < length:
+        regs.append(data[i] & 0xFF)
+    return regs
+
+
+# ----------------------------------------------------------------------
+# daikin_modbus_tcp_bridge
+# ----------------------------------------------------------------------
+
+@micropython.native
+def fill_registers(resp, start_addr, quantity, fields, payloads, convert_field):
+    """Pack the first register of each addressed field into an FC3 response.
+
+    *fields* maps each registry ID to its
+    :meth:`DaikinConverter.decode_registry` result, or ``None`` to convert
+    field by field with *convert_field*. Registers start at ``resp[2]``.
+    """
+
+    idx = 2
+    for i in range(quantity):
+        addr = (start_addr + i) & 0xFFFF
+        registry_id = (addr >> 8) & 0xFF
+        offset = addr & 0xFF
+        decoded = fields[registry_id]
+
+        if decoded is not None:
+            field_regs = decoded.get(offset)
+            if field_regs is None:
+                # Unknown field: expose the raw byte (if present)
+                payload = payloads[registry_id]
+                field_regs = (payload[offset],) if offset < len(payload) else None
+        else:
+            field_regs = convert_field(registry_id, offset, payloads[registry_id])
+
+        # Unknown fields and converter errors read as 0 (resp is zeroed)
+        if field_regs:
+            value = field_regs[0]
+            resp[idx] = (value >> 8) & 0xFF
+            resp[idx + 1] = value & 0xFF
+        idx += 2
@@ -0,0 +1,294 @@
+"""Retry policy and circuit breaker for the Daikin serial link.
+
+When the heat pump is powered down or the cable is pulled, every query
+waits for the full reply timeout. :class:`DaikinCircuitBreaker` wraps a
+:class:`daikin_serial.DaikinSerial` with the same query API and:
+
+* retries failed queries according to a :class:`RetryPolicy`, with separate
+  retry counts for CRC errors / garbled replies and for timeouts;
+* after ``failure_threshold`` consecutive link failures, *opens*: queries
+  raise :class:`daikin_serial.DaikinCircuitOpenError` immediately, without
+  touching the UART, for ``cooldown_ms``;
+* then goes *half-open* and lets a single probe query through (of
+  ``probe_reg`` or of the requested registry). Success closes the circuit,
+  failure opens it again with a longer cool-down (up to
+  ``max_cooldown_ms``).
+
+Any reply from the heat pump, including the ``0x15 0xEA`` error reply,
+proves the link is up and resets the failure count.
+
+Example::
+
+    daikin = DaikinCircuitBreaker(DaikinSerial(uart, protocol="I"),
+                                  failure_threshold=3, cooldown_ms=10000)
+    payload = daikin.query_registry(0x60)
+    daikin.state  # "closed", "open" or "half_open"
+
+The wrapper forwards other attributes (``protocol``, ``telemetry``, ...) to
+the wrapped driver, so it can be passed to the Modbus bridge in its place.
+"""
+
+from __future__ import annotations
+
+from daikin_serial import (
+    DaikinCircuitOpenError,
+    DaikinProtocolError,
+    DaikinSerialError,
+    DaikinTimeoutError,
+    _sleep_us,
+    _ticks_diff,
+    _ticks_ms,
+)
+
+# Circuit breaker states
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+
+class RetryPolicy:
+    """How often and how quickly to retry a failed registry query.
+
+    Parameters
+    ----------
+    crc_retries:
+        Retries after a CRC error or a reply for the wrong registry (line
+        noise; an immediate retry usually succeeds). Default: 2.
+    timeout_retries:
+        Retries after a missing or incomplete reply. Default: 0, since a
+        silent heat pump rarely answers the next frame either.
+    protocol_retries:
+        Retries after a ``0x15 0xEA`` error reply. Default: 0.
+    backoff_ms:
+        Pause before the first retry (default: 0).
+    backoff_factor:
+        Multiplier applied to the pause before each further retry
+        (default: 2).
+    max_backoff_ms:
+        Upper bound for the pause (default: 1000).
+    """
+
+    def __init__(self, crc_retries=2, timeout_retries=0, protocol_retries=0,
+                 backoff_ms=0, backoff_factor=2, max_backoff_ms=1000):
+        self.crc_retries = int(crc_retries)
+        self.timeout_retries = int(timeout_retries)
+        self.protocol_retries = int(protocol_retries)
+        self.backoff_ms = int(backoff_ms)
+        self.backoff_factor = backoff_factor
+        self.max_backoff_ms = int(max_backoff_ms)
+
+    def retries_for(self, exc):
+        """Return the number of retries allowed after exception *exc*."""
+
+        if isinstance(exc, DaikinTimeoutError):
+            return self.timeout_retries
+        if isinstance(exc, DaikinProtocolError):
+            return self.protocol_retries
+        if isinstance(exc, DaikinCircuitOpenError):
+            return 0
+        # CRC errors and registry ID mismatches
+        return self.crc_retries
+
+    def delay_ms(self, attempt):
+        """Return the pause before retry number *attempt* (1-based)."""
+
+        delay = self.backoff_ms
+        for _ in range(attempt - 1):
+            delay = int(delay * self.backoff_factor)
+            if delay >= self.max_backoff_ms:
+                return self.max_backoff_ms
+        return delay
+
+
+class DaikinCircuitBreaker:
+    """Retrying, fail-fast wrapper around a :class:`DaikinSerial` driver.
+
+    Parameters
+    ----------
+    daikin:
+        The wrapped :class:`daikin_serial.DaikinSerial` instance.
+    retry:
+        A :class:`RetryPolicy`; defaults to ``RetryPolicy()``. Pass
+        ``RetryPolicy(0, 0, 0)`` to disable retries.
+    failure_threshold:
+        Consecutive link failures (queries that still fail after their
+        retries with a timeout or CRC error) that open the circuit.
+        Default: 3.
+    cooldown_ms:
+        Time the circuit stays open before a probe is allowed
+        (default: 5000 ms).
+    max_cooldown_ms:
+        Each failed probe doubles the cool-down up to this bound
+        (default: 60000 ms).
+    probe_reg:
+        Registry queried as the half-open probe. Default ``None`` probes
+        with whatever registry the caller asked for.
+    on_state_change:
+        Optional callable ``(old_state, new_state)``, e.g. to publish the
+        link state.
+    """
+
+    def __init__(self, daikin, retry=None, failure_threshold=3,
+                 cooldown_ms=5000, max_cooldown_ms=60000, probe_reg=None,
+                 on_state_change=None):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+
+        self.daikin = daikin
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.failure_threshold = int(failure_threshold)
+        self.cooldown_ms = int(cooldown_ms)
+        self.max_cooldown_ms = int(max_cooldown_ms)
+        self.probe_reg = probe_reg
+        self.on_state_change = on_state_change
+
+        self._state = BREAKER_CLOSED
+        self._failures = 0
+        self._opened_at = 0
+        self._current_cooldown_ms = self.cooldown_ms
+
+    def __getattr__(self, name):
+        # Only called for attributes not found on the breaker itself
+        return getattr(self.daikin, name)
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    @property
+    def state(self):
+        """``"closed"``, ``"open"`` or ``"half_open"``.
+
+        An open circuit whose cool-down has elapsed reports ``"half_open"``:
+        the next query is let through as the probe.
+        """
+
+        if self._state == BREAKER_OPEN and self.retry_in_ms() == 0:
+            self._set_state(BREAKER_HALF_OPEN)
+        return self._state
+
+    @property
+    def consecutive_failures(self):
+        """Number of consecutive link failures seen so far."""
+
+        return self._failures
+
+    def retry_in_ms(self):
+        """Return the remaining cool-down in ms (0 unless the circuit is open)."""
+
+        if self._state != BREAKER_OPEN:
+            return 0
+        left = self._current_cooldown_ms - _ticks_diff(_ticks_ms(), self._opened_at)
+        return left if left > 0 else 0
+
+    def reset(self):
+        """Close the circuit and forget past failures."""
+
+        self._failures = 0
+        self._current_cooldown_ms = self.cooldown_ms
+        self._set_state(BREAKER_CLOSED)
+
+    def _set_state(self, state):
+        old = self._state
+        if old == state:
+            return
+        self._state = state
+        if self.on_state_change is not None:
+            self.on_state_change(old, state)
+
+    def _allow(self):
+        """Raise if the circuit is open; return True if the call is a probe."""
+
+        state = self.state
+        if state == BREAKER_OPEN:
+            raise DaikinCircuitOpenError(
+                "Serial link down, retry in %d ms" % self.retry_in_ms()
+            )
+        return state == BREAKER_HALF_OPEN
+
+    def _on_success(self):
+        self._failures = 0
+        if self._state != BREAKER_CLOSED:
+            self._current_cooldown_ms = self.cooldown_ms
+            self._set_state(BREAKER_CLOSED)
+
+    def _on_failure(self, exc, probe):
+        if isinstance(exc, DaikinProtocolError):
+            # The heat pump answered; the link itself is fine
+            self._on_success()
+            return
+        self._failures += 1
+        if probe:
+            # Failed probe: back off further
+            cooldown = self._current_cooldown_ms * 2
+            if cooldown > self.max_cooldown_ms:
+                cooldown = self.max_cooldown_ms
+            self._current_cooldown_ms = cooldown
+        elif self._failures < self.failure_threshold:
+            return
+        self._opened_at = _ticks_ms()
+        self._set_state(BREAKER_OPEN)
+
+    # ------------------------------------------------------------------
+    # Query API (same contract as DaikinSerial)
+    # ------------------------------------------------------------------
+
+    def query_registry(self, reg_id):
+        """Like :meth:`DaikinSerial.query_registry`, with retries.
+
+        Raises :class:`DaikinCircuitOpenError` while the circuit is open.
+        """
+
+        return bytes(self.query_registry_into(reg_id))
+
+    def query_registry_into(self, reg_id, out=None):
+        """Like :meth:`DaikinSerial.query_registry_into`, with retries.
+
+        Raises :class:`DaikinCircuitOpenError` while the circuit is open.
+        """
+
+        probe = self._allow()
+        if probe and self.probe_reg is not None and self.probe_reg != reg_id:
+            self._call(self.daikin.query_registry_into, self.probe_reg, None, True)
+            probe = False
+        return self._call(self.daikin.query_registry_into, reg_id, out, probe)
+
+    def query_registries(self, reg_ids, skip_errors=False):
+        """Like :meth:`DaikinSerial.query_registries`, with retries.
+
+        Registries are queried one by one so that each can be retried and
+        counted by the breaker. Once the circuit opens, the remaining
+        registries fail fast (raise, or are skipped with ``skip_errors``).
+        """
+
+        results = {}
+        for reg_id in reg_ids:
+            try:
+                results[reg_id] = self.query_registry(reg_id)
+            except DaikinSerialError:
+                if not skip_errors:
+                    raise
+        return results
+
+    def _call(self, query, reg_id, out, probe):
+        """Run *query* with the retry policy and update the breaker."""
+
+        retry = self.retry
+        attempt = 0
+        while True:
+            try:
+                if out is None:
+                    result = query(reg_id)
+                else:
+                    result = query(reg_id, out)
+            except DaikinSerialError as exc:
+                attempt += 1
+                if probe or attempt > retry.retries_for(exc):
+                    self._on_failure(exc, probe)
+                    raise
+                delay = retry.delay_ms(attempt)
+                if delay > 0:
+                    _sleep_us(delay * 1000)
+                continue
+            self._on_success()
+            return result
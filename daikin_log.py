@@ -0,0 +1,148 @@
+"""Log levels and a raw frame ring buffer for the Daikin drivers.
+
+Log calls in the serial drivers and the Modbus bridge are guarded by a
+level check *before* the message is formatted, so disabled levels cost one
+integer comparison and no allocation::
+
+    if self.log_level <= LOG_DEBUG:
+        self._log("Querying register 0x%02X..." % reg_id)
+
+Levels follow the numbering of CPython's ``logging`` module. ``LOG_OFF``
+disables all output (what ``logger=False`` selects).
+
+:class:`FrameRing` is a debugging aid for production: instead of hex
+formatting every reply, the driver copies the raw frames into a fixed
+preallocated ring buffer, which can be dumped after a failure::
+
+    daikin = DaikinSerial(uart, log_level=LOG_WARNING, frame_log=16)
+    ...
+    daikin.frame_log.dump(print)
+
+"""
+
+from __future__ import annotations
+
+try:
+    from uarray import array  # MicroPython
+except ImportError:  # CPython fallback for testing
+    from array import array
+
+from daikin_telemetry import COUNTER_NAMES
+
+LOG_DEBUG = 10
+LOG_INFO = 20
+LOG_WARNING = 30
+LOG_ERROR = 40
+LOG_OFF = 100
+
+
+def resolve_logger(logger, log_level):
+    """Return ``(log_fn, log_level)`` for the ``logger`` argument convention.
+
+    ``None`` logs with ``print``, ``False`` disables logging (the level is
+    raised to ``LOG_OFF`` so no message is formatted), anything else is
+    used as the log callable.
+    """
+
+    if logger is None:
+        return print, log_level
+    if logger is False:
+        return (lambda *args, **kwargs: None), LOG_OFF
+    return logger, log_level
+
+
+def format_buffer(buf):
+    """Return a hex-formatted string similar to logBuffer in C++."""
+
+    return " ".join("0x%02X" % b for b in buf)
+
+
+class FrameRing:
+    """Fixed-size ring buffer of the most recent raw reply frames.
+
+    Parameters
+    ----------
+    slots:
+        Number of frames kept; older frames are overwritten.
+    slot_len:
+        Bytes stored per frame; longer frames are truncated (their full
+        length is still recorded).
+    """
+
+    def __init__(self, slots=16, slot_len=64):
+        if slots <= 0 or slot_len <= 0:
+            raise ValueError("slots and slot_len must be positive")
+        self.slots = int(slots)
+        self.slot_len = int(slot_len)
+        self._buf = bytearray(self.slots * self.slot_len)
+        self._mv = memoryview(self._buf)
+        # Per slot: ticks_ms, reg_id, outcome, frame length
+        self._meta = array("l", [0] * (4 * self.slots))
+        self._next = 0
+        self._count = 0
+
+    def record(self, ticks_ms, reg_id, outcome, frame):
+        """Store *frame* (any buffer) with its registry ID and outcome.
+
+        *outcome* is a ``daikin_telemetry`` counter index (``OK``,
+        ``TIMEOUTS``, ...).
+        """
+
+        slot = self._next
+        n = len(frame)
+        stored = n if n < self.slot_len else self.slot_len
+        off = slot * self.slot_len
+        self._mv[off:off + stored] = frame[:stored]
+        meta = self._meta
+        base = slot * 4
+        meta[base] = ticks_ms & 0x3FFFFFFF
+        meta[base + 1] = reg_id
+        meta[base + 2] = outcome
+        meta[base + 3] = n
+        slot += 1
+        self._next = 0 if slot == self.slots else slot
+        if self._count < self.slots:
+            self._count += 1
+
+    def __len__(self):
+        return self._count
+
+    def clear(self):
+        """Forget all stored frames."""
+
+        self._next = 0
+        self._count = 0
+
+    def frames(self):
+        """Return the stored frames, oldest first.
+
+        Each entry is ``(ticks_ms, reg_id, outcome, length, data)`` where
+        *data* is a ``bytes`` copy of (at most ``slot_len`` bytes of) the
+        frame and *length* its full length.
+        """
+
+        result = []
+        first = (self._next - self._count) % self.slots
+        for i in range(self._count):
+            slot = (first + i) % self.slots
+            base = slot * 4
+            meta = self._meta
+            n = meta[base + 3]
+            stored = n if n < self.slot_len else self.slot_len
+            off = slot * self.slot_len
+            result.append((
+                meta[base], meta[base + 1], meta[base + 2], n,
+                bytes(self._buf[off:off + stored]),
+            ))
+        return result
+
+    def dump(self, log=print):
+        """Write the stored frames as hex lines to *log*, oldest first."""
+
+        for ticks, reg_id, outcome, n, data in self.frames():
+            if 0 <= outcome < len(COUNTER_NAMES):
+                outcome = COUNTER_NAMES[outcome]
+            log(
+                "[%d] reg 0x%02X %s (%d bytes): %s"
+                % (ticks, reg_id, outcome, n, format_buffer(data))
+            )
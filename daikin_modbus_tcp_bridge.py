@@ -44,10 +44,16 @@ Example usage on ESP32 / MicroPython::
     # Configure Daikin protocol once for this heat pump ("I" or "S")
     daikin = DaikinSerial(uart, protocol="I")
 
-    # Load model-specific label definitions
-    converter = DaikinConverter.from_json_file(
-        "altherma_ebla_edla_d_9_16_monobloc.json"
+    # Load model-specific label definitions (without label strings, which
+    # the bridge does not use)
+    converter = DaikinConverter.from_model_file(
+        "altherma_ebla_edla_d_9_16_monobloc.dkm"
     )
+    # or from the model JSON (see tools/compile_model.py for the .dkm):
+    # converter = DaikinConverter.from_json_file(
+    #     "altherma_ebla_edla_d_9_16_monobloc.json")
+    # Integer registers (value * 10 ** decimals, see field_format) instead
+    # of float32, one register for most fields: pass output=OUTPUT_FIXED
 
     # Start Modbus TCP bridge on all interfaces, port 502, unit ID 1
     bridge = DaikinModbusTCPBridge(
@@ -68,7 +74,10 @@ try:
 except ImportError:  # pragma: no cover - CPython fallback for local testing
     import socket  # type: ignore[assignment]
 
-from daikin_serial import DaikinSerial, DaikinSerialError
+# FC3 response packing: a native build on MicroPython, plain Python elsewhere
+from daikin_accel import fill_registers as _fill_registers
+from daikin_log import LOG_DEBUG, LOG_ERROR, LOG_INFO, LOG_WARNING, resolve_logger
+from daikin_serial import DaikinCircuitOpenError, DaikinSerial, DaikinSerialError
 from daikin_converters import DaikinConverter
 
 
@@ -83,7 +92,10 @@ class DaikinModbusTCPBridge:
     ----------
     daikin:
         An initialized :class:`DaikinSerial` instance, configured with the
-        correct UART and protocol ("I" or "S").
+        correct UART and protocol ("I" or "S"), or a
+        :class:`daikin_breaker.DaikinCircuitBreaker` wrapping one. While the
+        breaker is open, reads are answered immediately with Modbus
+        exception 0x0B (gateway target device failed to respond).
     unit_id:
         Modbus unit identifier (slave ID). Most masters use 1 by default.
     host:
@@ -97,6 +109,11 @@ class DaikinModbusTCPBridge:
     logger:
         Optional callable taking a single string for debug logging.
         Defaults to ``print``. Pass ``False`` to disable logging.
+    log_level:
+        Minimum level of messages passed to ``logger`` (see ``daikin_log``;
+        default ``LOG_DEBUG``). Per-connection messages are ``LOG_DEBUG``,
+        Daikin read errors ``LOG_WARNING``; messages below the level are not
+        formatted.
 
     Limitations
     -----------
@@ -111,19 +128,14 @@ class DaikinModbusTCPBridge:
 
     def __init__(self, daikin: DaikinSerial, converter: DaikinConverter,
                  unit_id: int = 1, host: str = "0.0.0.0", port: int = 502,
-                 logger=None) -> None:
+                 logger=None, log_level: int = LOG_DEBUG) -> None:
         self.daikin = daikin
         self.converter = converter
         self.unit_id = int(unit_id) & 0xFF
         self.host = host
         self.port = int(port)
 
-        if logger is None:
-            self._log = print
-        elif logger is False:
-            self._log = lambda *args, **kwargs: None
-        else:
-            self._log = logger
+        self._log, self.log_level = resolve_logger(logger, log_level)
 
     # ------------------------------------------------------------------
     # Public API
@@ -142,24 +154,28 @@ class DaikinModbusTCPBridge:
 
             s.bind((self.host, self.port))
             s.listen(1)
-            self._log(
-                "Daikin Modbus TCP bridge listening on %s:%d (unit_id=%d)"
-                % (self.host, self.port, self.unit_id)
-            )
+            if self.log_level <= LOG_INFO:
+                self._log(
+                    "Daikin Modbus TCP bridge listening on %s:%d (unit_id=%d)"
+                    % (self.host, self.port, self.unit_id)
+                )
 
             while True:
                 conn, addr = s.accept()
-                self._log("Accepted connection from %s:%d" % addr)
+                if self.log_level <= LOG_DEBUG:
+                    self._log("Accepted connection from %s:%d" % addr)
                 try:
                     self._handle_client(conn)
                 except Exception as exc:  # pragma: no cover - defensive
-                    self._log("Client handler error: %r" % exc)
+                    if self.log_level <= LOG_ERROR:
+                        self._log("Client handler error: %r" % exc)
                 finally:
                     try:
                         conn.close()
                     except Exception:
                         pass
-                    self._log("Connection closed from %s:%d" % addr)
+                    if self.log_level <= LOG_DEBUG:
+                        self._log("Connection closed from %s:%d" % addr)
         finally:  # pragma: no cover - best-effort cleanup
             try:
                 s.close()
@@ -230,7 +246,8 @@ class DaikinModbusTCPBridge:
             try:
                 conn.send(resp_mbap + resp_pdu)
             except Exception as exc:
-                self._log("Send error: %r" % exc)
+                if self.log_level <= LOG_WARNING:
+                    self._log("Send error: %r" % exc)
                 break
 
     def _handle_read_holding_registers(self, pdu: bytes) -> bytes:
@@ -254,11 +271,15 @@ class DaikinModbusTCPBridge:
           ``(registry_id << 8) | offset`` value.
         - For all addresses in the requested range we group by ``registry_id``,
           read each referenced Daikin registry once via
-          :meth:`DaikinSerial.query_registry`, and then call
-          :meth:`DaikinConverter.convert_field` with ``(registry_id, offset, payload)``.
-        - The first 16-bit register returned by the converter for each
-          ``(registry_id, offset)`` is used as the Modbus holding register
-          value; if the field is unknown or out of range, 0 is returned.
+          :meth:`DaikinSerial.query_registry_into`, and then decode the
+          requested offsets of each payload in one pass with
+          :meth:`DaikinConverter.decode_registry`.
+        - The first 16-bit register of each decoded field is used as the
+          Modbus holding register value. Offsets without a field definition
+          expose the raw payload byte; offsets past the payload read as 0.
+        - An offset shared by several fields serves the last one declared,
+          except that an offset shared by several bit flags (300-307) serves
+          the flag byte, masked to the declared bits, in one register.
         """
 
         if len(pdu) < 5:
@@ -272,72 +293,91 @@ class DaikinModbusTCPBridge:
             # Modbus spec limit for FC3
             return bytes([0x83, 0x03])  # ILLEGAL DATA VALUE
 
-        # Packed (registry_id << 8) | offset addressing using DaikinConverter
-        regs = []  # type: list[int]
-        payload_cache = {}  # type: dict[int, bytes]
-        for i in range(quantity):
-            addr = (start_addr + i) & 0xFFFF
-            registry_id = (addr >> 8) & 0xFF
-            offset = addr & 0xFF
-
-            if registry_id not in payload_cache:
-                try:
-                    payload_cache[registry_id] = self._read_daikin_payload(registry_id)
-                except DaikinSerialError as exc:
-                    self._log("Daikin error on reg 0x%02X: %r" % (registry_id, exc))
-                    # Map to Modbus ILLEGAL DATA ADDRESS
-                    return bytes([0x83, 0x02])
-                except Exception as exc:  # pragma: no cover - defensive
-                    self._log("Unexpected error on reg 0x%02X: %r" % (registry_id, exc))
-                    return bytes([0x83, 0x04])  # SLAVE DEVICE FAILURE
-
-            payload = payload_cache[registry_id]
+        # Packed (registry_id << 8) | offset addressing using DaikinConverter.
+        # A request spans at most 125 consecutive addresses, i.e. one or two
+        # registries. Each is read without copying (memoryview into the
+        # driver's receive buffer); the first of two is copied before the
+        # second query reuses that buffer.
+        last_addr = (start_addr + quantity - 1) & 0xFFFF
+        reg_ids = [(start_addr >> 8) & 0xFF]
+        if (last_addr >> 8) != reg_ids[0]:
+            reg_ids.append((last_addr >> 8) & 0xFF)
 
+        try:
+            payloads = {}
+            for reg_id in reg_ids:
+                if payloads:
+                    payloads[reg_ids[0]] = bytes(payloads[reg_ids[0]])
+                payloads[reg_id] = self._read_daikin_payload(reg_id)
+        except DaikinCircuitOpenError:
+            # Link known to be down (daikin_breaker): fail fast with
+            # GATEWAY TARGET DEVICE FAILED TO RESPOND
+            if self.log_level <= LOG_DEBUG:
+                self._log("Daikin link down, regs %r not read" % (reg_ids,))
+            return bytes([0x83, 0x0B])
+        except DaikinSerialError as exc:
+            if self.log_level <= LOG_WARNING:
+                self._log("Daikin error on regs %r: %r" % (reg_ids, exc))
+            # Map to Modbus ILLEGAL DATA ADDRESS
+            return bytes([0x83, 0x02])
+        except Exception as exc:  # pragma: no cover - defensive
+            if self.log_level <= LOG_ERROR:
+                self._log("Unexpected error on regs %r: %r" % (reg_ids, exc))
+            return bytes([0x83, 0x04])  # SLAVE DEVICE FAILURE
+
+        # Decode the requested part of each registry with the compiled
+        # field plans (one pass per registry)
+        fields = {}
+        for reg_id in reg_ids:
+            start = start_addr & 0xFF if reg_id == reg_ids[0] else 0
+            stop = (last_addr & 0xFF) + 1 if reg_id == reg_ids[-1] else 256
             try:
-                field_regs = self.converter.convert_field(  # type: ignore[attr-defined]
-                    registry_id, offset, payload
+                fields[reg_id] = self.converter.decode_registry(
+                    reg_id, payloads[reg_id], start, stop
                 )
             except Exception as exc:  # pragma: no cover - defensive
-                self._log(
-                    "Converter error for reg 0x%02X offset 0x%02X: %r"
-                    % (registry_id, offset, exc)
-                )
-                regs.append(0)
-                continue
+                if self.log_level <= LOG_ERROR:
+                    self._log("Converter error for reg 0x%02X: %r" % (reg_id, exc))
+                # Fall back to field-by-field conversion below
+                fields[reg_id] = None
 
-            if not field_regs:
-                regs.append(0)
-            else:
-                regs.append(int(field_regs[0]) & 0xFFFF)
-
-        # Build response PDU
-        byte_count = len(regs) * 2
+        byte_count = quantity * 2
         resp = bytearray(2 + byte_count)
         resp[0] = 0x03
         resp[1] = byte_count
-
-        idx = 2
-        for value in regs:
-            resp[idx] = (value >> 8) & 0xFF
-            resp[idx + 1] = value & 0xFF
-            idx += 2
-
+        _fill_registers(resp, start_addr, quantity, fields, payloads,
+                        self._convert_field)
         return bytes(resp)
 
     # ------------------------------------------------------------------
     # Daikin mapping helpers
     # ------------------------------------------------------------------
 
-    def _read_daikin_payload(self, reg_id: int) -> bytes:
-        """Query Daikin registry and return its payload bytes.
+    def _convert_field(self, registry_id: int, offset: int, payload):
+        """Convert a single field; ``None`` (read as 0) on converter errors."""
+
+        try:
+            return self.converter.convert_field(registry_id, offset, payload)
+        except Exception as exc:  # pragma: no cover - defensive
+            if self.log_level <= LOG_ERROR:
+                self._log(
+                    "Converter error for reg 0x%02X offset 0x%02X: %r"
+                    % (registry_id, offset, exc)
+                )
+            return None
+
+    def _read_daikin_payload(self, reg_id: int) -> memoryview:
+        """Query Daikin registry and return its payload.
 
-        This delegates to :meth:`DaikinSerial.query_registry`, which returns
-        protocol-independent payload bytes (header and CRC already stripped).
+        This delegates to :meth:`DaikinSerial.query_registry_into`, which
+        returns protocol-independent payload bytes (header and CRC already
+        stripped) as a memoryview into the driver's receive buffer; no copy
+        is made.
         """
 
-        payload = self.daikin.query_registry(reg_id)
+        payload = self.daikin.query_registry_into(reg_id)
 
         if payload is None:
             raise DaikinSerialError("No payload returned for reg 0x%02X" % reg_id)
 
-        return bytes(payload)
+        return payload
@@ -0,0 +1,198 @@
+"""Protocol auto-detection and startup probe for Daikin heat pumps.
+
+:class:`daikin_serial.DaikinSerial` must be told whether the heat pump
+speaks the I or the S protocol. With the wrong one, every registry query
+times out. :func:`probe` works the protocol out with a few frames, chosen
+so that the first valid reply is conclusive:
+
+1. I ``0x60`` (defined for every I model in ``include/def``),
+2. S ``0x53`` (defined for both S models in ``include/def``),
+3. I ``0x10`` and S ``0x50`` (shortest S reply) as second chances.
+
+A ``0x15 0xEA`` reply only proves that something is listening, so probing
+continues. Once the protocol is known, the optional candidate
+``registries`` (e.g. those of the model JSON) are queried to find the set
+the heat pump actually answers. Everything stays within ``budget_ms``.
+
+:func:`detect` adds a JSON cache in flash, so only the first boot probes::
+
+    from daikin_probe import detect
+
+    daikin, info = detect(uart, cache_path="daikin_probe.json",
+                          registries=converter.registry_ids())
+    # info == {"protocol": "I", "registries": [...], "complete": True, ...}
+
+"""
+
+from __future__ import annotations
+
+try:
+    import ujson as _json  # MicroPython
+except ImportError:  # CPython fallback for testing
+    import json as _json
+
+from daikin_serial import (
+    DaikinProtocolError,
+    DaikinSerial,
+    DaikinSerialError,
+    _ticks_diff,
+    _ticks_ms,
+)
+
+# Probe frames in order: (protocol, registry)
+PROBE_FRAMES = (("I", 0x60), ("S", 0x53), ("I", 0x10), ("S", 0x50))
+
+DEFAULT_CACHE_PATH = "daikin_probe.json"
+
+
+def probe(uart, budget_ms=1500, registries=None, frame_timeout_ms=150,
+          baudrate=9600, logger=False):
+    """Detect the protocol (and optionally the responsive registries).
+
+    Parameters
+    ----------
+    uart:
+        UART connected to the heat pump (see :class:`DaikinSerial`).
+    budget_ms:
+        Upper bound for the whole probe. Frames that cannot finish within
+        the remaining budget get a shorter timeout or are not sent.
+    registries:
+        Optional candidate registry IDs to check once the protocol is known.
+    frame_timeout_ms:
+        Reply timeout per probe frame (default: 150 ms, half the driver
+        default; replies start well within it).
+    baudrate, logger:
+        Passed to the :class:`DaikinSerial` instances used for probing.
+
+    Returns
+    -------
+    dict
+        ``{"protocol": "I" | "S", "registries": [...] | None,
+        "complete": bool, "elapsed_ms": int}``. ``registries`` lists the
+        candidates that returned a valid reply, ``complete`` is false if the
+        budget ran out before all candidates were checked.
+
+    Raises
+    ------
+    DaikinSerialError
+        If no probe frame got a valid reply within the budget.
+    """
+
+    start = _ticks_ms()
+    drivers = {}
+
+    def driver(protocol):
+        d = drivers.get(protocol)
+        if d is None:
+            d = DaikinSerial(uart, protocol=protocol, timeout_ms=frame_timeout_ms,
+                             logger=logger, baudrate=baudrate, telemetry=False)
+            drivers[protocol] = d
+        return d
+
+    def query(d, reg_id):
+        """Query within the remaining budget; ``None`` if out of time."""
+
+        left = budget_ms - _ticks_diff(_ticks_ms(), start)
+        if left <= 0:
+            return None
+        d.timeout_ms = frame_timeout_ms if frame_timeout_ms < left else left
+        return d.query_registry_into(reg_id)
+
+    protocol = None
+    alive = False
+    for candidate, reg_id in PROBE_FRAMES:
+        d = driver(candidate)
+        try:
+            if query(d, reg_id) is None:
+                break
+        except DaikinProtocolError:
+            alive = True
+            continue
+        except DaikinSerialError:
+            continue
+        protocol = candidate
+        break
+
+    if protocol is None:
+        raise DaikinSerialError(
+            "Protocol probe failed: %s within %d ms"
+            % ("no valid reply" if alive else "no reply", budget_ms)
+        )
+
+    found = None
+    complete = True
+    if registries is not None:
+        d = driver(protocol)
+        found = []
+        for reg_id in registries:
+            try:
+                if query(d, reg_id) is None:
+                    complete = False
+                    break
+            except DaikinSerialError:
+                continue
+            found.append(reg_id)
+
+    return {
+        "protocol": protocol,
+        "registries": found,
+        "complete": complete,
+        "elapsed_ms": _ticks_diff(_ticks_ms(), start),
+    }
+
+
+def load_probe_cache(path=DEFAULT_CACHE_PATH):
+    """Return the probe result stored by :func:`save_probe_cache`, or ``None``."""
+
+    try:
+        with open(path, "r") as f:
+            data = _json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("protocol") not in ("I", "S"):
+        return None
+    return data
+
+
+def save_probe_cache(result, path=DEFAULT_CACHE_PATH):
+    """Store the protocol and registry set of a :func:`probe` result."""
+
+    data = {"protocol": result["protocol"], "registries": result.get("registries")}
+    with open(path, "w") as f:
+        _json.dump(data, f)
+
+
+def detect(uart, cache_path=DEFAULT_CACHE_PATH, budget_ms=1500,
+           registries=None, refresh=False, **kwargs):
+    """Return ``(DaikinSerial, info)`` configured for the connected heat pump.
+
+    Uses the cached probe result in *cache_path* if present (unless
+    *refresh*); otherwise runs :func:`probe` and caches its result. A
+    probe whose registry check ran out of budget is used but not cached,
+    so the next boot tries again. Extra keyword arguments are passed to
+    :class:`DaikinSerial`.
+
+    *info* is the probe result, with ``"cached": True`` when read from the
+    cache.
+    """
+
+    info = None if refresh or not cache_path else load_probe_cache(cache_path)
+    if info is not None:
+        info.setdefault("registries", None)
+        info["complete"] = True
+        info["cached"] = True
+    else:
+        info = probe(
+            uart, budget_ms=budget_ms, registries=registries,
+            baudrate=kwargs.get("baudrate", 9600),
+            logger=kwargs.get("logger", False),
+        )
+        info["cached"] = False
+        if cache_path and info["complete"]:
+            try:
+                save_probe_cache(info, cache_path)
+            except OSError:
+                pass
+
+    kwargs["protocol"] = info["protocol"]
+    return DaikinSerial(uart, **kwargs), info
@@ -10,13 +10,18 @@ connected to the Daikin Altherma heat pump service port.
 The driver focuses on:
 
 * Building request frames for I and S protocols
-* Reading replies with timeout
+* Reading replies with timeout, in chunks of whatever the UART has buffered
 * Handling dynamic reply length for I protocol
 * Detecting common error replies (0x15 0xEA)
 * Verifying the Sum-and-Invert CRC
+* Receiving into preallocated buffers (``query_registry_into``), so the
+  poll path does not churn the heap
 * Normalising replies so that callers always get protocol-independent
   registry payload bytes
 
+Frame reception is handled by :class:`DaikinFrameParser`, a streaming state
+machine which can also be used on its own, e.g. to decode captured logs.
+
 Example (ESP32 / MicroPython):
 
     from machine import UART, Pin
@@ -42,6 +47,38 @@ try:
 except ImportError:  # CPython fallback for testing
     import time as _time
 
+try:
+    import ujson as _json  # MicroPython
+except ImportError:  # CPython fallback for testing
+    import json as _json
+
+try:
+    import uselect as _select  # MicroPython
+except ImportError:  # CPython fallback for testing
+    try:
+        import select as _select
+    except ImportError:  # pragma: no cover - port without select
+        _select = None
+
+from daikin_log import (
+    LOG_DEBUG,
+    LOG_ERROR,
+    LOG_INFO,
+    LOG_WARNING,
+    FrameRing,
+    format_buffer,
+    resolve_logger,
+)
+from daikin_telemetry import (
+    CRC_ERRORS,
+    ID_MISMATCHES,
+    OK,
+    OTHER_ERRORS,
+    PROTOCOL_ERRORS,
+    TIMEOUTS,
+    DaikinTelemetry,
+)
+
 
 class DaikinSerialError(Exception):
     """Base exception for Daikin serial driver errors."""
@@ -59,6 +96,11 @@ class DaikinProtocolError(DaikinSerialError):
     """Raised for protocol-level errors returned by the heat pump."""
 
 
+class DaikinCircuitOpenError(DaikinSerialError):
+    """Raised without touching the serial line while the link is considered
+    down (see :class:`daikin_breaker.DaikinCircuitBreaker`)."""
+
+
 def _ticks_ms():
     """Return milliseconds since boot (MicroPython-compatible)."""
 
@@ -77,6 +119,24 @@ def _ticks_diff(later, earlier):
     return later - earlier
 
 
+def _sleep_us(us):
+    """Sleep for *us* microseconds (MicroPython-compatible)."""
+
+    if hasattr(_time, "sleep_us"):
+        _time.sleep_us(us)  # type: ignore[attr-defined]
+    else:
+        _time.sleep(us / 1000000.0)
+
+
+# Receive wait strategies (see DaikinSerial ``wait`` parameter)
+WAIT_SLEEP = "sleep"
+WAIT_BLOCK = "block"
+WAIT_POLL = "poll"
+
+# Bits on the wire per byte: start + 8 data + even parity + stop
+_BITS_PER_BYTE = 11
+
+
 def sum_and_invert(data):
     """Compute Daikin "SumAndInvert" checksum (same as getCRC in comm.h).
 
@@ -89,194 +149,649 @@ def sum_and_invert(data):
     return (~total) & 0xFF
 
 
-class DaikinSerial:
-    """Low-level Daikin Altherma serial protocol driver.
+def _byte_sum(buf, start, end):
+    """Return ``sum(buf[start:end])`` (*buf*: memoryview)."""
+
+    return sum(buf[start:end])
+
+
+# MicroPython: viper builds of the byte loops (see daikin_accel); the pure
+# versions stay available for tools/accel_parity.py
+_py_sum_and_invert = sum_and_invert
+_py_byte_sum = _byte_sum
+try:
+    import daikin_accel as _accel
+except (ImportError, SyntaxError, ValueError):  # no native emitter
+    _accel = None
+if _accel is not None and _accel.NATIVE:
+    _byte_sum = _accel.byte_sum
+    sum_and_invert = _accel.sum_and_invert
+
+
+# Largest frame the parser will accept: the I-protocol length byte is at
+# most 0xFF and the total frame size is ``length + 2``.
+MAX_FRAME_LEN = 0xFF + 2
+
+# Parser states
+STATE_RECEIVING = 0
+STATE_COMPLETE = 1
+STATE_ERROR = 2
+STATE_OVERFLOW = 3
+
+
+class DaikinFrameParser:
+    """Incremental parser for Daikin I/S reply frames.
+
+    The parser is a small state machine that can be fed with chunks of any
+    size (a single byte, whatever ``uart.any()`` reports, or a whole captured
+    log line). It keeps track of:
+
+    * the expected frame length, updated from the I-protocol length byte
+      (index 2) as soon as it arrives,
+    * the ``0x15 0xEA`` error prefix returned by the heat pump,
+    * a running Sum-and-Invert CRC, so the checksum is known as soon as the
+      last byte of the frame has been received.
+
+    Received bytes are stored in a preallocated buffer; no allocation takes
+    place while feeding. The parser is independent of :class:`DaikinSerial`
+    and can be used on its own, e.g. to decode captured serial traffic.
 
     Parameters
     ----------
-    uart:
-        A configured UART-like object with ``read``, ``write`` and ``any``
-        methods (e.g. ``machine.UART`` on MicroPython).
     protocol:
-        Either ``"I"`` (default) or ``"S"``. The heat pump supports only
-        one of these; configure it here once.
-    timeout_ms:
-        Maximum time to wait for a complete reply (default: 300 ms,
-        matching ``SER_TIMEOUT`` in the C++ code).
-    logger:
-        Optional callable taking a single string for debug logging.
-        Defaults to ``print``. Pass ``False`` to disable logging.
+        Either ``"I"`` (default) or ``"S"``.
+    max_len:
+        Size of the receive buffer (default: :data:`MAX_FRAME_LEN`).
     """
 
-    def __init__(self, uart, protocol="I", timeout_ms=300, logger=None):
+    def __init__(self, protocol="I", max_len=MAX_FRAME_LEN):
         protocol = (protocol or "I").upper()
         if protocol not in ("I", "S"):
             raise ValueError("protocol must be 'I' or 'S'")
 
-        self.uart = uart
         self.protocol = protocol
-        self.timeout_ms = int(timeout_ms)
+        self._own_buf = bytearray(max_len)
+        self._own_mv = memoryview(self._own_buf)
+        self.reset()
+
+    def reset(self, expected_len=None, buf=None, trusted=False):
+        """Prepare for a new frame.
+
+        ``expected_len`` is the initial length guess. For the I protocol it
+        is replaced by the real length once the length byte is received; for
+        the S protocol it is the (fixed) frame length of the registry.
+
+        ``buf`` optionally selects a caller-supplied writable buffer to
+        receive this frame into, instead of the parser's own buffer.
 
-        if logger is None:
-            self._log = print
-        elif logger is False:
-            # Small convenience: logger=False disables logging entirely
-            self._log = lambda *args, **kwargs: None
+        ``trusted`` marks ``expected_len`` as the known length of the frame
+        (e.g. learned from earlier replies), so :attr:`needed` asks for the
+        whole frame at once instead of the header first. The length byte is
+        still checked when it arrives.
+        """
+
+        if buf is None:
+            self._buf = self._own_buf
+            self._mv = self._own_mv
         else:
-            self._log = logger
+            self._buf = buf
+            self._mv = memoryview(buf)
+
+        if expected_len is None:
+            expected_len = 12 if self.protocol == "I" else 18
+        self.expected_len = min(int(expected_len), len(self._buf))
+        self.length = 0
+        self.state = STATE_RECEIVING
+        self._sum = 0
+        self.trusted = trusted
+        # For the S protocol there is no length byte to wait for
+        self._len_known = self.protocol != "I"
 
     # ------------------------------------------------------------------
-    # Public API
+    # Feeding
     # ------------------------------------------------------------------
 
-    def query_registry(self, reg_id):
-        """Query a single registry and return its *payload bytes*.
+    @property
+    def remaining(self):
+        """Number of bytes still missing to complete the current frame."""
 
-        This wraps the low-level I/S protocols and always returns only the
-        registry payload, independent of the protocol variant used by the
-        heat pump.
+        return self.expected_len - self.length
 
-        For both protocol I and S, the returned value is the sequence of bytes
-        that represent the registry content, with the protocol-specific
-        header and trailing CRC removed.
+    @property
+    def needed(self):
+        """Number of bytes to read before the parser can take its next decision.
 
-        Parameters
-        ----------
-        reg_id:
-            Registry identifier (0-255).
+        This is the whole rest of the frame once its length is known, and the
+        missing header bytes before that. Useful for blocking reads, which
+        must not ask for more bytes than the frame may contain.
+        """
 
-        Returns
-        -------
-        bytes
-            Registry payload bytes, without header/CRC, same layout for
-            both protocol I and S.
+        if not self._len_known and not self.trusted:
+            return 3 - self.length
+        return self.expected_len - self.length
 
-        Raises
-        ------
-        DaikinTimeoutError
-            If no or incomplete reply is received within the timeout.
-        DaikinProtocolError
-            If the heat pump returns an explicit error frame (0x15 0xEA).
-        DaikinCRCError
-            If the CRC of the reply is invalid.
-        DaikinSerialError
-            If the decoded registry ID in the response does not match the
-            requested one.
+    @property
+    def length_known(self):
+        """True once the total frame length is known (S, or I length byte seen)."""
+
+        return self._len_known
+
+    @property
+    def done(self):
+        """True once the frame is complete or an error frame was detected."""
+
+        return self.state != STATE_RECEIVING
+
+    def feed(self, data):
+        """Feed received bytes into the parser.
+
+        Returns the number of bytes consumed from *data*. Bytes following the
+        end of the current frame are not consumed, so callers parsing a
+        stream can pass the remainder to the next frame after :meth:`reset`.
+        """
+
+        n = len(data)
+        free = len(self._buf) - self.length
+        if n > free:
+            n = free
+        pos = self.length
+        self._buf[pos:pos + n] = memoryview(data)[:n]
+        return self.commit(n)
+
+    def window(self, n):
+        """Return a writable memoryview for the next *n* bytes of the frame.
+
+        Used for zero-copy reception: ``uart.readinto(parser.window(n))``
+        followed by :meth:`commit` with the number of bytes actually read.
+        """
+
+        pos = self.length
+        end = pos + n
+        if end > len(self._buf):
+            end = len(self._buf)
+        return self._mv[pos:end]
+
+    def commit(self, n):
+        """Process *n* bytes already written after the current frame data.
+
+        Returns the number of bytes that belong to the current frame.
         """
 
-        cmd = self._build_command(reg_id)
-        self._log("Querying register 0x%02X..." % reg_id)
+        buf = self._buf
+        mv = self._mv
+        used = 0
+
+        while used < n and self.state == STATE_RECEIVING:
+            pos = self.length
+            # Stop at the next point where a decision has to be taken:
+            # after the 2-byte error prefix, after the I length byte, or at
+            # the end of the frame.
+            if pos < 2:
+                stop = 2
+            elif not self._len_known:
+                stop = 3
+            else:
+                stop = self.expected_len
+            take = stop - pos
+            if take > n - used:
+                take = n - used
+
+            self._sum = (self._sum + _byte_sum(mv, pos, pos + take)) & 0xFF
+            used += take
+            pos += take
+            self.length = pos
+
+            if pos == 2 and buf[0] == 0x15 and buf[1] == 0xEA:
+                self.state = STATE_ERROR
+                break
+
+            if pos == 3 and not self._len_known:
+                # Length field is at index 2 and does not include
+                # the initial 3 bytes (see Daikin I protocol doc).
+                self._len_known = True
+                total = buf[2] + 2
+                if total > len(buf):
+                    # Frame does not fit the receive buffer
+                    self.expected_len = total
+                    self.state = STATE_OVERFLOW
+                    break
+                self.expected_len = total
+
+            if pos >= self.expected_len and self._len_known:
+                self.state = STATE_COMPLETE
+
+        return used
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    @property
+    def is_error(self):
+        """True if the heat pump replied with the ``0x15 0xEA`` error frame."""
+
+        return self.state == STATE_ERROR
+
+    @property
+    def is_overflow(self):
+        """True if the announced frame length exceeds the receive buffer."""
+
+        return self.state == STATE_OVERFLOW
+
+    @property
+    def calculated_crc(self):
+        """Sum-and-Invert CRC over all received bytes except the last one."""
+
+        if self.length == 0:
+            return 0xFF
+        last = self._buf[self.length - 1]
+        return (~((self._sum - last) & 0xFF)) & 0xFF
+
+    @property
+    def received_crc(self):
+        """CRC byte as received (last byte of the frame)."""
+
+        if self.length == 0:
+            return None
+        return self._buf[self.length - 1]
+
+    @property
+    def crc_ok(self):
+        """True if the frame is complete and its CRC is valid."""
+
+        return (
+            self.state == STATE_COMPLETE
+            and self.calculated_crc == self._buf[self.length - 1]
+        )
+
+    @property
+    def registry_id(self):
+        """Registry ID echoed in the frame header (``None`` if not yet known)."""
+
+        index = 1 if self.protocol == "I" else 0
+        if self.length <= index:
+            return None
+        return self._buf[index]
+
+    def frame(self):
+        """Return a memoryview over the bytes received so far."""
+
+        return self._mv[:self.length]
+
+    def payload(self):
+        """Return a memoryview over the registry payload (no header/CRC)."""
+
+        start = 3 if self.protocol == "I" else 1
+        end = self.length - 1
+        if end < start:
+            end = start
+        return self._mv[start:end]
+
+
+class DaikinSerialBase:
+    """Protocol logic shared by :class:`DaikinSerial` and the asyncio variant.
+
+    Holds the configuration common to all transports and implements frame
+    building, input flushing and reply validation, so that every driver
+    variant applies exactly the same frame rules and raises the same
+    exceptions. Subclasses only implement the I/O.
+    """
 
-        # Flush any pending data from UART RX buffer (equivalent to
-        # MySerial.flush(SERIAL_FLUSH_TX_ONLY) + discard input).
+    def __init__(self, protocol="I", timeout_ms=300, logger=None,
+                 adaptive_timeout=False, timeout_floor_ms=50,
+                 timeout_ceiling_ms=None, telemetry=True,
+                 log_level=LOG_DEBUG, frame_log=None):
+        protocol = (protocol or "I").upper()
+        if protocol not in ("I", "S"):
+            raise ValueError("protocol must be 'I' or 'S'")
+
+        self.protocol = protocol
+        self.timeout_ms = int(timeout_ms)
+
+        # Adaptive timeouts (see latency_profile)
+        self.adaptive_timeout = bool(adaptive_timeout)
+        self.timeout_floor_ms = int(timeout_floor_ms)
+        if timeout_ceiling_ms is None:
+            timeout_ceiling_ms = timeout_ms
+        self.timeout_ceiling_ms = int(timeout_ceiling_ms)
+        # reg_id -> [smoothed latency * 8, latency deviation * 4, samples]
+        self._latency = {}
+
+        # Messages below log_level are never formatted (see daikin_log)
+        self._log, self.log_level = resolve_logger(logger, log_level)
+
+        # Optional ring buffer of raw reply frames (see FrameRing)
+        if frame_log is False or frame_log is None:
+            frame_log = None
+        elif not isinstance(frame_log, FrameRing):
+            frame_log = FrameRing(frame_log)
+        self.frame_log = frame_log
+
+        # Reusable receive state machine (see DaikinFrameParser)
+        self._parser = DaikinFrameParser(protocol)
+
+        # Learned reply frame length per registry (see reply_lengths)
+        self._reply_lens = {}
+        self.reply_len_cache = None
+
+        # Per-registry counters and latency histograms (see DaikinTelemetry)
+        if telemetry is True:
+            telemetry = DaikinTelemetry()
+        self.telemetry = telemetry or None
+
+    # ------------------------------------------------------------------
+    # Latency estimates and adaptive timeouts
+    # ------------------------------------------------------------------
+
+    def latency_profile(self):
+        """Return the per-registry latency estimates.
+
+        Maps ``reg_id`` to a dict with the smoothed reply latency
+        (``avg_ms``), its mean deviation (``dev_ms``), the timeout the next
+        query of that registry will use (``timeout_ms``) and the number of
+        successful replies measured (``samples``).
+        """
+
+        profile = {}
+        for reg_id, est in self._latency.items():
+            profile[reg_id] = {
+                "avg_ms": est[0] >> 3,
+                "dev_ms": est[1] >> 2,
+                "timeout_ms": self._timeout_for(reg_id),
+                "samples": est[2],
+            }
+        return profile
+
+    def reset_latency(self):
+        """Forget all latency estimates (timeouts revert to ``timeout_ms``)."""
+
+        self._latency = {}
+
+    def _timeout_for(self, reg_id):
+        """Return the reply timeout to use for *reg_id*.
+
+        With ``adaptive_timeout`` this is the smoothed latency plus four
+        mean deviations (as for TCP retransmission timers), clamped to
+        ``timeout_floor_ms`` .. ``timeout_ceiling_ms``. Registries without
+        measurements use ``timeout_ms``.
+        """
+
+        if not self.adaptive_timeout:
+            return self.timeout_ms
+        est = self._latency.get(reg_id & 0xFF)
+        if est is None:
+            return self.timeout_ms
+        timeout = (est[0] >> 3) + est[1]
+        if timeout < self.timeout_floor_ms:
+            return self.timeout_floor_ms
+        if timeout > self.timeout_ceiling_ms:
+            return self.timeout_ceiling_ms
+        return timeout
+
+    def _record_latency(self, reg_id, elapsed_ms):
+        """Update the latency estimate of *reg_id* with a successful reply."""
+
+        est = self._latency.get(reg_id)
+        if est is None:
+            # First sample: deviation starts at half the latency
+            self._latency[reg_id] = [elapsed_ms << 3, elapsed_ms << 1, 1]
+            return
+        # Integer EWMA: gain 1/8 for the mean, 1/4 for the deviation
+        delta = elapsed_ms - (est[0] >> 3)
+        est[0] += delta
+        if delta < 0:
+            delta = -delta
+        est[1] += delta - (est[1] >> 2)
+        est[2] += 1
+
+    def _record_timeout(self, reg_id):
+        """Back off the timeout of *reg_id* after it timed out.
+
+        Doubles the deviation term, so a heat pump that became slower is
+        not starved by a timeout learned while it was fast; successful
+        replies shrink it again.
+        """
+
+        est = self._latency.get(reg_id)
+        if est is not None:
+            est[1] = (est[1] << 1) or 8
+
+    def _complete(self, reg_id, elapsed_ms):
+        """Validate the received reply and update latency estimates and
+        telemetry.
+
+        Returns the payload memoryview, see :meth:`_check_reply`.
+        """
+
+        reg_id &= 0xFF
+        parser = self._parser
         try:
-            if hasattr(self.uart, "read"):
+            payload = self._check_reply(parser, reg_id)
+        except DaikinSerialError as exc:
+            if isinstance(exc, DaikinTimeoutError):
+                self._record_timeout(reg_id)
+            self._forget_reply_len(reg_id, parser, exc)
+            self._account(reg_id, self._outcome(exc, parser), elapsed_ms)
+            raise
+        self._record_latency(reg_id, elapsed_ms)
+        self._account(reg_id, OK, elapsed_ms)
+        return payload
+
+    def _account(self, reg_id, outcome, elapsed_ms):
+        """Record a finished exchange in the telemetry and frame log."""
+
+        parser = self._parser
+        if self.telemetry is not None:
+            self.telemetry.record(reg_id, outcome, elapsed_ms, parser.length)
+        if self.frame_log is not None:
+            self.frame_log.record(_ticks_ms(), reg_id, outcome, parser.frame())
+
+    @staticmethod
+    def _outcome(exc, parser):
+        """Map a :meth:`_check_reply` exception to a telemetry counter."""
+
+        if isinstance(exc, DaikinTimeoutError):
+            return TIMEOUTS
+        if isinstance(exc, DaikinCRCError):
+            return CRC_ERRORS
+        if isinstance(exc, DaikinProtocolError):
+            return PROTOCOL_ERRORS
+        if parser.is_overflow:
+            return OTHER_ERRORS
+        return ID_MISMATCHES
+
+    # ------------------------------------------------------------------
+    # Learned reply lengths
+    # ------------------------------------------------------------------
+
+    def reply_lengths(self):
+        """Return a copy of the learned ``reg_id -> frame length`` mapping."""
+
+        return dict(self._reply_lens)
+
+    def load_reply_lengths(self, path):
+        """Load learned reply lengths from a JSON file written by
+        :meth:`save_reply_lengths`, and keep saving new ones to *path*.
+
+        A missing or unreadable file, or one recorded for the other protocol,
+        is ignored. Returns the number of registries loaded.
+        """
+
+        self.reply_len_cache = path
+        try:
+            with open(path, "r") as f:
+                data = _json.load(f)
+        except (OSError, ValueError):
+            return 0
+        if not isinstance(data, dict) or data.get("protocol") != self.protocol:
+            return 0
+
+        count = 0
+        for key, length in (data.get("lengths") or {}).items():
+            try:
+                reg_id = int(key) & 0xFF
+                length = int(length)
+            except (TypeError, ValueError):
+                continue
+            if 0 < length <= MAX_FRAME_LEN:
+                self._reply_lens[reg_id] = length
+                count += 1
+        return count
+
+    def save_reply_lengths(self, path=None):
+        """Write learned reply lengths as JSON to *path* (or the cache file)."""
+
+        path = path or self.reply_len_cache
+        if not path:
+            return
+        data = {
+            "protocol": self.protocol,
+            "lengths": dict((str(k), v) for k, v in self._reply_lens.items()),
+        }
+        try:
+            with open(path, "w") as f:
+                _json.dump(data, f)
+        except OSError as exc:
+            if self.log_level <= LOG_WARNING:
+                self._log("Could not save reply lengths to %s: %r" % (path, exc))
+
+    def _learn_reply_len(self, reg_id, length):
+        """Remember the frame length of a valid reply for *reg_id*."""
+
+        if self._reply_lens.get(reg_id) != length:
+            self._reply_lens[reg_id] = length
+            if self.reply_len_cache:
+                self.save_reply_lengths()
+
+    def _forget_reply_len(self, reg_id, parser, exc):
+        """Forget the learned length of *reg_id* after a failed reply.
+
+        The learned length only changes on success, so a stale one (e.g.
+        loaded from a cache written for another unit) would otherwise stay
+        in use. It is dropped when the reply timed out or announced another
+        length; the next query then starts from the protocol default.
+        """
+
+        learned = self._reply_lens.get(reg_id)
+        if learned is None:
+            return
+        if isinstance(exc, DaikinTimeoutError) or (
+            parser.length_known and parser.expected_len != learned
+        ):
+            del self._reply_lens[reg_id]
+            if self.log_level <= LOG_INFO:
+                self._log("Forgetting reply length %d of register 0x%02X" % (learned, reg_id))
+            if self.reply_len_cache:
+                self.save_reply_lengths()
+
+    # ------------------------------------------------------------------
+    # Shared request/reply handling
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _discard_input(uart):
+        """Flush pending data from the UART RX buffer.
+
+        Equivalent to ``MySerial.flush(SERIAL_FLUSH_TX_ONLY)`` + discard
+        input in the C++ code.
+        """
+
+        try:
+            if hasattr(uart, "read"):
                 # Read and discard whatever is waiting
-                any_fn = getattr(self.uart, "any", None)
+                any_fn = getattr(uart, "any", None)
                 if any_fn is not None:
                     while any_fn():
                         # Limit each read to avoid blocking too long
-                        self.uart.read(32)
+                        uart.read(32)
             # Some UART drivers have flush; if present, call it.
-            if hasattr(self.uart, "flush"):
-                self.uart.flush()
+            if hasattr(uart, "flush"):
+                uart.flush()
         except Exception:
             # Be robust to UART implementations that don't support all ops
             pass
 
-        # Send command
-        self.uart.write(cmd)
-
-        # Read reply
-        expected_len = self._initial_reply_len(reg_id)
-        deadline = _ticks_ms() + self.timeout_ms
-
-        buf = bytearray()
-        error_checked = False
-
-        any_fn = getattr(self.uart, "any", None)
-
-        while len(buf) < expected_len and _ticks_diff(deadline, _ticks_ms()) > 0:
-            if any_fn is None or not any_fn():
-                # Small sleep to avoid tight loop on some ports
-                continue
+    def _check_reply(self, parser, reg_id):
+        """Validate the frame held by *parser* and return its payload.
 
-            chunk = self.uart.read(1)
-            if not chunk:
-                continue
-            buf.extend(chunk)
+        Raises the same exceptions as :meth:`DaikinSerial.query_registry`.
+        The payload is returned as a memoryview into the parser buffer.
+        """
 
-            # Dynamic length handling for I protocol once 3 bytes read
-            if self.protocol == "I" and len(buf) == 3:
-                # Length field is at index 2 and does not include
-                # the initial 3 bytes (see Daikin I protocol doc).
-                length_field = buf[2]
-                expected_len = length_field + 2
+        # Common error reply for both protocols: 0x15 0xEA
+        if parser.is_error:
+            if self.log_level <= LOG_WARNING:
+                self._log("Error 0x15 0xEA returned from HP")
+            raise DaikinProtocolError("HP returned error 0x15 0xEA")
+        if parser.is_overflow:
+            if self.log_level <= LOG_ERROR:
+                self._log("ERR: reply for register 0x%02X too long for buffer" % reg_id)
+            raise DaikinSerialError(
+                "Reply of %d bytes does not fit the receive buffer" % parser.expected_len
+            )
 
-            # Common error reply for both protocols: 0x15 0xEA
-            if not error_checked and len(buf) >= 2:
-                if buf[0] == 0x15 and buf[1] == 0xEA:
-                    self._log("Error 0x15 0xEA returned from HP")
-                    raise DaikinProtocolError("HP returned error 0x15 0xEA")
-                error_checked = True
+        buf = parser.frame()
+        expected_len = parser.expected_len
+        level = self.log_level
 
         # Timeout / incomplete reply
         if len(buf) == 0:
-            self._log("Time out! Check connection")
+            if level <= LOG_WARNING:
+                self._log("Time out! Check connection")
             raise DaikinTimeoutError("No reply from heat pump")
-        if len(buf) < expected_len:
-            self._log(
-                "ERR: Time out on register 0x%02X! got %d/%d bytes" %
-                (reg_id, len(buf), expected_len)
-            )
-            self._log(self._format_buffer(buf))
+        if not parser.done:
+            if level <= LOG_WARNING:
+                self._log(
+                    "ERR: Time out on register 0x%02X! got %d/%d bytes" %
+                    (reg_id, len(buf), expected_len)
+                )
+                self._log(format_buffer(buf))
             raise DaikinTimeoutError(
                 "Incomplete reply: got %d of %d bytes" % (len(buf), expected_len)
             )
 
-        self._log(self._format_buffer(buf))
-
-        # CRC check: last byte is CRC over all previous bytes
-        calc_crc = sum_and_invert(buf[:-1])
-        if calc_crc != buf[-1]:
-            self._log(
-                "ERROR: Wrong CRC on register 0x%02X. Calculated 0x%02X but got 0x%02X" %
-                (reg_id, calc_crc, buf[-1])
-            )
-            self._log("Buffer: " + self._format_buffer(buf))
+        if level <= LOG_DEBUG:
+            self._log(format_buffer(buf))
+
+        # CRC check: last byte is CRC over all previous bytes, accumulated
+        # by the parser while receiving.
+        if not parser.crc_ok:
+            calc_crc = parser.calculated_crc
+            if level <= LOG_WARNING:
+                self._log(
+                    "ERROR: Wrong CRC on register 0x%02X. Calculated 0x%02X but got 0x%02X" %
+                    (reg_id, calc_crc, buf[-1])
+                )
+                self._log("Buffer: " + format_buffer(buf))
             raise DaikinCRCError(
                 "CRC mismatch: calc=0x%02X, recv=0x%02X" % (calc_crc, buf[-1])
             )
 
         # At this point we have a valid frame; normalize it to payload only.
-        proto = self.protocol
-        if proto == "I":
-            # I-protocol frame:
-            #   [0] = 0x40
-            #   [1] = reg_id
-            #   [2] = payload length (number of bytes after this one, up to CRC)
-            #   [3..N-2] = payload
-            #   [N-1] = CRC
-            if buf[1] != (reg_id & 0xFF):
-                raise DaikinSerialError(
-                    "Registry ID mismatch in I frame: expected 0x%02X, got 0x%02X"
-                    % (reg_id, buf[1])
-                )
-            payload = buf[3:-1]
-        else:  # "S"
-            # S-protocol frame:
-            #   [0] = reg_id
-            #   [1..N-2] = payload
-            #   [N-1] = CRC
-            if buf[0] != (reg_id & 0xFF):
-                raise DaikinSerialError(
-                    "Registry ID mismatch in S frame: expected 0x%02X, got 0x%02X"
-                    % (reg_id, buf[0])
-                )
-            payload = buf[1:-1]
+        #
+        # I-protocol frame:
+        #   [0] = 0x40
+        #   [1] = reg_id
+        #   [2] = payload length (number of bytes after this one, up to CRC)
+        #   [3..N-2] = payload
+        #   [N-1] = CRC
+        #
+        # S-protocol frame:
+        #   [0] = reg_id
+        #   [1..N-2] = payload
+        #   [N-1] = CRC
+        if parser.registry_id != (reg_id & 0xFF):
+            raise DaikinSerialError(
+                "Registry ID mismatch in %s frame: expected 0x%02X, got 0x%02X"
+                % (self.protocol, reg_id, parser.registry_id)
+            )
+        payload = parser.payload()
+        reg_id &= 0xFF
+        self._learn_reply_len(reg_id, parser.length)
 
-        self._log(".. CRC OK! Payload length=%d" % len(payload))
-        return bytes(payload)
+        if level <= LOG_DEBUG:
+            self._log(".. CRC OK! Payload length=%d" % len(payload))
+        return payload
 
     # ------------------------------------------------------------------
     # Helpers mirroring the C++ implementation
@@ -285,30 +800,47 @@ class DaikinSerial:
     def _initial_reply_len(self, reg_id):
         """Return initial reply length guess.
 
+        A length learned from an earlier valid reply of this registry takes
+        precedence (see :meth:`reply_lengths`).
+
         For I protocol this is a conservative minimum (12 bytes), and the
         actual length is overridden when the 3rd byte is received.
 
-        For S protocol this mirrors the hard-coded lengths in the C++ code
-        (see ``get_reply_len`` in ``include/comm.h`` and
-        ``doc/Daikin S protocol.md``).
+        For S protocol this is the hard-coded length by registry (see
+        ``doc/Daikin S protocol.md``). Unlike ``get_reply_len`` in
+        ``include/comm.h``, 0x56 replies have 6 bytes, as captured from a
+        Rotex RDLQ014AA6V3 (``ROTEX_S_REPLIES`` in ``tools/hp_emulator.py``).
         """
 
+        learned = self._reply_lens.get(reg_id & 0xFF)
+        if learned is not None:
+            return learned
+
         if self.protocol == "I":
             return 12
 
         # Protocol S: hard-coded by registry
-        if reg_id == 0x50:
+        if reg_id == 0x50 or reg_id == 0x56:
             return 6
-        if reg_id == 0x56:
-            return 4
         # All other known S registries (0x53, 0x54, 0x55) use 18 bytes
         return 18
 
+    def _max_reply_len(self, reg_id):
+        """Return the smallest buffer able to hold the reply for *reg_id*.
+
+        This is the learned frame length if known; otherwise the largest
+        possible I frame, or the fixed S frame length.
+        """
+
+        if self.protocol == "I" and (reg_id & 0xFF) not in self._reply_lens:
+            return MAX_FRAME_LEN
+        return self._initial_reply_len(reg_id)
+
     @staticmethod
     def _format_buffer(buf):
         """Return a hex-formatted string similar to logBuffer in C++."""
 
-        return " ".join("0x%02X" % b for b in buf)
+        return format_buffer(buf)
 
     def _build_command(self, reg_id):
         """Build command frame for a given registry and configured protocol.
@@ -332,3 +864,346 @@ class DaikinSerial:
             cmd[1] = reg_id
             cmd[2] = sum_and_invert(cmd[:2])
             return bytes(cmd)
+
+
+class DaikinSerial(DaikinSerialBase):
+    """Low-level Daikin Altherma serial protocol driver.
+
+    Parameters
+    ----------
+    uart:
+        A configured UART-like object with ``read``, ``write`` and ``any``
+        methods (e.g. ``machine.UART`` on MicroPython).
+    protocol:
+        Either ``"I"`` (default) or ``"S"``. The heat pump supports only
+        one of these; configure it here once.
+    timeout_ms:
+        Maximum time to wait for a complete reply (default: 300 ms,
+        matching ``SER_TIMEOUT`` in the C++ code).
+    logger:
+        Optional callable taking a single string for debug logging.
+        Defaults to ``print``. Pass ``False`` to disable logging.
+    wait:
+        How to wait for reply bytes without spinning the CPU:
+
+        * ``"sleep"`` (default): poll ``uart.any()`` and sleep for the time
+          one byte takes on the wire between empty polls.
+        * ``"block"``: blocking ``uart.read(n)``; relies on the UART having
+          been configured with a read timeout (``timeout=`` /
+          ``timeout_char=`` on MicroPython, ``timeout=`` on pySerial).
+        * ``"poll"``: wait on ``select.poll`` for the UART to become
+          readable. Falls back to ``"sleep"`` if the port does not support
+          polling the UART object.
+    baudrate:
+        Baud rate the UART is configured with (default: 9600). Only used to
+        size the ``"sleep"`` backoff.
+    inter_frame_gap_ms:
+        Pause between a validated reply and the next command in
+        :meth:`query_registries` (default: 0, i.e. send immediately). Raise
+        it if the heat pump needs time to settle between frames.
+    reply_len_cache:
+        Optional path of a JSON file to persist learned reply frame lengths
+        in (see :meth:`load_reply_lengths`). Learned lengths let the driver
+        read a whole frame in one ``uart.read(n)``.
+    frame_slack_ms:
+        Once a reply has started and its length is known, it must complete
+        within its remaining wire time plus this slack (default: 20 ms);
+        truncated frames then fail early instead of at ``timeout_ms``.
+    adaptive_timeout:
+        If true, keep a smoothed latency estimate per registry and derive
+        each registry's timeout from it (see :meth:`latency_profile`)
+        instead of always waiting ``timeout_ms``. Default: false.
+    timeout_floor_ms, timeout_ceiling_ms:
+        Bounds for adaptive timeouts (defaults: 50 ms and ``timeout_ms``).
+    telemetry:
+        Per-registry request/error counters and latency histograms, exposed
+        as ``self.telemetry`` (see :class:`daikin_telemetry.DaikinTelemetry`).
+        ``True`` (default) creates one, a ``DaikinTelemetry`` instance is
+        used as given (e.g. with custom buckets), ``False`` disables it.
+    log_level:
+        Minimum level of messages passed to ``logger`` (``daikin_log``
+        ``LOG_DEBUG`` (default), ``LOG_INFO``, ``LOG_WARNING``,
+        ``LOG_ERROR`` or ``LOG_OFF``). Messages below it are not even
+        formatted; per-query hex dumps and progress lines are ``LOG_DEBUG``,
+        timeouts and bad replies ``LOG_WARNING``.
+    frame_log:
+        Number of recent raw reply frames to keep in a
+        :class:`daikin_log.FrameRing` (``self.frame_log``), or a ``FrameRing``
+        instance. Stores bytes instead of formatting them, for debugging in
+        production. Default: disabled.
+    """
+
+    def __init__(self, uart, protocol="I", timeout_ms=300, logger=None,
+                 wait=WAIT_SLEEP, baudrate=9600, inter_frame_gap_ms=0,
+                 reply_len_cache=None, frame_slack_ms=20,
+                 adaptive_timeout=False, timeout_floor_ms=50,
+                 timeout_ceiling_ms=None, telemetry=True,
+                 log_level=LOG_DEBUG, frame_log=None):
+        if wait not in (WAIT_SLEEP, WAIT_BLOCK, WAIT_POLL):
+            raise ValueError("wait must be 'sleep', 'block' or 'poll'")
+        super().__init__(
+            protocol, timeout_ms, logger,
+            adaptive_timeout=adaptive_timeout,
+            timeout_floor_ms=timeout_floor_ms,
+            timeout_ceiling_ms=timeout_ceiling_ms,
+            telemetry=telemetry,
+            log_level=log_level,
+            frame_log=frame_log,
+        )
+
+        self.uart = uart
+        self.wait = wait
+        self.inter_frame_gap_ms = int(inter_frame_gap_ms)
+        self.frame_slack_ms = int(frame_slack_ms)
+        # Time one byte takes on the wire, used as the sleep backoff
+        self.byte_time_us = max(1, (_BITS_PER_BYTE * 1000000) // int(baudrate))
+
+        if reply_len_cache:
+            self.load_reply_lengths(reply_len_cache)
+
+        self._poller = None
+        if wait == WAIT_POLL:
+            self._poller = self._make_poller(uart)
+            if self._poller is None:
+                if self.log_level <= LOG_INFO:
+                    self._log("UART does not support poll, falling back to sleep")
+                self.wait = WAIT_SLEEP
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def query_registry(self, reg_id):
+        """Query a single registry and return its *payload bytes*.
+
+        This wraps the low-level I/S protocols and always returns only the
+        registry payload, independent of the protocol variant used by the
+        heat pump.
+
+        For both protocol I and S, the returned value is the sequence of bytes
+        that represent the registry content, with the protocol-specific
+        header and trailing CRC removed.
+
+        Parameters
+        ----------
+        reg_id:
+            Registry identifier (0-255).
+
+        Returns
+        -------
+        bytes
+            Registry payload bytes, without header/CRC, same layout for
+            both protocol I and S.
+
+        Raises
+        ------
+        DaikinTimeoutError
+            If no or incomplete reply is received within the timeout.
+        DaikinProtocolError
+            If the heat pump returns an explicit error frame (0x15 0xEA).
+        DaikinCRCError
+            If the CRC of the reply is invalid.
+        DaikinSerialError
+            If the decoded registry ID in the response does not match the
+            requested one.
+        """
+
+        return bytes(self.query_registry_into(reg_id))
+
+    def query_registry_into(self, reg_id, out=None):
+        """Query a registry without allocating; return a *memoryview* payload.
+
+        Same protocol handling, validation and exceptions as
+        :meth:`query_registry`, but the reply is received straight into a
+        preallocated buffer and the payload is returned as a memoryview into
+        that buffer (header and CRC excluded).
+
+        Parameters
+        ----------
+        reg_id:
+            Registry identifier (0-255).
+        out:
+            Optional writable buffer (e.g. ``bytearray(MAX_FRAME_LEN)``) to
+            receive the reply frame into. Defaults to a per-instance buffer.
+
+        Returns
+        -------
+        memoryview
+            Registry payload. It is only valid until the next query using the
+            same buffer; copy it with ``bytes(...)`` if it must be kept.
+        """
+
+        if self.log_level <= LOG_DEBUG:
+            self._log("Querying register 0x%02X..." % reg_id)
+
+        self._discard_input(self.uart)
+        elapsed = self._exchange(reg_id, out)
+
+        return self._complete(reg_id, elapsed)
+
+    def query_registries(self, reg_ids, skip_errors=False):
+        """Query several registries back to back.
+
+        The UART input is flushed once for the whole batch and each command
+        is sent as soon as the previous reply has been validated, after the
+        configured ``inter_frame_gap_ms``. This is no faster than calling
+        :meth:`query_registry` in a loop (the sweep is bound by reply latency
+        and wire time); it saves the per-registry flush and lets a sweep
+        carry on past failing registries.
+
+        Parameters
+        ----------
+        reg_ids:
+            Sequence of registry identifiers (0-255), queried in order.
+        skip_errors:
+            If false (default), the first failing registry raises the same
+            exception as :meth:`query_registry`. If true, failing registries
+            are left out of the result and the batch continues.
+
+        Returns
+        -------
+        dict
+            Mapping ``reg_id -> payload bytes``.
+        """
+
+        results = {}
+        uart = self.uart
+        gap_us = self.inter_frame_gap_ms * 1000
+
+        if self.log_level <= LOG_DEBUG:
+            self._log("Querying %d registers..." % len(reg_ids))
+        self._discard_input(uart)
+
+        first = True
+        for reg_id in reg_ids:
+            if not first and gap_us > 0:
+                _sleep_us(gap_us)
+            first = False
+
+            elapsed = self._exchange(reg_id)
+            try:
+                results[reg_id] = bytes(self._complete(reg_id, elapsed))
+            except DaikinSerialError:
+                if not skip_errors:
+                    raise
+                # Drop whatever is left of the failed reply before moving on
+                self._discard_input(uart)
+
+        return results
+
+    def _exchange(self, reg_id, out=None):
+        """Send the command for *reg_id* and receive the reply into the parser.
+
+        Returns the time in ms from sending the command until reception
+        ended (reply complete, error frame or timeout).
+        """
+
+        if out is not None and len(out) < self._max_reply_len(reg_id):
+            raise ValueError("out buffer too small for a reply frame")
+
+        # Send command
+        start = _ticks_ms()
+        self.uart.write(self._build_command(reg_id))
+
+        # Read reply; a learned length lets us read the frame in one go
+        parser = self._parser
+        parser.reset(
+            self._initial_reply_len(reg_id), out,
+            trusted=(reg_id & 0xFF) in self._reply_lens,
+        )
+        self._receive(parser, start + self._timeout_for(reg_id))
+        return _ticks_diff(_ticks_ms(), start)
+
+    # ------------------------------------------------------------------
+    # Receive loop
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _make_poller(uart):
+        """Return a poll object watching *uart* for input, or ``None``."""
+
+        if _select is None or not hasattr(_select, "poll"):
+            return None
+        try:
+            poller = _select.poll()
+            poller.register(uart, _select.POLLIN)
+        except Exception:
+            return None
+        return poller
+
+    def _receive(self, parser, deadline):
+        """Feed *parser* with reply bytes until it is done or *deadline* passes.
+
+        The loop never busy-waits: depending on ``self.wait`` it sleeps for one
+        byte time between empty polls, blocks in ``uart.read`` or waits on
+        ``select.poll``.
+        """
+
+        uart = self.uart
+        wait = self.wait
+        readinto = getattr(uart, "readinto", None)
+        tightened = False
+
+        if wait == WAIT_BLOCK:
+            while not parser.done and _ticks_diff(deadline, _ticks_ms()) > 0:
+                if readinto is not None:
+                    n = readinto(parser.window(parser.needed))
+                    if n:
+                        parser.commit(n)
+                else:
+                    chunk = uart.read(parser.needed)
+                    if chunk:
+                        parser.feed(chunk)
+                if not tightened and parser.length:
+                    deadline, tightened = self._frame_deadline(parser, deadline)
+            return
+
+        any_fn = getattr(uart, "any", None)
+        poller = self._poller
+        byte_time_us = self.byte_time_us
+
+        while not parser.done:
+            left = _ticks_diff(deadline, _ticks_ms())
+            if left <= 0:
+                break
+
+            waiting = any_fn() if any_fn is not None else 0
+            if not waiting:
+                if poller is not None:
+                    poller.poll(left)
+                else:
+                    _sleep_us(byte_time_us)
+                continue
+
+            # Read everything available, but never past the current frame
+            remaining = parser.remaining
+            if waiting > remaining:
+                waiting = remaining
+            if readinto is not None:
+                n = readinto(parser.window(waiting))
+                if n:
+                    parser.commit(n)
+            else:
+                chunk = uart.read(waiting)
+                if chunk:
+                    parser.feed(chunk)
+            if not tightened and parser.length:
+                deadline, tightened = self._frame_deadline(parser, deadline)
+
+    def _frame_deadline(self, parser, deadline):
+        """Shorten *deadline* to the remaining wire time of a started frame.
+
+        Returns ``(deadline, tightened)``. Only applies once the frame length
+        is known (S protocol or I length byte received), so that a truncated
+        frame fails after its wire time plus ``frame_slack_ms`` rather than
+        at the full timeout. A learned I length is not enough: it may be
+        stale, and a deadline armed from it would cut off a longer frame.
+        """
+
+        if parser.done or not parser.length_known:
+            return deadline, False
+        wire_ms = (parser.remaining * self.byte_time_us + 999) // 1000
+        frame_deadline = _ticks_ms() + wire_ms + self.frame_slack_ms
+        if _ticks_diff(frame_deadline, deadline) < 0:
+            deadline = frame_deadline
+        return deadline, True
@@ -0,0 +1,155 @@
+"""asyncio / uasyncio variant of the Daikin Altherma serial driver.
+
+:class:`AsyncDaikinSerial` exposes ``async query_registry(reg_id)`` with the
+same payload-only contract, frame rules and exceptions as
+:class:`daikin_serial.DaikinSerial`; frame building, reply parsing and
+validation are shared with it through :class:`DaikinSerialBase` and
+:class:`DaikinFrameParser`.
+
+While a serial exchange is in flight (up to ``timeout_ms``), the event loop
+is free to serve other tasks such as Modbus clients, MQTT keepalives or HTTP.
+
+Example (ESP32 / MicroPython)::
+
+    import uasyncio as asyncio
+    from machine import UART, Pin
+    from daikin_serial_async import AsyncDaikinSerial
+
+    uart = UART(1, baudrate=9600, bits=8, parity=UART.EVEN, stop=1,
+                tx=Pin(17), rx=Pin(16))
+    daikin = AsyncDaikinSerial.from_uart(uart, protocol="I")
+
+    async def main():
+        payload = await daikin.query_registry(0x60)
+
+    asyncio.run(main())
+
+On CPython, pass any ``asyncio.StreamReader`` / ``asyncio.StreamWriter``
+pair, e.g. from ``serial_asyncio.open_serial_connection``::
+
+    reader, writer = await serial_asyncio.open_serial_connection(
+        url="/dev/ttyUSB0", baudrate=9600, parity="E")
+    daikin = AsyncDaikinSerial(reader, writer, protocol="I")
+
+"""
+
+from __future__ import annotations
+
+try:
+    import uasyncio as asyncio  # MicroPython
+except ImportError:  # CPython fallback
+    import asyncio  # type: ignore[no-redef]
+
+from daikin_log import LOG_DEBUG
+from daikin_serial import DaikinSerialBase, _ticks_diff, _ticks_ms
+
+
+class AsyncDaikinSerial(DaikinSerialBase):
+    """Daikin Altherma serial protocol driver for asyncio / uasyncio.
+
+    Parameters
+    ----------
+    reader:
+        Stream reader connected to the heat pump (``read(n)`` coroutine).
+    writer:
+        Stream writer connected to the heat pump (``write`` + ``drain``).
+    protocol:
+        Either ``"I"`` (default) or ``"S"``.
+    timeout_ms:
+        Maximum time to wait for a complete reply (default: 300 ms).
+    logger:
+        Optional callable taking a single string for debug logging.
+        Defaults to ``print``. Pass ``False`` to disable logging.
+    uart:
+        Optional underlying UART. If given, pending input is discarded
+        before each command, like :class:`DaikinSerial` does.
+    adaptive_timeout, timeout_floor_ms, timeout_ceiling_ms:
+        Per-registry adaptive timeouts, as for :class:`DaikinSerial`.
+    telemetry, log_level, frame_log:
+        Per-registry counters (``self.telemetry``), log level and raw frame
+        ring buffer, as for :class:`DaikinSerial`.
+    """
+
+    def __init__(self, reader, writer, protocol="I", timeout_ms=300,
+                 logger=None, uart=None, adaptive_timeout=False,
+                 timeout_floor_ms=50, timeout_ceiling_ms=None,
+                 telemetry=True, log_level=LOG_DEBUG, frame_log=None):
+        super().__init__(
+            protocol, timeout_ms, logger,
+            adaptive_timeout=adaptive_timeout,
+            timeout_floor_ms=timeout_floor_ms,
+            timeout_ceiling_ms=timeout_ceiling_ms,
+            telemetry=telemetry,
+            log_level=log_level,
+            frame_log=frame_log,
+        )
+
+        self.reader = reader
+        self.writer = writer
+        self.uart = uart
+        # One exchange at a time on the shared serial line
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_uart(cls, uart, **kwargs):
+        """Wrap a ``machine.UART`` in uasyncio streams (MicroPython only)."""
+
+        reader = asyncio.StreamReader(uart)
+        writer = asyncio.StreamWriter(uart, {})
+        return cls(reader, writer, uart=uart, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    async def query_registry(self, reg_id):
+        """Query a single registry and return its *payload bytes*.
+
+        Coroutine counterpart of :meth:`DaikinSerial.query_registry`; see
+        there for the return value and the exceptions raised. Concurrent
+        calls are serialised.
+        """
+
+        async with self._lock:
+            cmd = self._build_command(reg_id)
+            if self.log_level <= LOG_DEBUG:
+                self._log("Querying register 0x%02X..." % reg_id)
+
+            if self.uart is not None:
+                self._discard_input(self.uart)
+
+            # Send command
+            start = _ticks_ms()
+            self.writer.write(cmd)
+            await self.writer.drain()
+
+            # Read reply; on timeout the parser keeps whatever arrived so
+            # that _check_reply can report a missing or incomplete frame.
+            parser = self._parser
+            parser.reset(
+                self._initial_reply_len(reg_id),
+                trusted=(reg_id & 0xFF) in self._reply_lens,
+            )
+            timeout_ms = self._timeout_for(reg_id)
+            try:
+                await asyncio.wait_for(self._receive(parser), timeout_ms / 1000)
+            except asyncio.TimeoutError:
+                pass
+            elapsed = _ticks_diff(_ticks_ms(), start)
+
+            return bytes(self._complete(reg_id, elapsed))
+
+    # ------------------------------------------------------------------
+    # Receive loop
+    # ------------------------------------------------------------------
+
+    async def _receive(self, parser):
+        """Feed *parser* from the stream reader until the frame is done."""
+
+        reader = self.reader
+        while not parser.done:
+            chunk = await reader.read(parser.needed)
+            if not chunk:
+                # End of stream; _check_reply reports the missing bytes
+                return
+            parser.feed(chunk)
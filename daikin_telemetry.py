@@ -0,0 +1,147 @@
+"""Per-registry serial telemetry for the Daikin Altherma drivers.
+
+:class:`DaikinTelemetry` keeps a small, fixed set of integer counters and a
+bucketed latency histogram for every registry queried through
+:class:`daikin_serial.DaikinSerial` (or its asyncio variant), so that slow
+registries and bus glitches can be told apart from the log output.
+
+Memory use is one ``array('L')`` row per registry seen (8 counters plus one
+slot per latency bucket, 4 bytes each on the ESP32), allocated the first
+time the registry is queried. Recording a query only increments existing
+array slots, so the per-query path does not allocate.
+
+Example::
+
+    daikin = DaikinSerial(uart, protocol="I")
+    ...
+    stats = daikin.telemetry.snapshot()
+    # {0x60: {"requests": 120, "ok": 119, "timeouts": 1, ...,
+    #         "latency_ms": [(25, 0), (50, 3), ..., (None, 0)]}}
+    daikin.telemetry.reset()
+
+"""
+
+from __future__ import annotations
+
+try:
+    from uarray import array  # MicroPython
+except ImportError:  # CPython fallback for testing
+    from array import array
+
+# Outcome counters (row indices)
+REQUESTS = 0
+OK = 1
+TIMEOUTS = 2
+CRC_ERRORS = 3
+PROTOCOL_ERRORS = 4
+ID_MISMATCHES = 5
+OTHER_ERRORS = 6
+BYTES_RX = 7
+_N_COUNTERS = 8
+
+COUNTER_NAMES = (
+    "requests",
+    "ok",
+    "timeouts",
+    "crc_errors",
+    "protocol_errors",
+    "id_mismatches",
+    "other_errors",
+    "bytes_rx",
+)
+
+# Upper bucket bounds in ms; a final bucket catches everything slower
+DEFAULT_BUCKETS_MS = (25, 50, 75, 100, 150, 200, 300)
+
+# Counters are unsigned 32-bit; wrap rather than overflow the array type
+_MASK = 0xFFFFFFFF
+
+
+class DaikinTelemetry:
+    """Fixed-memory per-registry counters and latency histograms.
+
+    Parameters
+    ----------
+    buckets_ms:
+        Increasing upper bounds (ms) of the latency histogram buckets. An
+        extra bucket counts replies slower than the last bound.
+    """
+
+    def __init__(self, buckets_ms=DEFAULT_BUCKETS_MS):
+        bounds = tuple(int(b) for b in buckets_ms)
+        for i in range(1, len(bounds)):
+            if bounds[i] <= bounds[i - 1]:
+                raise ValueError("buckets_ms must be increasing")
+        self.buckets_ms = bounds
+        self._row_len = _N_COUNTERS + len(bounds) + 1
+        self._rows = {}
+
+    def _row(self, reg_id):
+        row = self._rows.get(reg_id)
+        if row is None:
+            row = array("L", [0] * self._row_len)
+            self._rows[reg_id] = row
+        return row
+
+    def record(self, reg_id, outcome, elapsed_ms, nbytes):
+        """Record one query of *reg_id*.
+
+        *outcome* is one of the counter indices (``OK``, ``TIMEOUTS``, ...),
+        *elapsed_ms* the time from sending the command until reception
+        ended and *nbytes* the number of reply bytes received.
+        """
+
+        row = self._row(reg_id)
+        row[REQUESTS] = (row[REQUESTS] + 1) & _MASK
+        row[outcome] = (row[outcome] + 1) & _MASK
+        row[BYTES_RX] = (row[BYTES_RX] + nbytes) & _MASK
+        if outcome == OK:
+            # Latency histogram covers complete, valid replies only
+            index = _N_COUNTERS
+            for bound in self.buckets_ms:
+                if elapsed_ms < bound:
+                    break
+                index += 1
+            row[index] = (row[index] + 1) & _MASK
+
+    def snapshot(self, reg_id=None):
+        """Return the counters as plain dicts.
+
+        Without *reg_id*, returns ``{reg_id: stats}`` for every registry
+        queried so far; otherwise the stats of that registry (all zero if it
+        was never queried). ``stats`` maps each name in ``COUNTER_NAMES`` to
+        its count, and ``"latency_ms"`` to a list of ``(upper_bound, count)``
+        pairs, the last one with bound ``None``.
+        """
+
+        if reg_id is not None:
+            row = self._rows.get(reg_id & 0xFF)
+            if row is None:
+                row = array("L", [0] * self._row_len)
+            return self._stats(row)
+        return dict((reg, self._stats(row)) for reg, row in self._rows.items())
+
+    def _stats(self, row):
+        stats = {}
+        for i in range(_N_COUNTERS):
+            stats[COUNTER_NAMES[i]] = row[i]
+        bounds = self.buckets_ms + (None,)
+        stats["latency_ms"] = [
+            (bounds[i], row[_N_COUNTERS + i]) for i in range(len(bounds))
+        ]
+        return stats
+
+    def reset(self, reg_id=None):
+        """Zero the counters of *reg_id*, or of all registries.
+
+        Rows stay allocated, so resetting does not fragment the heap.
+        """
+
+        if reg_id is not None:
+            rows = [self._rows.get(reg_id & 0xFF)]
+        else:
+            rows = self._rows.values()
+        for row in rows:
+            if row is not None:
+                for i in range(self._row_len):
+                    row[i] = 0
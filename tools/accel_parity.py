@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""Parity check and benchmark of the daikin_accel native/viper primitives.
+
+Runs every function of ``daikin_accel`` against the pure-Python version it
+replaces (kept as ``_py_<name>`` in ``daikin_serial`` and
+``daikin_converters``):
+
+- the byte readers and ``get_(un)signed_value`` on every 0-, 1- and 2-byte
+  input, in both byte orders,
+- ``sum_and_invert``, ``byte_sum`` and ``bytes_to_registers`` on random
+  buffers of every length up to a full I-protocol frame,
+- the bridge's ``fill_registers`` (its only implementation) on random FC3
+  requests, against a per-address reference packing,
+
+each as ``bytes``, ``bytearray`` and offset ``memoryview`` slices (the
+receive path passes memoryviews into the driver buffer). Any difference
+is reported and makes the script exit non-zero. Then it times each pair.
+
+On a board, ``daikin_accel`` is compiled by the native emitter::
+
+    mpremote cp daikin_*.py : + run tools/accel_parity.py [quick]
+
+On CPython the same source runs as plain Python (``daikin_accel.NATIVE``
+is false), so the checks run on the host too, without a board; the
+timings only mean something on the board. ``quick`` checks every 16th
+2-byte input instead of all of them.
+"""
+
+import sys
+
+try:
+    from time import ticks_diff, ticks_us  # MicroPython
+except ImportError:
+    from time import perf_counter
+
+    def ticks_us():
+        return int(perf_counter() * 1000000)
+
+    def ticks_diff(a, b):
+        return a - b
+
+if sys.implementation.name != "micropython":  # CPython, run from the repository
+    import os
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import daikin_accel  # noqa: E402
+import daikin_converters  # noqa: E402
+import daikin_modbus_tcp_bridge  # noqa: E402
+import daikin_serial  # noqa: E402
+
+# (name, accelerated, pure) for the single-buffer functions
+_READERS = (
+    ("read_u_le", "_py_read_u_le"),
+    ("read_u_be", "_py_read_u_be"),
+    ("read_s_le", "_py_read_s_le"),
+    ("read_s_be", "_py_read_s_be"),
+)
+
+failures = []
+
+
+def _rand(state=[0x2545F491]):  # noqa: B006 - xorshift state
+    """Small deterministic PRNG (same numbers on CPython and MicroPython)."""
+
+    x = state[0]
+    x ^= (x << 13) & 0xFFFFFFFF
+    x ^= x >> 17
+    x ^= (x << 5) & 0xFFFFFFFF
+    state[0] = x
+    return x
+
+
+def random_bytes(n):
+    return bytes(_rand() & 0xFF for _ in range(n))
+
+
+def variants(data):
+    """The same bytes as bytes, bytearray and an offset memoryview slice."""
+
+    padded = bytearray(3) + bytearray(data) + bytearray(2)
+    return (data, bytearray(data), memoryview(padded)[3:3 + len(data)])
+
+
+def check(name, fast, slow, *args):
+    a = fast(*args)
+    b = slow(*args)
+    if a != b:
+        failures.append((name, args, a, b))
+        if len(failures) <= 10:
+            print("MISMATCH %s%r: %r != %r" % (name, args, a, b))
+
+
+def check_readers(quick):
+    step = 16 if quick else 1
+    inputs = [b""] + [bytes((i,)) for i in range(256)]
+    inputs += [bytes((i & 0xFF, i >> 8)) for i in range(0, 0x10000, step)]
+    inputs.append(b"\x01\x80\x7f")  # longer field: first two bytes only
+    pairs = [(name, getattr(daikin_accel, name), getattr(daikin_converters, py))
+             for name, py in _READERS]
+    for data in inputs:
+        for view in variants(data):
+            for name, fast, slow in pairs:
+                check(name, fast, slow, view)
+            for flag in (0, 1):
+                check("get_unsigned_value", daikin_accel.get_unsigned_value,
+                      daikin_converters._py_get_unsigned_value, view, flag)
+                check("get_signed_value", daikin_accel.get_signed_value,
+                      daikin_converters._py_get_signed_value, view, flag)
+
+
+def check_buffers():
+    for n in range(0, 258):
+        data = random_bytes(n)
+        for view in variants(data):
+            check("sum_and_invert", daikin_accel.sum_and_invert,
+                  daikin_serial._py_sum_and_invert, view)
+            check("bytes_to_registers", daikin_accel.bytes_to_registers,
+                  daikin_converters._py_bytes_to_registers, view)
+        mv = memoryview(bytearray(data))
+        start = _rand() % (n + 1)
+        end = start + _rand() % (n - start + 1)
+        check("byte_sum", daikin_accel.byte_sum, daikin_serial._py_byte_sum,
+              mv, start, end)
+
+
+def _convert_field(registry_id, offset, payload):
+    if offset % 7 == 0:
+        return None  # converter error
+    return [(registry_id << 8) | offset]
+
+
+def fill(func, start_addr, quantity, fields, payloads):
+    resp = bytearray(2 + 2 * quantity)
+    func(resp, start_addr, quantity, fields, payloads, _convert_field)
+    return bytes(resp)
+
+
+def reference_fill(resp, start_addr, quantity, fields, payloads, convert_field):
+    """Expected FC3 packing, one address at a time (see the bridge docstring)."""
+
+    for i in range(quantity):
+        addr = (start_addr + i) & 0xFFFF
+        registry_id = addr >> 8
+        offset = addr & 0xFF
+        payload = payloads[registry_id]
+        if fields[registry_id] is None:
+            regs = convert_field(registry_id, offset, payload)
+        elif offset in fields[registry_id]:
+            regs = fields[registry_id][offset]
+        else:
+            regs = [payload[offset]] if offset < len(payload) else []
+        value = regs[0] if regs else 0
+        resp[2 + 2 * i] = value >> 8
+        resp[3 + 2 * i] = value & 0xFF
+
+
+def check_fill(requests=300):
+    for _ in range(requests):
+        start_addr = _rand() & 0xFFFF
+        quantity = 1 + _rand() % 125
+        last = (start_addr + quantity - 1) & 0xFFFF
+        payloads = {}
+        fields = {}
+        for reg_id in ((start_addr >> 8) & 0xFF, (last >> 8) & 0xFF):
+            payloads[reg_id] = memoryview(random_bytes(_rand() % 120))
+            if _rand() & 3:
+                decoded = {}
+                for offset in range(0, len(payloads[reg_id]), 2):
+                    if _rand() & 1:
+                        decoded[offset] = [_rand() & 0xFFFF, _rand() & 0xFFFF]
+                fields[reg_id] = decoded
+            else:
+                fields[reg_id] = None
+        args = (start_addr, quantity, fields, payloads)
+        a = fill(daikin_accel.fill_registers, *args)
+        b = fill(reference_fill, *args)
+        if a != b:
+            failures.append(("fill_registers", args, a, b))
+            print("MISMATCH fill_registers at 0x%04X x%d" % (start_addr, quantity))
+
+
+def bench(name, fast, slow, args, repeat):
+    times = []
+    for func in (slow, fast):
+        t0 = ticks_us()
+        for _ in range(repeat):
+            func(*args)
+        times.append(ticks_diff(ticks_us(), t0) / repeat)
+    print("%-20s %10.2f %10.2f %7.1fx" % (name, times[0], times[1],
+                                            times[0] / times[1] if times[1] else 0.0))
+
+
+def run_bench(repeat=1000):
+    frame = memoryview(bytearray(random_bytes(81)))
+    field = memoryview(bytearray(b"\x34\xf2"))
+    start_addr = 0x2000
+    payloads = {0x20: memoryview(random_bytes(60))}
+    decoded = dict((offset, [offset, offset]) for offset in range(0, 60, 2))
+    fields = {0x20: decoded}
+    resp = bytearray(2 + 2 * 64)
+    print("%-20s %10s %10s %8s" % ("function (us/call)", "python", "accel", "speedup"))
+    bench("sum_and_invert", daikin_accel.sum_and_invert,
+          daikin_serial._py_sum_and_invert, (frame,), repeat)
+    bench("byte_sum", daikin_accel.byte_sum, daikin_serial._py_byte_sum,
+          (frame, 3, 80), repeat)
+    bench("bytes_to_registers", daikin_accel.bytes_to_registers,
+          daikin_converters._py_bytes_to_registers, (frame[3:23],), repeat)
+    bench("get_signed_value", daikin_accel.get_signed_value,
+          daikin_converters._py_get_signed_value, (field, 0), repeat)
+    bench("read_s_le", daikin_accel.read_s_le, daikin_converters._py_read_s_le,
+          (field,), repeat)
+    bench("fill_registers (64)", daikin_accel.fill_registers, reference_fill,
+          (resp, start_addr, 64, fields, payloads, _convert_field), repeat // 10)
+    converter_decode = daikin_converters.CONVERSIONS[105].decode
+    t0 = ticks_us()
+    for _ in range(repeat):
+        converter_decode(field)
+    print("convert 105 (in use): %.2f us/call" % (ticks_diff(ticks_us(), t0) / repeat))
+
+
+def main():
+    quick = len(sys.argv) > 1 and sys.argv[1] == "quick"
+    print("daikin_accel %s; in use: sum_and_invert %s, fill_registers %s" % (
+        "native" if daikin_accel.NATIVE else "plain Python (host check)",
+        "accel" if daikin_serial.sum_and_invert is daikin_accel.sum_and_invert else "python",
+        "accel" if daikin_modbus_tcp_bridge._fill_registers is daikin_accel.fill_registers
+        else "python"))
+    check_readers(quick)
+    check_buffers()
+    check_fill()
+    if failures:
+        print("%d mismatches" % len(failures))
+        sys.exit(1)
+    print("parity ok")
+    run_bench()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""Benchmark and parity check of the conv_id dispatch in daikin_converters.
+
+Times :func:`daikin_converters.convert_raw_value` (dispatch table) against
+the ``if``/``elif`` chain it replaced, kept below as
+:func:`legacy_convert_raw_value`, for every conv ID listed in
+``docs/model_conversions.md`` plus the remaining known IDs. Before timing,
+both are run on every 0-, 1- and 2-byte input of every ID and must return
+identical registers (the legacy chain has the ``get_signedValue`` typo of
+conv IDs 403/404 fixed, as the table does, and evaluates the
+pressure->temperature polynomial term by term, as before the Horner form).
+
+It then times ``DaikinConverter.decode_registry`` (one ``struct.unpack_from``
+per registry, see ``RegistryPlan``), with and without ``lookup_tables``,
+against field-by-field decoding for every registry of the EBLA/EDLA model
+JSON, on a random payload, and reports the memory a converter of that model
+retains (``tracemalloc``, with and without labels).
+
+Usage::
+
+    python tools/bench_converters.py [--repeat 20000] [--no-parity]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import re
+import struct
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from daikin_converters import (  # noqa: E402
+    CONVERSIONS,
+    DaikinConverter,
+    _TABLES,
+    _bytes_to_registers,
+    _convert_table200_flag,
+    _convert_table203,
+    _convert_table204,
+    _convert_table217,
+    _convert_table300_flag,
+    _convert_table312,
+    _convert_table315,
+    _convert_table316,
+    convert_raw_value,
+    get_signed_value,
+    get_unsigned_value,
+)
+
+MODEL_CONVERSIONS = ROOT / "docs" / "model_conversions.md"
+MODEL_JSON = ROOT / "altherma_ebla_edla_d_9_16_monobloc.json"
+
+
+def convert_press_to_temp(data: float) -> float:
+    """Term-by-term pressure->temperature polynomial (parity reference)."""
+
+    num = -2.6989493795556e-07 * data ** 6
+    num2 = 4.26383417104661e-05 * data ** 5
+    num3 = -2.62978346547749e-03 * data ** 4
+    num4 = 8.05858127503585e-02 * data ** 3
+    num5 = -1.31924457284073e00 * data ** 2
+    num6 = 1.34157368435437e01 * data
+    num7 = -5.11813342993155e01
+    return num + num2 + num3 + num4 + num5 + num6 + num7
+
+
+def legacy_convert_raw_value(conv_id: int, data: bytes) -> list[int]:
+    """``convert_raw_value`` as an ``if``/``elif`` chain (parity reference)."""
+
+    # Ensure at least two bytes available for index access
+    b = list(data) + [0, 0]
+    d0, d1 = b[0], b[1]
+
+    # ------------------------------------------------------------------
+    # Boolean / string-like converters
+    # ------------------------------------------------------------------
+
+    # convId 200: simple ON/OFF
+    if conv_id == 200:
+        return [0x0001] if _convert_table200_flag(data) else [0x0000]
+
+    # convId 300-307: bit flags -> ON/OFF
+    if conv_id in (300, 301, 302, 303, 304, 305, 306, 307):
+        on = _convert_table300_flag(data, conv_id)
+        return [0x0001] if on else [0x0000]
+
+    # convId 211: OFF or numeric byte
+    if conv_id == 211:
+        if d0 == 0:
+            return [0x0000]
+        # non-zero -> treat as underlying numeric code
+        return _bytes_to_registers(bytes([d0]))
+
+    # Pure string mappings: keep underlying raw codes
+    if conv_id in (203, 204, 217, 315, 316, 100):
+        # 203/204/217/315/316/100 were originally mapped to text; we now
+        # just expose their raw codes/bytes.
+        if conv_id == 203:
+            return _bytes_to_registers(bytes([_convert_table203(data)]))
+        if conv_id == 204:
+            return _bytes_to_registers(bytes([_convert_table204(data)]))
+        if conv_id == 217:
+            return _bytes_to_registers(bytes([_convert_table217(data)]))
+        if conv_id == 315:
+            return _bytes_to_registers(bytes([_convert_table315(data)]))
+        if conv_id == 316:
+            return _bytes_to_registers(bytes([_convert_table316(data)]))
+        # conv_id == 100: raw character bytes
+        return _bytes_to_registers(data)
+
+    # convId 215/216: combine upper and lower nibbles into 16 bits
+    # high nibble -> high 8 bits, low nibble -> low 8 bits.
+    if conv_id in (215, 216):
+        high_nibble = (d0 >> 4) & 0x0F
+        low_nibble = d0 & 0x0F
+        value = (high_nibble << 8) | low_nibble
+        return [value]
+
+    # ------------------------------------------------------------------
+    # Numeric converters (use original scaling, then pack as float32)
+    # ------------------------------------------------------------------
+
+    dbl = None  # numeric result, if any
+
+    # 100-series: signed conversions (except 100 which was handled above)
+    if conv_id == 101:
+        dbl = float(get_signed_value(data, 0))
+    elif conv_id == 102:
+        dbl = float(get_signed_value(data, 1))
+    elif conv_id == 103:
+        dbl = float(get_signed_value(data, 0)) / 256.0
+    elif conv_id == 104:
+        dbl = float(get_signed_value(data, 1)) / 256.0
+    elif conv_id == 105:
+        dbl = float(get_signed_value(data, 0)) * 0.1
+    elif conv_id == 106:
+        dbl = float(get_signed_value(data, 1)) * 0.1
+    elif conv_id == 107:
+        dbl = float(get_signed_value(data, 0)) * 0.1
+    elif conv_id == 108:
+        dbl = float(get_signed_value(data, 1)) * 0.1
+    elif conv_id == 109:
+        dbl = float(get_signed_value(data, 0)) / 256.0 * 2.0
+    elif conv_id == 110:
+        dbl = float(get_signed_value(data, 1)) / 256.0 * 2.0
+    elif conv_id == 111:
+        dbl = float(get_signed_value(data, 1)) * 0.5
+    elif conv_id == 112:
+        dbl = float(get_signed_value(data, 1) - 64) * 0.5
+    elif conv_id == 113:
+        dbl = float(get_signed_value(data, 1)) * 0.25
+    elif conv_id == 114:
+        num2 = (d1 << 8) | d0
+        if d1 & 0x80:
+            num2 = (~(num2 - 1)) & 0xFFFF
+        dbl = ((num2 & 0xFF00) >> 8) + (num2 & 0xFF) / 256.0
+        dbl *= 10.0
+        if d1 & 0x80:
+            dbl *= -1.0
+    elif conv_id == 115:
+        dbl = float(get_signed_value(data, 0)) / 2560.0
+    elif conv_id == 116:
+        dbl = float(get_signed_value(data, 1)) / 2560.0
+    elif conv_id == 117:
+        dbl = float(get_signed_value(data, 0)) * 0.01
+    elif conv_id == 118:
+        dbl = float(get_signed_value(data, 1)) * 0.01
+    elif conv_id == 119:
+        num3 = (d1 << 8) | (d0 & 0x7F)
+        dbl = ((num3 & 0xFF00) >> 8) + (num3 & 0xFF) / 256.0
+
+    # 150-series: unsigned conversions
+    elif conv_id == 151:
+        dbl = float(get_unsigned_value(data, 0))
+    elif conv_id == 152:
+        dbl = float(get_unsigned_value(data, 1))
+    elif conv_id == 153:
+        dbl = float(get_unsigned_value(data, 0)) / 256.0
+    elif conv_id == 154:
+        dbl = float(get_unsigned_value(data, 1)) / 256.0
+    elif conv_id == 155:
+        dbl = float(get_unsigned_value(data, 0)) * 0.1
+    elif conv_id == 156:
+        dbl = float(get_unsigned_value(data, 1)) * 0.1
+    elif conv_id == 157:
+        dbl = float(get_unsigned_value(data, 0)) / 256.0 * 2.0
+    elif conv_id == 158:
+        dbl = float(get_unsigned_value(data, 1)) / 256.0 * 2.0
+    elif conv_id == 161:
+        dbl = float(get_unsigned_value(data, 1)) * 0.5
+    elif conv_id == 162:
+        dbl = float(get_unsigned_value(data, 1) - 64) * 0.5
+    elif conv_id == 163:
+        dbl = float(get_unsigned_value(data, 1)) * 0.25
+    elif conv_id == 164:
+        dbl = float(get_unsigned_value(data, 1)) * 5.0
+    elif conv_id == 165:
+        dbl = float(get_unsigned_value(data, 0) & 0x3FFF)
+
+    # 312: special numeric mapping
+    elif conv_id == 312:
+        dbl = _convert_table312(data)
+
+    # 401-406: pressure -> temperature
+    elif conv_id == 401:
+        dbl = float(get_signed_value(data, 0))
+        dbl = convert_press_to_temp(dbl)
+    elif conv_id == 402:
+        dbl = float(get_signed_value(data, 1))
+        dbl = convert_press_to_temp(dbl)
+    elif conv_id == 403:
+        dbl = float(get_signed_value(data, 0)) / 256.0
+        dbl = convert_press_to_temp(dbl)
+    elif conv_id == 404:
+        dbl = float(get_signed_value(data, 1)) / 256.0
+        dbl = convert_press_to_temp(dbl)
+    elif conv_id == 405:
+        dbl = float(get_signed_value(data, 0)) * 0.1
+        dbl = convert_press_to_temp(dbl)
+    elif conv_id == 406:
+        dbl = float(get_signed_value(data, 1)) * 0.1
+        dbl = convert_press_to_temp(dbl)
+
+    else:
+        # Unknown or unsupported convId: fall back to raw bytes
+        return _bytes_to_registers(data)
+
+    if dbl is None:
+        # Should not happen, but fall back to raw bytes defensively
+        return _bytes_to_registers(data)
+
+    # Pack the numeric value as an IEEE-754 32-bit float and return
+    # it as two 16-bit big-endian registers.
+    hi, lo = struct.unpack("!HH", struct.pack("!f", float(dbl)))
+    return [hi, lo]
+
+
+def documented_conv_ids(path: Path = MODEL_CONVERSIONS) -> list[int]:
+    """Return the conv IDs listed in ``docs/model_conversions.md``."""
+
+    ids = set()
+    for line in path.read_text(encoding="utf-8").splitlines():
+        if line.startswith("`") and line.rstrip().endswith("`"):
+            ids.update(int(tok) for tok in re.findall(r"\d+", line))
+    return sorted(ids)
+
+
+def inputs() -> list[bytes]:
+    """Every 0-, 1- and 2-byte input."""
+
+    return ([b""] + [bytes([i]) for i in range(256)]
+            + [struct.pack("BB", i >> 8, i & 0xFF) for i in range(65536)])
+
+
+def call(fn, conv_id, data):
+    try:
+        return fn(conv_id, data)
+    except IndexError:
+        # Some converters index data[0]; both must fail alike on b""
+        return "IndexError"
+
+
+def check_parity(conv_ids) -> int:
+    """Return the number of (conv_id, input) pairs that differ."""
+
+    mismatches = 0
+    samples = inputs()
+    for conv_id in conv_ids:
+        for data in samples:
+            if call(convert_raw_value, conv_id, data) != call(legacy_convert_raw_value, conv_id, data):
+                if mismatches < 10:
+                    print("MISMATCH conv %d data %s" % (conv_id, data.hex()))
+                mismatches += 1
+    return mismatches
+
+
+def bench(fn, conv_ids, repeat) -> float:
+    """Return ns per call of *fn* over *conv_ids* on a 2-byte input."""
+
+    data = b"\x12\x34"
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for conv_id in conv_ids:
+            fn(conv_id, data)
+    return (time.perf_counter() - t0) * 1e9 / (repeat * len(conv_ids))
+
+
+def decode_fields(converter, reg_id, offsets, payload) -> dict:
+    """Decode the fields at *offsets* one by one with ``convert_field``."""
+
+    convert = converter.convert_field
+    return dict((offset, convert(reg_id, offset, payload)) for offset in offsets)
+
+
+def bench_registries(repeat) -> None:
+    """Time field-by-field, struct-based and table-based decoding per registry."""
+
+    converter = DaikinConverter.from_json_file(str(MODEL_JSON))
+    t0 = time.perf_counter()
+    tabled = DaikinConverter.from_json_file(str(MODEL_JSON), lookup_tables=True)
+    build_s = time.perf_counter() - t0
+    rng = random.Random(1)
+    print()
+    print("%-8s %10s %10s %10s %8s" % ("registry", "fields us", "struct us", "tables us", "speedup"))
+    for reg_id in converter.registry_ids():
+        plan = converter.registry_plan(reg_id)
+        fields = converter.registry_fields(reg_id)
+        offsets = [field[1] for field in fields]
+        end = max(offset + data_size for _, offset, _, data_size, _ in fields)
+        payload = bytes(rng.randrange(256) for _ in range(max(plan.size, end)))
+        expected = decode_fields(converter, reg_id, offsets, payload)
+        if plan.decode(payload) != expected or tabled.decode_registry(reg_id, payload) != expected:
+            raise SystemExit("decode_registry mismatch for registry 0x%02X" % reg_id)
+        times = []
+        for fn in (lambda: decode_fields(converter, reg_id, offsets, payload),
+                   lambda: plan.decode(payload),
+                   lambda: tabled.decode_registry(reg_id, payload)):
+            t0 = time.perf_counter()
+            for _ in range(repeat):
+                fn()
+            times.append((time.perf_counter() - t0) * 1e6 / repeat)
+        print("0x%02X     %10.2f %10.2f %10.2f %7.2fx" % (
+            reg_id, times[0], times[1], times[2], times[0] / min(times[1:])))
+    print("Lookup tables: %d built in %.2f s, %d KiB" % (
+        len(_TABLES), build_s, sum(len(t) * 2 for t in _TABLES.values()) // 1024))
+
+
+def converter_memory(**kwargs) -> int:
+    """Return the bytes retained by a converter of the EBLA/EDLA model JSON."""
+
+    gc.collect()
+    tracemalloc.start()
+    converter = DaikinConverter.from_json_file(str(MODEL_JSON), **kwargs)
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del converter
+    return used
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20000)
+    parser.add_argument("--no-parity", action="store_true", help="skip the exhaustive parity check")
+    args = parser.parse_args()
+
+    documented = documented_conv_ids()
+    all_ids = sorted(set(documented) | set(CONVERSIONS))
+
+    if not args.no_parity:
+        t0 = time.perf_counter()
+        mismatches = check_parity(all_ids)
+        print("Parity: %d conv IDs x %d inputs, %d mismatches (%.1f s)" % (
+            len(all_ids), len(inputs()), mismatches, time.perf_counter() - t0))
+        if mismatches:
+            raise SystemExit(1)
+
+    print("%-8s %10s %10s %8s" % ("conv_id", "chain ns", "table ns", "speedup"))
+    total_old = total_new = 0.0
+    for conv_id in documented:
+        old = bench(legacy_convert_raw_value, [conv_id], args.repeat)
+        new = bench(convert_raw_value, [conv_id], args.repeat)
+        total_old += old
+        total_new += new
+        print("%-8d %10.0f %10.0f %7.2fx" % (conv_id, old, new, old / new))
+    print("%-8s %10.0f %10.0f %7.2fx" % ("mean", total_old / len(documented),
+                                       total_new / len(documented), total_old / total_new))
+    bench_registries(max(args.repeat // 10, 1))
+    print("Converter memory: %d B, %d B with labels=True" % (
+        converter_memory(), converter_memory(labels=True)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Time a full registry sweep: per-registry queries vs. one batch.
+
+Sweeps every registry used by the EBLA/EDLA 9-16kW model JSON against the
+in-process emulated heat pump (`tools/hp_emulator.py`), once with separate
+``DaikinSerial.query_registry`` calls and once with
+``DaikinSerial.query_registries``. Both are bound by the reply latency and
+the wire time of the frames, so the batch is expected to cost the same, not
+less; the figures show that it does not cost more either.
+
+Usage::
+
+    python tools/bench_serial_sweep.py [--sweeps 5] [--latency-ms 40] [--log-baud 115200]
+
+With ``--log-baud`` the driver logs to a console emulated at that baud rate
+(like ``print`` on the ESP32 REPL UART), otherwise logging is disabled.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from daikin_serial import DaikinSerial  # noqa: E402
+from hp_emulator import EmulatedUART  # noqa: E402
+
+MODEL_JSON = ROOT / "altherma_ebla_edla_d_9_16_monobloc.json"
+
+
+def model_registries(path: Path = MODEL_JSON) -> list[int]:
+    """Return the sorted registry IDs carrying data in a model JSON file."""
+
+    with open(path, "r") as f:
+        label_defs = json.load(f)
+    return sorted({int(e["registry_id"]) for e in label_defs if int(e["data_size"]) > 0})
+
+
+def console_logger(baudrate: int):
+    """Return a logger that takes as long as printing to a UART console."""
+
+    def log(msg: str) -> None:
+        # 10 bits per character (8N1) plus the newline
+        time.sleep((len(msg) + 1) * 10.0 / baudrate)
+
+    return log
+
+
+def sweep_single(daikin: DaikinSerial, reg_ids: list[int]) -> None:
+    for reg_id in reg_ids:
+        daikin.query_registry(reg_id)
+
+
+def sweep_batch(daikin: DaikinSerial, reg_ids: list[int]) -> None:
+    daikin.query_registries(reg_ids)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sweeps", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    parser.add_argument("--log-baud", type=int, default=0,
+                        help="emulate a log console at this baud rate (0: logging off)")
+    args = parser.parse_args()
+
+    reg_ids = model_registries()
+    logger = console_logger(args.log_baud) if args.log_baud else False
+    print("Registries: %s" % " ".join("0x%02X" % r for r in reg_ids))
+
+    uart = EmulatedUART(protocol="I", latency_ms=args.latency_ms)
+    daikin = DaikinSerial(uart, protocol="I", logger=logger)
+    try:
+        for name, fn in (("query_registry", sweep_single), ("query_registries", sweep_batch)):
+            wall0 = time.perf_counter()
+            cpu0 = time.thread_time()
+            for _ in range(args.sweeps):
+                fn(daikin, reg_ids)
+            cpu = time.thread_time() - cpu0
+            wall = time.perf_counter() - wall0
+            print("%-18s %8.1f ms/sweep  %6.2f ms CPU/sweep"
+                  % (name, wall * 1000.0 / args.sweeps, cpu * 1000.0 / args.sweeps))
+    finally:
+        uart.close()
+
+
+if __name__ == "__main__":
+    main()
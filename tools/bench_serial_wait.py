@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Compare CPU usage of the DaikinSerial receive wait strategies.
+
+Runs a number of ``query_registry`` calls against the in-process emulated
+heat pump (`tools/hp_emulator.py`) for each ``wait`` strategy and reports
+wall time per query and CPU utilisation of the querying thread.
+
+Usage::
+
+    python tools/bench_serial_wait.py [--queries 50] [--latency-ms 40]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from daikin_serial import DaikinSerial  # noqa: E402
+from hp_emulator import EmulatedUART  # noqa: E402
+
+STRATEGIES = ("sleep", "block", "poll")
+REGISTRIES = (0x10, 0x20, 0x21, 0x30, 0x60, 0x61, 0x62, 0x63, 0x64, 0x65)
+
+
+def run(strategy: str, queries: int, latency_ms: float) -> tuple[float, float]:
+    """Return (wall ms per query, CPU utilisation in percent)."""
+
+    uart = EmulatedUART(protocol="I", latency_ms=latency_ms, timeout_ms=50)
+    daikin = DaikinSerial(uart, protocol="I", logger=False, wait=strategy)
+    try:
+        wall0 = time.perf_counter()
+        cpu0 = time.thread_time()
+        for i in range(queries):
+            daikin.query_registry(REGISTRIES[i % len(REGISTRIES)])
+        cpu = time.thread_time() - cpu0
+        wall = time.perf_counter() - wall0
+    finally:
+        uart.close()
+    return wall * 1000.0 / queries, 100.0 * cpu / wall
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    args = parser.parse_args()
+
+    print("%-8s %14s %8s" % ("wait", "ms/query", "CPU %"))
+    for strategy in STRATEGIES:
+        per_query, cpu = run(strategy, args.queries, args.latency_ms)
+        print("%-8s %14.1f %8.1f" % (strategy, per_query, cpu))
+
+
+if __name__ == "__main__":
+    main()
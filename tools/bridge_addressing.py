@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""Check the registers the Modbus bridge serves for each Daikin address.
+
+Holding register ``(registry_id << 8) | offset`` must serve what it served
+before fields sharing an offset were kept: the field declared *last* at that
+offset, converted with ``convert_raw_value`` (bit flags as 0/1), the raw
+payload byte where no field is declared and 0 past the payload. The
+reference below is that original ``dict``-based lookup, except at offsets
+where several bit flags (300-307) are declared and the last one is a flag:
+those serve the flag byte, masked to the declared bits, so every flag of
+the byte is read at once.
+
+Runs :meth:`DaikinModbusTCPBridge._handle_read_holding_registers` on a
+stand-in heat pump for every registry of the EBLA/EDLA model, with the
+converter built from the JSON, the binary model, the frozen module and with
+lookup tables, and checks that the frozen module decodes every registry
+exactly like the binary model file. The checks are plain ``test_*`` functions with ``assert``,
+so pytest collects them too; run as a script, it exits non-zero on any
+failure. No board is needed.
+
+Usage::
+
+    python tools/bridge_addressing.py
+    python -m pytest tools/bridge_addressing.py
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import struct
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import altherma_ebla_edla_d_9_16_monobloc_frozen as frozen_model  # noqa: E402
+from daikin_converters import DaikinConverter, convert_raw_value  # noqa: E402
+from daikin_modbus_tcp_bridge import DaikinModbusTCPBridge  # noqa: E402
+
+MODEL_JSON = ROOT / "altherma_ebla_edla_d_9_16_monobloc.json"
+MODEL_FILE = ROOT / "altherma_ebla_edla_d_9_16_monobloc.dkm"
+
+# Payload of every registry: bytes 0, 1, 2, ... (long enough for any field)
+RAMP = bytes(range(256))[:120]
+
+
+class StubDaikin:
+    """Heat pump stand-in answering every registry with a fixed payload.
+
+    Like ``DaikinSerial``, each reply is a memoryview into one receive
+    buffer that the next query overwrites.
+    """
+
+    def __init__(self, payloads, default=RAMP):
+        self.payloads = payloads
+        self.default = default
+        self._buf = bytearray(256)
+
+    def query_registry_into(self, reg_id):
+        payload = self.payloads.get(reg_id, self.default)
+        self._buf[:len(payload)] = payload
+        return memoryview(self._buf)[:len(payload)]
+
+
+def label_defs():
+    with open(MODEL_JSON, "r") as f:
+        return [e for e in json.load(f) if int(e.get("data_size", 0)) > 0]
+
+
+def reference_fields(defs):
+    """``(registry_id, offset) -> [(conv_id, data_size), ...]`` in declaration order."""
+
+    fields = {}
+    for e in defs:
+        key = (int(e["registry_id"]) & 0xFF, int(e["offset"]) & 0xFF)
+        fields.setdefault(key, []).append((int(e["conv_id"]), int(e["data_size"])))
+    return fields
+
+
+def reference_mask(group):
+    """Declared bits of a shared flag byte (primary and another field are flags), else 0."""
+
+    bits = [conv_id % 10 for conv_id, data_size in group
+            if 300 <= conv_id <= 307 and data_size == 1]
+    conv_id, data_size = group[-1]
+    if len(bits) < 2 or not (300 <= conv_id <= 307 and data_size == 1):
+        return 0
+    return sum(set(1 << bit for bit in bits))
+
+
+def reference_register(fields, reg_id, offset, payload):
+    """First register served at ``(reg_id, offset)``: the original bridge lookup."""
+
+    group = fields.get((reg_id, offset))
+    if offset >= len(payload):
+        return 0
+    if group is None:
+        return payload[offset]
+    mask = reference_mask(group)
+    if mask:
+        return payload[offset] & mask
+    conv_id, data_size = group[-1]  # last declared, as the original dict
+    regs = convert_raw_value(conv_id, payload[offset:offset + data_size])
+    return regs[0] if regs else 0
+
+
+def read(bridge, addr, quantity):
+    """Return the registers of an FC3 read (asserts it is not an exception)."""
+
+    pdu = bridge._handle_read_holding_registers(struct.pack(">BHH", 3, addr, quantity))
+    assert pdu[0] == 3, "exception 0x%02X at 0x%04X" % (pdu[1], addr)
+    return list(struct.unpack(">%dH" % quantity, pdu[2:]))
+
+
+def converters():
+    return (
+        ("json", DaikinConverter.from_json_file(str(MODEL_JSON))),
+        ("model file", DaikinConverter.from_model_file(str(MODEL_FILE), labels=False)),
+        ("frozen module", DaikinConverter.from_model_module(frozen_model, labels=False)),
+        ("lookup tables", DaikinConverter.from_json_file(str(MODEL_JSON), lookup_tables=True)),
+    )
+
+
+def payload_sets():
+    rng = random.Random(1)
+    yield {}
+    yield dict((reg_id, bytes(rng.randrange(256) for _ in range(250))) for reg_id in range(256))
+    # Short payloads: fields past the end read as 0
+    yield dict((reg_id, RAMP[:13]) for reg_id in range(256))
+
+
+def check_registries(converter, fields, payloads):
+    bridge = DaikinModbusTCPBridge(StubDaikin(payloads), converter, logger=False)
+    for reg_id in sorted(set(k[0] for k in fields)):
+        # The last range spans into the next registry
+        for start, quantity in ((0, 125), (125, 125), (250, 6), (200, 125)):
+            addr = (reg_id << 8) | start
+            got = read(bridge, addr, quantity)
+            for i, g in enumerate(got):
+                reg, offset = ((addr + i) >> 8) & 0xFF, (addr + i) & 0xFF
+                e = reference_register(fields, reg, offset, payloads.get(reg, RAMP))
+                assert g == e, "0x%02X/%d: 0x%04X != 0x%04X" % (reg, offset, g, e)
+
+
+def test_primary_addresses():
+    """Every address serves the last declared field (or the shared flag byte)."""
+
+    fields = reference_fields(label_defs())
+    for name, converter in converters():
+        for payloads in payload_sets():
+            try:
+                check_registries(converter, fields, payloads)
+            except AssertionError as exc:
+                raise AssertionError("%s: %s" % (name, exc))
+
+
+def test_pinned_addresses():
+    """Addresses with several fields, pinned to the original bridge output (ramp payload)."""
+
+    bridge = DaikinModbusTCPBridge(StubDaikin({}), DaikinConverter.from_json_file(
+        str(MODEL_JSON)), logger=False)
+    pinned = (
+        (0x2000 | 12, 0xCD58),  # High Pressure(T) 405, not High Pressure 105
+        (0x2000 | 14, 0xCE09),  # Low Pressure(T) 405
+        (0x6300 | 16, 0x4100),  # CT L3 current 161 (16 * 0.5), not the 307 flag
+        (0x6000 | 2, 0x0002),   # 300-303 flags: byte 2 & 0x0F
+        (0x6400 | 2, 0x0002),   # 301-303 flags: byte 2 & 0x0E
+        (0x6400 | 9, 0x0000),   # 301-302 flags: byte 9 & 0x06
+        (0x1000 | 10, 0x000A),  # Comp. INV Current Protection Retry Qty, 311: raw byte
+        (0x1000 | 11, 0x000B),  # LP Protection Retry Qty, 311
+        (0x1000 | 12, 0x000C),  # Not in use, 311
+        (0x1000 | 1, 0x0001),   # 300-307 flags: byte 1
+        (0x3000 | 13, 0x0000),  # 305-307 flags: byte 13 & 0xE0
+        (0x0000 | 0, 0x0000),   # In-Out separator, 998: raw bytes
+    )
+    for addr, expected in pinned:
+        got = read(bridge, addr, 1)[0]
+        assert got == expected, "0x%04X: 0x%04X != 0x%04X" % (addr, got, expected)
+
+
+def test_flag_bytes():
+    """A shared flag byte is one register holding every declared flag."""
+
+    converter = DaikinConverter.from_json_file(str(MODEL_JSON))
+    payload = bytearray(RAMP)
+    payload[1] = 0xA5
+    payload[13] = 0xFF
+    bridge = DaikinModbusTCPBridge(StubDaikin({0x10: payload, 0x30: payload}), converter,
+                                   logger=False)
+    assert read(bridge, 0x1000 | 1, 1) == [0x00A5]
+    assert converter.flag_mask(0x10, 1) == 0xFF
+    assert [v for _, v in converter.decode_flags(0x10, 1, payload)] == [1, 0, 1, 0, 0, 1, 0, 1]
+    assert read(bridge, 0x3000 | 13, 1) == [0x00E0]
+    assert converter.flag_mask(0x30, 13) == 0xE0
+    # A numeric primary field keeps its offset; a lone flag reads 0 or 1
+    assert converter.flag_mask(0x63, 16) == 0
+    assert converter.flag_mask(0x10, 10) == 0
+    assert converter.field_format(0x10, 1)[0] == "flags"
+
+
+class StubConnection:
+    """Socket stand-in replaying Modbus TCP requests and recording replies."""
+
+    def __init__(self, requests):
+        self.requests = list(requests)
+        self.sent = []
+
+    def recv(self, n):
+        return self.requests.pop(0) if self.requests else b""
+
+    def send(self, data):
+        self.sent.append(bytes(data))
+        return len(data)
+
+
+def test_unit_ids():
+    """Only the configured unit ID is answered, and echoed."""
+
+    converter = DaikinConverter.from_json_file(str(MODEL_JSON))
+    bridge = DaikinModbusTCPBridge(StubDaikin({}), converter, unit_id=1, logger=False)
+
+    def request(trans_id, unit, addr):
+        pdu = struct.pack(">BHH", 3, addr, 1)
+        return struct.pack(">HHHB", trans_id, 0, len(pdu) + 1, unit) + pdu
+
+    conn = StubConnection([request(1, 1, 0x2000 | 12), request(2, 2, 0x2000 | 12),
+                           request(3, 0, 0x2000 | 12), request(4, 1, 0x1000 | 1)])
+    bridge._handle_client(conn)
+    replies = dict((struct.unpack(">H", r[:2])[0], r) for r in conn.sent)
+    assert sorted(replies) == [1, 4], sorted(replies)
+    assert replies[1][6] == 1 and replies[1][9:11] == b"\xcd\x58"
+    assert replies[4][6] == 1 and replies[4][9:11] == b"\x00\x01"
+
+
+def test_decode_flags():
+    """All flags of a byte are split from one read, in declaration order."""
+
+    converter = DaikinConverter.from_json_file(str(MODEL_JSON), labels=True)
+    payload = bytearray(RAMP)
+    payload[10] = 0x88  # bits 7 and 3
+    assert converter.decode_flags(0x10, 10, payload) == [
+        ("Discharge Temp. Drop", 1), ("Comp. INV Current Drop", 1)]
+    payload[2] = 0x0A  # bits 3 and 1
+    assert converter.decode_flags(0x60, 2, payload) == [
+        ("Ext. Thermostat ON/OFF", 1), ("Freeze Protection", 0), ("Silent Mode", 1),
+        ("Freeze Protection for water piping", 0)]
+    assert converter.decode_flags(0x20, 12, payload) == []
+    assert converter.decode_flags(0x60, 2, payload[:2]) == []
+
+
+def test_frozen_module_parity():
+    """The frozen module holds the .dkm records and decodes like ``from_model_file``."""
+
+    assert bytes(frozen_model.MODEL) == MODEL_FILE.read_bytes()
+    module = DaikinConverter.from_model_module(frozen_model, labels=True)
+    model = DaikinConverter.from_model_file(str(MODEL_FILE), labels=True)
+    assert module.registry_ids() == model.registry_ids()
+    payloads = [bytes(256), b"\xff" * 256, RAMP, RAMP[:13]]
+    for payload_set in payload_sets():
+        payloads.extend(payload_set.values())
+    for reg_id in range(256):
+        assert module.registry_fields(reg_id) == model.registry_fields(reg_id), hex(reg_id)
+        for payload in payloads:
+            for start, stop in ((0, 256), (10, 20)):
+                got = module.decode_registry(reg_id, payload, start, stop)
+                expected = model.decode_registry(reg_id, payload, start, stop)
+                assert got == expected, "0x%02X [%d:%d]: %r != %r" % (
+                    reg_id, start, stop, got, expected)
+
+
+TESTS = (
+    test_primary_addresses,
+    test_pinned_addresses,
+    test_flag_bytes,
+    test_unit_ids,
+    test_decode_flags,
+    test_frozen_module_parity,
+)
+
+
+def main() -> int:
+    failed = 0
+    for test in TESTS:
+        try:
+            test()
+        except AssertionError as exc:
+            failed += 1
+            print("FAIL %s: %s" % (test.__name__, exc))
+        else:
+            print("ok   %s" % test.__name__)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
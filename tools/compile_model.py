@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""Compile a model JSON or include/def header into a binary model file.
+
+The output is read by ``DaikinConverter.from_model_file`` (see
+``iter_model_file`` in ``daikin_converters``): a 10-byte header, one UTF-8
+label table (each distinct label stored once) and an 8-byte record per
+field::
+
+    header  "<4sBBHH"  magic b"DKMB", version, record size, records, label table size
+    labels  UTF-8 bytes
+    record  "<BBHBBH"  registry_id, offset, conv_id, data_size, label length, label offset
+
+Rows with ``data_size <= 0`` (markers such as ``NextDataGrid``) are dropped,
+as ``DaikinConverter`` ignores them; record order is declaration order, so
+the primary field of a shared offset stays the same. Header rows that are
+commented out are included, as in the model JSON, unless ``--active-only``.
+
+``--compare`` loads the result and the JSON (or header) both ways and
+reports startup time and peak ``tracemalloc`` memory of building the
+converter.
+
+Usage::
+
+    python tools/compile_model.py altherma_ebla_edla_d_9_16_monobloc.json
+    python tools/compile_model.py "include/def/PROTOCOL_S.h" -o protocol_s.dkm
+        [--active-only] [--compare]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import struct
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from convert_altherma_header import parse_row  # noqa: E402
+from daikin_converters import (  # noqa: E402
+    MODEL_HEADER_FMT,
+    MODEL_MAGIC,
+    MODEL_RECORD_FMT,
+    MODEL_RECORD_SIZE,
+    MODEL_VERSION,
+    DaikinConverter,
+    iter_model_file,
+)
+
+
+def read_json_rows(path: Path) -> list:
+    """Return ``[(registry_id, offset, conv_id, data_size, label)]`` of a model JSON."""
+
+    rows = []
+    for entry in json.loads(path.read_text(encoding="utf-8")):
+        rows.append((int(entry["registry_id"]), int(entry["offset"]),
+                     int(entry["conv_id"]), int(entry.get("data_size", 0)),
+                     entry.get("label") or ""))
+    return rows
+
+
+def read_header_rows(path: Path, active_only: bool = False) -> list:
+    """Return ``[(registry_id, offset, conv_id, data_size, label)]`` of a model header."""
+
+    rows = []
+    for line in path.read_text(encoding="utf-8", errors="replace").splitlines():
+        if active_only and line.lstrip().startswith("//"):
+            continue
+        row = parse_row(line)
+        if row is not None:
+            reg_id, offset, conv_id, data_size, _data_type, label = row
+            rows.append((reg_id, offset, conv_id, data_size, label))
+    return rows
+
+
+def pack_model(rows) -> bytes:
+    """Return the binary model file for *rows* (see the module docstring)."""
+
+    labels = bytearray()
+    label_at = {}
+    records = bytearray()
+    count = 0
+    for reg_id, offset, conv_id, data_size, label in rows:
+        if data_size <= 0:
+            continue
+        if not (0 <= reg_id <= 0xFF and 0 <= offset <= 0xFF
+                and 0 <= conv_id <= 0xFFFF and data_size <= 0xFF):
+            raise ValueError("field out of range: %r" % ((reg_id, offset, conv_id, data_size),))
+        # At most 255 bytes, cut at a character boundary
+        encoded = label.encode("utf-8")[:0xFF].decode("utf-8", "ignore").encode("utf-8")
+        at = label_at.get(encoded)
+        if at is None:
+            at = label_at[encoded] = len(labels)
+            labels += encoded
+        records += struct.pack(MODEL_RECORD_FMT, reg_id, offset, conv_id,
+                               data_size, len(encoded), at)
+        count += 1
+    if len(labels) > 0xFFFF or count > 0xFFFF:
+        raise ValueError("model too large for the binary format")
+    header = struct.pack(MODEL_HEADER_FMT, MODEL_MAGIC, MODEL_VERSION,
+                         MODEL_RECORD_SIZE, count, len(labels))
+    return header + bytes(labels) + bytes(records)
+
+
+def measure(load, repeat: int = 20):
+    """Return ``(result, ms per load, peak bytes)`` of ``load()``."""
+
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        converter = load()
+    ms = (time.perf_counter() - t0) * 1000.0 / repeat
+    tracemalloc.start()
+    converter = load()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return converter, ms, peak
+
+
+def compare(source: Path, out: Path) -> None:
+    """Print startup time and peak memory of the source vs. the binary model."""
+
+    if source.suffix == ".json":
+        source_load = lambda: DaikinConverter.from_json_file(str(source))  # noqa: E731
+    else:
+        source_load = lambda: DaikinConverter(  # noqa: E731
+            [dict(zip(("registry_id", "offset", "conv_id", "data_size", "label"), r))
+             for r in read_header_rows(source)])
+    loads = (
+        (source.name, source_load),
+    )
+    if source.suffix == ".json":
+        loads += ((source.name + " (json.load)", lambda: DaikinConverter(
+            json.loads(source.read_text(encoding="utf-8")))),)
+    loads += (
+        (out.name, lambda: DaikinConverter.from_model_file(str(out))),
+        (out.name + " (labels)",
+         lambda: DaikinConverter.from_model_file(str(out), labels=True)),
+    )
+    results = [(name,) + measure(load) for name, load in loads]
+    reference = results[0][1]
+    payload = bytes(range(256))
+    print("%-48s %9s %11s" % ("source", "ms/load", "peak bytes"))
+    for name, converter, ms, peak in results:
+        for reg_id in reference.registry_ids():
+            assert converter.decode_registry(reg_id, payload) == \
+                reference.decode_registry(reg_id, payload), (name, reg_id)
+        print("%-48s %9.2f %11d" % (name, ms, peak))
+
+    # Reading the rows alone, without building the converter
+    if source.suffix == ".json":
+        source_rows = lambda: json.loads(source.read_text(encoding="utf-8"))  # noqa: E731
+    else:
+        source_rows = lambda: read_header_rows(source)  # noqa: E731
+    for name, load in ((source.name + " (rows only)", source_rows),
+                       (out.name + " (rows only)",
+                        lambda: sum(1 for _ in iter_model_file(str(out))))):
+        _, ms, peak = measure(load)
+        print("%-48s %9.2f %11d" % (name, ms, peak))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", help="model JSON or include/def header")
+    parser.add_argument("-o", "--output",
+                        help="binary model file (default: source with .dkm suffix)")
+    parser.add_argument("--active-only", action="store_true",
+                        help="header: skip commented-out rows")
+    parser.add_argument("--compare", action="store_true",
+                        help="compare startup time and peak memory with the source")
+    args = parser.parse_args()
+
+    source = Path(args.source)
+    if source.suffix == ".json":
+        rows = read_json_rows(source)
+    else:
+        rows = read_header_rows(source, args.active_only)
+    if not rows:
+        raise SystemExit("no label definitions found in %s" % source)
+
+    out = Path(args.output) if args.output else source.with_suffix(".dkm")
+    data = pack_model(rows)
+    out.write_bytes(data)
+    print("%s: %d fields, %d bytes (%s: %d bytes)" % (
+        out, struct.unpack_from(MODEL_HEADER_FMT, data)[3], len(data),
+        source.name, source.stat().st_size))
+    if args.compare:
+        compare(source, out)
+
+
+if __name__ == "__main__":
+    main()
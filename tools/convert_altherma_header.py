@@ -10,23 +10,47 @@ Commented-out rows in the C++ header are **included** as well; the leading
 
 The output is written to a *temporary* filename so as not to overwrite the
 existing `altherma_ebla_edla_d_9_16_monobloc.py` file.
+
+With ``--frozen``, it instead emits a model module for MicroPython, to be
+frozen into the firmware or compiled with ``mpy-cross``. It is built from
+the model JSON (``--json``), through ``read_json_rows`` of
+``tools/compile_model.py``, so it holds the same records as the ``.dkm``
+compiled from that JSON:
+
+- ``MODEL``: the binary model (see ``tools/compile_model.py``) as one
+  ``bytes`` constant, which stays in flash when frozen, instead of a list
+  of tuples built on the heap at import;
+- ``DECODERS``: registry ID -> straight-line decode function, one per
+  registry, with the offsets, byte order and scaling of every field
+  written out as constants and the float32 results packed at once.
+
+Load it with ``DaikinConverter.from_model_module(module)``.
+
+Usage::
+
+    python tools/convert_altherma_header.py [--header PATH] [--out PATH]
+    python tools/convert_altherma_header.py --frozen [--json PATH] [--out PATH]
 """
 
 from __future__ import annotations
 
+import argparse
 import re
+import sys
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 HEADER = ROOT / "include" / "def" / "Altherma(EBLA-EDLA D series 9-16kW Monobloc).h"
+MODEL_JSON = ROOT / "altherma_ebla_edla_d_9_16_monobloc.json"
 OUT_PY = ROOT / "altherma_ebla_edla_d_9_16_monobloc_generated.py"
+OUT_FROZEN = ROOT / "altherma_ebla_edla_d_9_16_monobloc_frozen.py"
 
 # C++ row pattern, e.g.:
 #   {0x20,0,105,2,1,"Outdoor air temp.(R1T)"},
 # or commented:
 #   //{0x00,0,802,0,-1,"*Refrigerant type"},
 ROW_RE = re.compile(
-    r"^\s*//?\{\s*"  # optional leading // then '{'
+    r"^\s*(?://)?\{\s*"  # optional leading // then '{'
     r"([^}]*)"         # inner comma-separated fields
     r"\}\s*,?"        # closing '}' and optional comma
 )
@@ -99,15 +123,192 @@ def convert_header_to_python(header: Path, out_path: Path) -> None:
     out_path.write_text("\n".join(lines), encoding="utf-8")
 
 
+def _read_expr(o: int, data_size: int, spec) -> str:
+    """Return the expression reading the raw integer of a numeric field at offset *o*."""
+
+    if data_size == 1:
+        # A single byte is never sign-extended (see get_signed_value)
+        return "p[%d]" % o
+    if spec.big_endian:
+        expr = "(p[%d] << 8 | p[%d])" % (o, o + 1)
+    else:
+        expr = "(p[%d] << 8 | p[%d])" % (o + 1, o)
+    if spec.signed:
+        expr = "((%s ^ 0x8000) - 0x8000)" % expr
+    return expr
+
+
+def field_expression(field, flag_mask: int = 0) -> str:
+    """Return a Python expression decoding *field* from payload ``p``.
+
+    *field* is a ``(registry_id, offset, conv_id, data_size, label)``
+    record, as from ``DaikinConverter.registry_fields``.
+    Mirrors :class:`daikin_converters.ConvSpec` for the numeric and flag
+    rules, in the same operation order so the float32 results are
+    bit-identical; the other rules call ``convert_raw_value``. A non-zero
+    *flag_mask* (see ``DaikinConverter.flag_mask``) serves the masked flag
+    byte instead.
+    """
+
+    from daikin_converters import (
+        CONVERSIONS,
+        FLAG_CONV_IDS,
+        SHAPE_BYTES,
+        SHAPE_FLOAT32,
+    )
+
+    _, o, conv_id, data_size, _ = field
+    e = o + data_size
+    spec = CONVERSIONS.get(conv_id)
+    if spec is None or spec.shape == SHAPE_BYTES:
+        return "_b(p[%d:%d])" % (o, e)
+    if flag_mask:
+        return "[p[%d] & 0x%02X]" % (o, flag_mask)
+    if conv_id in FLAG_CONV_IDS:
+        return "[p[%d] >> %d & 1]" % (o, conv_id % 10)
+    if conv_id == 200:
+        return "[1 if p[%d] else 0]" % o
+    if conv_id in (211, 217):
+        return "[p[%d]]" % o
+    if spec.shape != SHAPE_FLOAT32 or spec.func is not None or spec.post is not None:
+        # Lookup-style rules, and 401-406 (see use_press_to_temp_table)
+        return "_c(%d, p[%d:%d])" % (conv_id, o, e)
+
+    expr = _read_expr(o, data_size, spec)
+    if spec.mask is not None:
+        expr = "(%s & 0x%X)" % (expr, spec.mask)
+    if spec.offset:
+        expr = "(%s - %d)" % (expr, spec.offset)
+    expr = "float(%s)" % expr
+    if spec.div is not None:
+        expr += " / %r" % spec.div
+    if spec.mul is not None:
+        expr += " * %r" % spec.mul
+    return "_f(%s)" % expr
+
+
+def _float_arg(expr: str):
+    """Return the float argument of a ``_f(...)`` expression, else ``None``."""
+
+    if expr.startswith("_f(") and expr.endswith(")"):
+        return expr[3:-1]
+    return None
+
+
+def _bytes_chunks(data: bytes, width: int):
+    """Split *data* into pieces whose ``repr`` is at most *width* characters."""
+
+    start = 0
+    while start < len(data):
+        end = start + 1
+        while end < len(data) and len(repr(data[start:end + 1])) <= width:
+            end += 1
+        yield data[start:end]
+        start = end
+
+
+def convert_json_to_frozen_module(source: Path, out_path: Path) -> None:
+    """Write the ``MODEL`` / ``DECODERS`` module of a model JSON (see ``--frozen``)."""
+
+    sys.path.insert(0, str(ROOT))
+    from compile_model import pack_model, read_json_rows
+    from daikin_converters import DaikinConverter, iter_model_bytes
+
+    model = pack_model(read_json_rows(source))
+    converter = DaikinConverter(iter_model_bytes(model))
+
+    lines = []
+    lines.append('"""Frozen model module for %s.' % source.name)
+    lines.append("")
+    lines.append("Generated by tools/convert_altherma_header.py --frozen; load with")
+    lines.append("``DaikinConverter.from_model_module``. DO NOT EDIT BY HAND.")
+    lines.append('"""')
+    lines.append("")
+    body = []
+    body.append("# Binary model (tools/compile_model.py format): stays in flash when frozen")
+    body.append("MODEL = (")
+    for chunk in _bytes_chunks(model, 100 - 4):
+        body.append("    %r" % chunk)
+    body.append(")")
+
+    names = []
+    for reg_id in converter.registry_ids():
+        fields = converter.registry_fields(reg_id)
+        name = "_decode_0x%02X" % reg_id
+        names.append((reg_id, name))
+        body.append("")
+        body.append("")
+        body.append("def %s(p, start, stop):" % name)
+        body.append("    if len(p) < %d:" % max(f[1] + f[3] for f in fields))
+        body.append("        return None")
+        exprs = [field_expression(f, converter.flag_mask(reg_id, f[1])) for f in fields]
+        floats = [_float_arg(expr) for expr in exprs]
+        n_floats = len(floats) - floats.count(None)
+        if n_floats > 1:
+            # All float32 results in one pack, as RegistryPlan does
+            args = [arg for arg in floats if arg is not None]
+            body.append('    f = _pack(">%df",' % n_floats)
+            for arg in args[:-1]:
+                body.append("              %s," % arg)
+            body.append("              %s)" % args[-1])
+        body.append("    r = {}")
+        i = 0
+        for f, expr, arg in zip(fields, exprs, floats):
+            if arg is not None and n_floats > 1:
+                expr = "[f[%d] << 8 | f[%d], f[%d] << 8 | f[%d]]" % (i, i + 1, i + 2, i + 3)
+                i += 4
+            body.append("    if start <= %d < stop:" % f[1])
+            body.append("        r[%d] = %s" % (f[1], expr))
+        body.append("    return r")
+
+    body.append("")
+    body.append("")
+    body.append("# registry_id -> decoder of a complete payload (None if it is shorter)")
+    body.append("DECODERS = {")
+    for reg_id, name in names:
+        body.append("    0x%02X: %s," % (reg_id, name))
+    body.append("}")
+    body.append("")
+
+    # Import only the helpers the decoders use
+    code = "\n".join(body)
+    if "_pack(" in code:
+        lines.append("from struct import pack as _pack")
+        lines.append("")
+    for alias, helper in (("_b", "_bytes_to_registers"), ("_f", "_float_registers"),
+                          ("_c", "convert_raw_value")):
+        if alias + "(" in code:
+            lines.append("from daikin_converters import %s as %s" % (helper, alias))
+    lines.append("")
+    lines.extend(body)
+
+    out_path.write_text("\n".join(lines), encoding="utf-8")
+
+
 def main() -> None:
-    if not HEADER.exists():
-        raise SystemExit(f"Header not found: {HEADER}")
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--header", default=str(HEADER), help="model header in include/def")
+    parser.add_argument("--json", default=str(MODEL_JSON),
+                        help="model JSON of the --frozen module (as compiled to .dkm)")
+    parser.add_argument("--out", help="output module (default: %s or %s)" % (
+        OUT_PY.name, OUT_FROZEN.name))
+    parser.add_argument("--frozen", action="store_true",
+                        help="emit a MODEL bytes / DECODERS module for freezing or .mpy")
+    args = parser.parse_args()
+
+    source = Path(args.json if args.frozen else args.header)
+    if not source.exists():
+        raise SystemExit(f"{'Model JSON' if args.frozen else 'Header'} not found: {source}")
+    out = Path(args.out) if args.out else (OUT_FROZEN if args.frozen else OUT_PY)
 
-    if OUT_PY.exists():
-        print(f"NOTE: {OUT_PY.name} already exists and will be overwritten.")
+    if out.exists():
+        print(f"NOTE: {out.name} already exists and will be overwritten.")
 
-    convert_header_to_python(HEADER, OUT_PY)
-    print(f"Wrote {OUT_PY}")
+    if args.frozen:
+        convert_json_to_frozen_module(source, out)
+    else:
+        convert_header_to_python(source, out)
+    print(f"Wrote {out}")
 
 
 if __name__ == "__main__":
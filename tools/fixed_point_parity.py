@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Parity check and benchmark of the fixed-point converter output.
+
+Checks ``output=OUTPUT_FIXED`` against the float32 registers it replaces:
+
+- every numeric conv ID on every 1- and 2-byte input: the integer of
+  ``get_fixed_decoder`` (read back as the int16/uint16/int32 of
+  ``fixed_format``) must be the float32 value times ``10 ** decimals``
+  within rounding (401-406 saturated to int16),
+- a model JSON built with both outputs: for every registry and a set of
+  payloads, each field of ``decode_registry`` in fixed output against
+  ``convert_field`` of the same converter and against the float32 field
+  scaled by its ``field_format``.
+
+Any difference is reported and makes the script exit non-zero. Then it
+counts the registers of the model in both outputs and times
+``decode_registry`` over every registry. Like ``tools/accel_parity.py`` it
+only uses ``sys.argv`` so it also runs on a board (``daikin_converters.py``
+and the model JSON next to it), where the timings that matter come from.
+``quick`` checks every 16th 2-byte input instead of all of them.
+
+Usage::
+
+    python tools/fixed_point_parity.py [MODEL_JSON] [quick]
+    mpremote run tools/fixed_point_parity.py
+"""
+
+import struct
+import sys
+
+try:
+    from time import ticks_diff, ticks_us  # MicroPython
+except ImportError:
+    from time import perf_counter
+
+    def ticks_us():
+        return int(perf_counter() * 1000000)
+
+    def ticks_diff(a, b):
+        return a - b
+
+if sys.implementation.name != "micropython":  # CPython, run from the repository
+    import os
+
+    ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, ROOT)
+    DEFAULT_MODEL = os.path.join(ROOT, "altherma_ebla_edla_d_9_16_monobloc.json")
+else:  # MicroPython, files side by side on the board
+    DEFAULT_MODEL = "altherma_ebla_edla_d_9_16_monobloc.json"
+
+from daikin_converters import (  # noqa: E402
+    CONVERSIONS,
+    OUTPUT_FIXED,
+    PRESS_CONV_IDS,
+    SHAPE_FLOAT32,
+    SHAPE_INT16,
+    SHAPE_INT32,
+    SHAPE_UINT16,
+    DaikinConverter,
+    convert_raw_value,
+    fixed_format,
+    get_fixed_decoder,
+)
+
+failures = []
+
+
+def report(name, args, got, expected):
+    failures.append((name, args, got, expected))
+    if len(failures) <= 10:
+        print("MISMATCH %s%r: %r != %r" % (name, args, got, expected))
+
+
+def fixed_value(shape, regs):
+    """Return the integer held by fixed-point *regs* of *shape*."""
+
+    if shape == SHAPE_INT32:
+        v = (regs[0] << 16) | regs[1]
+        return v - 0x100000000 if v & 0x80000000 else v
+    if shape == SHAPE_INT16:
+        return regs[0] - 0x10000 if regs[0] & 0x8000 else regs[0]
+    return regs[0]
+
+
+def float_value(regs):
+    """Return the float held by two float32 registers."""
+
+    return struct.unpack(">f", struct.pack(">HH", regs[0], regs[1]))[0]
+
+
+def close(n, x):
+    """True if the integer *n* is *x* rounded (float32 error allowed)."""
+
+    return abs(n - x) <= 0.5 + abs(x) / 4194304.0
+
+
+def check_conversions(quick):
+    step = 16 if quick else 1
+    for conv_id in sorted(CONVERSIONS):
+        if CONVERSIONS[conv_id].shape != SHAPE_FLOAT32:
+            continue
+        for size in (1, 2):
+            shape, decimals = fixed_format(conv_id, size)
+            decode = get_fixed_decoder(conv_id, size)
+            scale = 10 ** decimals
+            if size == 1:
+                inputs = [bytes((v,)) for v in range(256)]
+            else:
+                inputs = [bytes((v & 0xFF, v >> 8)) for v in range(0, 0x10000, step)]
+            for data in inputs:
+                regs = decode(data)
+                if len(regs) != (2 if shape == SHAPE_INT32 else 1):
+                    report("registers", (conv_id, data), regs, shape)
+                    continue
+                x = float_value(convert_raw_value(conv_id, data)) * scale
+                if conv_id in PRESS_CONV_IDS:
+                    x = -32768.0 if x < -32768.0 else (32767.0 if x > 32767.0 else x)
+                n = fixed_value(shape, regs)
+                if not close(n, x):
+                    report("fixed %d" % conv_id, (data,), n, x)
+
+
+def payloads():
+    """A few full registry payloads: ramps, all 0x00, all 0xFF, 0x80s."""
+
+    return (bytes(range(256)), bytes(255 - i for i in range(256)), bytes(256),
+            b"\xff" * 256, b"\x80\x7f" * 128, bytes((i * 37) & 0xFF for i in range(256)))
+
+
+def check_model(fixed, floats):
+    for payload in payloads():
+        for reg_id in fixed.registry_ids():
+            decoded = fixed.decode_registry(reg_id, payload)
+            reference = floats.decode_registry(reg_id, payload)
+            for offset, regs in decoded.items():
+                if regs != fixed.convert_field(reg_id, offset, payload):
+                    report("decode_registry", (reg_id, offset), regs,
+                           fixed.convert_field(reg_id, offset, payload))
+                shape, decimals = fixed.field_format(reg_id, offset)
+                if shape not in (SHAPE_INT16, SHAPE_UINT16, SHAPE_INT32):
+                    if regs != reference[offset]:
+                        report("non-numeric", (reg_id, offset), regs, reference[offset])
+                    continue
+                x = float_value(reference[offset]) * 10 ** decimals
+                if fixed.field(reg_id, offset)[2] in PRESS_CONV_IDS:
+                    x = -32768.0 if x < -32768.0 else (32767.0 if x > 32767.0 else x)
+                n = fixed_value(shape, regs)
+                if not close(n, x):
+                    report("field", (reg_id, offset), n, x)
+
+
+def count_registers(converter):
+    """Return ``(total registers, {shape: fields})`` of the primary fields."""
+
+    total = 0
+    shapes = {}
+    for reg_id in converter.registry_ids():
+        for offset, regs in converter.decode_registry(reg_id, bytes(256)).items():
+            total += len(regs)
+            shape = converter.field_format(reg_id, offset)[0]
+            shapes[shape] = shapes.get(shape, 0) + 1
+    return total, shapes
+
+
+def time_decode(converter, repeat):
+    payload = bytes(range(256))
+    reg_ids = converter.registry_ids()
+    decode = converter.decode_registry
+    t0 = ticks_us()
+    for _ in range(repeat):
+        for reg_id in reg_ids:
+            decode(reg_id, payload)
+    return ticks_diff(ticks_us(), t0) / repeat
+
+
+def main():
+    args = [a for a in sys.argv[1:] if a != "quick"]
+    quick = "quick" in sys.argv[1:]
+    path = args[0] if args else DEFAULT_MODEL
+
+    check_conversions(quick)
+    floats = DaikinConverter.from_json_file(path, labels=False)
+    fixed = DaikinConverter.from_json_file(path, labels=False, output=OUTPUT_FIXED)
+    check_model(fixed, floats)
+    if failures:
+        print("%d mismatches" % len(failures))
+        sys.exit(1)
+    print("parity ok")
+
+    print(path)
+    print("%-8s %10s %14s  %s" % ("output", "registers", "us/all regs", "fields per shape"))
+    for name, converter in (("float32", floats), ("fixed", fixed)):
+        total, shapes = count_registers(converter)
+        shapes = ", ".join("%s %d" % (k, shapes[k]) for k in sorted(shapes))
+        print("%-8s %10d %14.1f  %s" % (name, total, time_decode(converter, 20), shapes))
+
+
+if __name__ == "__main__":
+    main()
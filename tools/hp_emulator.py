@@ -0,0 +1,422 @@
+"""Daikin heat pump emulator for tests, benchmarks and load tests.
+
+The emulated heat pump (:class:`HeatPumpEmulator`) speaks the I or the S
+protocol, serves payloads for any model header in ``include/def`` and can
+inject faults: reply latency, per-byte jitter, CRC corruption and dropped
+frames. Reply bytes are paced at the configured baud rate, so blocking
+reads, polling and CPU usage behave like on a real serial port.
+
+Two transports are provided (Unix-like hosts only; on Windows use the
+pySerial front end in `contrib/hp_emulator.py`):
+
+* :class:`EmulatedUART`: in-process object mimicking the subset of
+  ``machine.UART`` used by `daikin_serial.DaikinSerial` (``write``,
+  ``read``, ``readinto``, ``any``, ``flush`` and ``fileno`` for
+  ``select.poll``), backed by an OS pipe.
+* :class:`PtyHeatPump`: serves a Linux pseudo-terminal; open
+  :attr:`PtyHeatPump.port` with pySerial (or any serial tool) as if it were
+  the heat pump's service port.
+
+Example::
+
+    from hp_emulator import EmulatedUART, load_model
+    from daikin_serial import DaikinSerial
+
+    protocol, payloads = load_model(
+        "include/def/Altherma(EBLA-EDLA D series 9-16kW Monobloc).h")
+    uart = EmulatedUART(protocol=protocol, payloads=payloads,
+                        latency_ms=40, crc_error_rate=0.01, seed=1)
+    daikin = DaikinSerial(uart, protocol=protocol, logger=False)
+    payload = daikin.query_registry(0x60)
+    uart.close()
+
+`contrib/hp_emulator.py` is a command-line front end.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+    import termios
+except ImportError:  # Windows: only usable through contrib/hp_emulator.py --port
+    fcntl = termios = None
+
+ROOT = Path(__file__).resolve().parents[1]
+for _path in (ROOT, ROOT / "tools"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from convert_altherma_header import parse_row  # noqa: E402
+from daikin_serial import sum_and_invert  # noqa: E402
+
+# Bits on the wire per byte: start + 8 data + even parity + stop
+BITS_PER_BYTE = 11
+
+# S-protocol reply lengths (see DaikinSerial._initial_reply_len)
+S_REPLY_LEN = {0x50: 6, 0x56: 6}
+S_DEFAULT_REPLY_LEN = 18
+
+# Registries of the S protocol (see doc/Daikin S protocol.md)
+S_REGISTRIES = (0x50, 0x53, 0x54, 0x55, 0x56)
+
+# S protocol replies captured from a Rotex RDLQ014AA6V3
+ROTEX_S_REPLIES = (
+    b"\x53\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xab",
+    b"\x50\x01\x00\x00\x00\xae",
+    b"\x54\xb4\x0d\xa8\x17\xd0\x18\x24\x1d\x3c\x2c\x01\x00\x20\x00\x00\x00\x79",
+    b"\x55\x01\x00\x00\x00\x00\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8b",
+    b"\x56\x01\x00\x00\x00\xa8",
+)
+# The same, as payloads (without registry ID and CRC) for ``payloads=``
+ROTEX_S_PAYLOADS = dict((reply[0], reply[1:-1]) for reply in ROTEX_S_REPLIES)
+
+ERROR_REPLY = b"\x15\xea"
+
+
+def default_payload(reg_id: int, length: int = 17) -> bytes:
+    """Deterministic dummy payload for *reg_id*."""
+
+    return bytes((reg_id + i) & 0xFF for i in range(length))
+
+
+def s_payload_len(reg_id: int) -> int:
+    """Payload length of an S-protocol reply for *reg_id*."""
+
+    return S_REPLY_LEN.get(reg_id, S_DEFAULT_REPLY_LEN) - 2
+
+
+def build_reply(protocol: str, reg_id: int, payload: bytes) -> bytes:
+    """Build a complete reply frame (header, payload, CRC)."""
+
+    if protocol == "I":
+        frame = bytearray([0x40, reg_id & 0xFF, len(payload) + 2]) + payload
+    else:
+        frame = bytearray([reg_id & 0xFF]) + payload
+    frame.append(sum_and_invert(frame))
+    return bytes(frame)
+
+
+def parse_command(protocol: str, data: bytes):
+    """Return the registry ID requested by command *data*, or ``None``."""
+
+    if protocol == "I":
+        if len(data) == 4 and data[0] == 0x03 and data[1] == 0x40:
+            if sum_and_invert(data[:3]) == data[3]:
+                return data[2]
+        return None
+    if len(data) == 3 and data[0] == 0x02 and sum_and_invert(data[:2]) == data[2]:
+        return data[1]
+    return None
+
+
+def load_model(header, protocol=None):
+    """Return ``(protocol, payloads)`` for a model header in ``include/def``.
+
+    Payload lengths are derived from the label definitions (largest
+    ``offset + data_size`` per registry; commented-out rows count too) and
+    filled with :func:`default_payload`. S-protocol payloads get the fixed
+    S reply lengths. The protocol is ``"S"`` if every registry of the model
+    is an S registry, unless given explicitly.
+    """
+
+    sizes = {}
+    text = Path(header).read_text(encoding="utf-8", errors="replace")
+    for line in text.splitlines():
+        row = parse_row(line)
+        if row is None:
+            continue
+        reg_id, offset, _conv_id, data_size, _data_type, _label = row
+        if data_size <= 0:
+            continue
+        end = offset + data_size
+        if end > sizes.get(reg_id, 0):
+            sizes[reg_id] = end
+
+    if not sizes:
+        raise ValueError("no label definitions found in %s" % header)
+    if protocol is None:
+        protocol = "S" if all(r in S_REGISTRIES for r in sizes) else "I"
+    protocol = protocol.upper()
+
+    payloads = {}
+    for reg_id, length in sizes.items():
+        if protocol == "S":
+            length = s_payload_len(reg_id)
+        payloads[reg_id] = default_payload(reg_id, length)
+    return protocol, payloads
+
+
+class HeatPumpEmulator:
+    """Emulated heat pump: protocol logic, fault injection and pacing.
+
+    Subclasses provide the transport: they feed commands to
+    :meth:`_handle_command` and pass the function writing reply bytes.
+
+    Parameters
+    ----------
+    write:
+        Called with each reply byte (a 1-byte ``bytes``) when it is due.
+    protocol:
+        ``"I"`` or ``"S"``; commands for the other protocol get the
+        ``0x15 0xEA`` error reply.
+    baudrate:
+        Pace at which reply bytes are delivered.
+    latency_ms:
+        Delay between receiving a command and sending the first reply byte.
+    payloads:
+        Optional mapping ``reg_id -> payload bytes`` (e.g. from
+        :func:`load_model`). Registries not in the mapping get
+        :func:`default_payload` (I) or a zero payload sized per
+        ``S_REPLY_LEN`` (S), unless *strict*.
+    strict:
+        If true, registries not in *payloads* get the ``0x15 0xEA`` reply,
+        like a real heat pump asked for a registry it does not have.
+    jitter_ms:
+        Random extra delay of up to this much before each reply byte.
+    crc_error_rate:
+        Probability of flipping the CRC byte of a reply.
+    drop_rate:
+        Probability of not answering a command at all.
+    seed:
+        Seed of the fault injection random generator, for reproducible runs.
+    """
+
+    def __init__(self, write, protocol: str = "I", baudrate: int = 9600,
+                 latency_ms: float = 40.0, payloads=None, strict: bool = False,
+                 jitter_ms: float = 0.0, crc_error_rate: float = 0.0,
+                 drop_rate: float = 0.0, seed=None) -> None:
+        self._write_byte = write
+        self.protocol = protocol.upper()
+        self.byte_time = BITS_PER_BYTE / float(baudrate)
+        self.latency = latency_ms / 1000.0
+        self.payloads = dict(payloads or {})
+        self.strict = strict
+        self.jitter = jitter_ms / 1000.0
+        self.crc_error_rate = crc_error_rate
+        self.drop_rate = drop_rate
+        self.random = random.Random(seed)
+
+        # Counters, e.g. for load tests
+        self.requests = 0
+        self.replies = 0
+        self.dropped = 0
+        self.corrupted = 0
+
+    # ------------------------------------------------------------------
+    # Heat pump side
+    # ------------------------------------------------------------------
+
+    def reply_for(self, data: bytes):
+        """Return the reply frame for command *data* (before faults)."""
+
+        reg_id = parse_command(self.protocol, data)
+        if reg_id is None:
+            return ERROR_REPLY
+        payload = self.payloads.get(reg_id)
+        if payload is None:
+            if self.strict:
+                return ERROR_REPLY
+            if self.protocol == "I":
+                payload = default_payload(reg_id)
+            else:
+                payload = bytes(s_payload_len(reg_id))
+        return build_reply(self.protocol, reg_id, payload)
+
+    def _handle_command(self, data: bytes) -> None:
+        """Answer command *data*, applying the configured faults."""
+
+        self.requests += 1
+        reply = self.reply_for(data)
+        if not reply:
+            return
+        rnd = self.random
+        if self.drop_rate and rnd.random() < self.drop_rate:
+            self.dropped += 1
+            return
+        if self.crc_error_rate and len(reply) > 2 and rnd.random() < self.crc_error_rate:
+            reply = reply[:-1] + bytes([reply[-1] ^ 0xFF])
+            self.corrupted += 1
+        time.sleep(self.latency)
+        self._send(reply)
+        self.replies += 1
+
+    def _send(self, reply: bytes) -> None:
+        """Write *reply* one byte at a time at the baud rate (plus jitter)."""
+
+        start = time.monotonic()
+        jitter = self.jitter
+        extra = 0.0
+        for i in range(len(reply)):
+            if jitter:
+                extra += self.random.random() * jitter
+            target = start + extra + (i + 1) * self.byte_time
+            delay = target - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._write_byte(reply[i:i + 1])
+
+
+class EmulatedUART(HeatPumpEmulator):
+    """UART-like object backed by an emulated heat pump.
+
+    Takes the :class:`HeatPumpEmulator` parameters, plus:
+
+    timeout_ms:
+        Read timeout used by blocking :meth:`read` calls (like the
+        ``timeout=`` argument of ``machine.UART``).
+    """
+
+    def __init__(self, protocol: str = "I", baudrate: int = 9600,
+                 latency_ms: float = 40.0, payloads=None,
+                 timeout_ms: int = 0, **kwargs) -> None:
+        self._rfd, self._wfd = os.pipe()
+        super().__init__(self._write_pipe, protocol, baudrate, latency_ms, payloads,
+                         **kwargs)
+        self.timeout = timeout_ms / 1000.0
+
+        os.set_blocking(self._rfd, False)
+        self._pending = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # UART API
+    # ------------------------------------------------------------------
+
+    def write(self, data) -> int:
+        with self._cond:
+            self._pending.append(bytes(data))
+            self._cond.notify()
+        return len(data)
+
+    def any(self) -> int:
+        buf = fcntl.ioctl(self._rfd, termios.FIONREAD, b"\0\0\0\0")
+        return struct.unpack("i", buf)[0]
+
+    def read(self, n: int = -1):
+        if self.timeout > 0 and not self.any():
+            select.select([self._rfd], [], [], self.timeout)
+        try:
+            data = os.read(self._rfd, n if n > 0 else 4096)
+        except BlockingIOError:
+            return None
+        return data or None
+
+    def readinto(self, buf, n: int = -1):
+        mv = memoryview(buf)
+        if n >= 0:
+            mv = mv[:n]
+        data = self.read(len(mv))
+        if not data:
+            return None
+        mv[:len(data)] = data
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def fileno(self) -> int:
+        return self._rfd
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        os.close(self._rfd)
+        os.close(self._wfd)
+
+    # ------------------------------------------------------------------
+    # Heat pump side
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                data = self._pending.pop(0)
+            self._handle_command(data)
+
+    def _write_pipe(self, data: bytes) -> None:
+        os.write(self._wfd, data)
+
+
+class PtyHeatPump(HeatPumpEmulator):
+    """Emulated heat pump behind a Linux pseudo-terminal.
+
+    Takes the :class:`HeatPumpEmulator` parameters. Open :attr:`port` (the
+    pty slave device, e.g. ``/dev/pts/5``) with pySerial or a serial tool;
+    parity and stop bits are ignored by ptys.
+
+    Commands are split by their length byte (``03 40 REG CRC`` /
+    ``02 REG CRC``); an incomplete command is dropped after ``100 ms`` of
+    silence, as the heat pump would.
+    """
+
+    def __init__(self, protocol: str = "I", baudrate: int = 9600,
+                 latency_ms: float = 40.0, payloads=None, **kwargs) -> None:
+        import pty
+        import tty
+
+        self._master, self._slave = pty.openpty()
+        super().__init__(self._write_pty, protocol, baudrate, latency_ms, payloads,
+                         **kwargs)
+        tty.setraw(self._slave)
+        self.port = os.ttyname(self._slave)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._closed = True
+        self._thread.join()
+        os.close(self._master)
+        os.close(self._slave)
+
+    def serve_forever(self) -> None:
+        """Block until interrupted (for command-line use)."""
+
+        try:
+            while self._thread.is_alive():
+                self._thread.join(0.5)
+        except KeyboardInterrupt:
+            pass
+
+    def _run(self) -> None:
+        buf = b""
+        while not self._closed:
+            ready, _, _ = select.select([self._master], [], [], 0.1)
+            if not ready:
+                buf = b""  # inter-frame silence: drop partial command
+                continue
+            try:
+                buf += os.read(self._master, 64)
+            except OSError:
+                return
+            while buf:
+                total = buf[0] + 1
+                if total < 3 or total > 4:
+                    # Not a command start; resynchronise on the next byte
+                    buf = buf[1:]
+                    continue
+                if len(buf) < total:
+                    break
+                data, buf = buf[:total], buf[total:]
+                self._handle_command(data)
+
+    def _write_pty(self, data: bytes) -> None:
+        os.write(self._master, data)
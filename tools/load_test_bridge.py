@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Load-test the Modbus TCP bridge against an emulated heat pump.
+
+Starts `DaikinModbusTCPBridge` on localhost in a background thread, backed by
+`DaikinSerial` on the emulator (`tools/hp_emulator.py`) serving a model
+header from ``include/def``, and sends FC3 reads for every defined field
+from a Modbus TCP client. Reports requests per second, response times and
+Modbus exception counts; with fault injection this shows how the bridge
+behaves on a noisy line.
+
+Usage::
+
+    python tools/load_test_bridge.py [--requests 100] [--latency-ms 40]
+        [--crc-error-rate 0.05] [--drop-rate 0.02] [--model PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import socket
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from daikin_converters import DaikinConverter  # noqa: E402
+from daikin_modbus_tcp_bridge import DaikinModbusTCPBridge  # noqa: E402
+from daikin_serial import DaikinSerial  # noqa: E402
+from hp_emulator import EmulatedUART, load_model  # noqa: E402
+
+MODEL_HEADER = ROOT / "include" / "def" / "Altherma(EBLA-EDLA D series 9-16kW Monobloc).h"
+MODEL_JSON = ROOT / "altherma_ebla_edla_d_9_16_monobloc.json"
+
+
+def free_port() -> int:
+    s = socket.socket()
+    s.bind(("127.0.0.1", 0))
+    port = s.getsockname()[1]
+    s.close()
+    return port
+
+
+def read_holding(sock: socket.socket, trans_id: int, addr: int, quantity: int) -> bytes:
+    """Send one FC3 request and return the response PDU."""
+
+    pdu = struct.pack(">BHH", 3, addr, quantity)
+    sock.sendall(struct.pack(">HHHB", trans_id, 0, len(pdu) + 1, 1) + pdu)
+    header = b""
+    while len(header) < 7:
+        chunk = sock.recv(7 - len(header))
+        if not chunk:
+            raise ConnectionError("bridge closed the connection")
+        header += chunk
+    length = struct.unpack(">H", header[4:6])[0] - 1
+    body = b""
+    while len(body) < length:
+        body += sock.recv(length - len(body))
+    return body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=40.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--crc-error-rate", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--model", default=str(MODEL_HEADER))
+    args = parser.parse_args()
+
+    protocol, payloads = load_model(args.model)
+    uart = EmulatedUART(protocol=protocol, payloads=payloads, strict=True,
+                        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                        crc_error_rate=args.crc_error_rate,
+                        drop_rate=args.drop_rate, seed=args.seed)
+    daikin = DaikinSerial(uart, protocol=protocol, logger=False)
+    converter = DaikinConverter.from_json_file(str(MODEL_JSON))
+    port = free_port()
+    bridge = DaikinModbusTCPBridge(daikin, converter, host="127.0.0.1", port=port,
+                                   logger=False)
+    threading.Thread(target=bridge.serve_forever, daemon=True).start()
+
+    # One FC3 read per registry, covering all its payload bytes
+    addrs = [((reg_id << 8), min(len(payload), 125)) for reg_id, payload in sorted(payloads.items())]
+
+    sock = None
+    for _ in range(50):
+        try:
+            sock = socket.create_connection(("127.0.0.1", port))
+            break
+        except OSError:
+            time.sleep(0.05)
+    if sock is None:
+        raise SystemExit("bridge did not start")
+
+    times = []
+    exceptions = {}
+    try:
+        wall0 = time.perf_counter()
+        for i in range(args.requests):
+            addr, quantity = addrs[i % len(addrs)]
+            t0 = time.perf_counter()
+            pdu = read_holding(sock, i & 0xFFFF, addr, quantity)
+            times.append((time.perf_counter() - t0) * 1000.0)
+            if pdu[0] & 0x80:
+                exceptions[pdu[1]] = exceptions.get(pdu[1], 0) + 1
+        wall = time.perf_counter() - wall0
+    finally:
+        sock.close()
+        uart.close()
+
+    times.sort()
+    print("Model: %s (protocol %s, %d registries)" % (Path(args.model).name, protocol, len(payloads)))
+    print("%d requests in %.1f s: %.1f req/s" % (len(times), wall, len(times) / wall))
+    print("Response ms: min %.1f  median %.1f  p95 %.1f  max %.1f" % (
+        times[0], times[len(times) // 2], times[int(len(times) * 0.95)], times[-1]))
+    print("Modbus exceptions: %s" % (
+        ", ".join("0x%02X x%d" % kv for kv in sorted(exceptions.items())) or "none"))
+    print("Heat pump: %d requests, %d dropped, %d corrupted" % (
+        uart.requests, uart.dropped, uart.corrupted))
+
+
+if __name__ == "__main__":
+    main()
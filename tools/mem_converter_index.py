@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Memory and lookup time of a whole DaikinConverter against the original dict.
+
+Builds, for a model JSON:
+
+- the original converter's lookup, a ``dict`` of ``(registry_id, offset)``
+  tuple keys to ``(conv_id, data_size)`` (the last declared field wins,
+  rows with ``data_size <= 0`` are skipped), the baseline,
+- the same ``dict`` with ``(registry_id << 8) | offset`` int keys,
+- a whole :class:`daikin_converters.DaikinConverter` of the model
+  (``from_json_file``, without labels as the bridge loads it): right after
+  construction, after ``decode_registry`` of every registry (which builds
+  every :class:`RegistryPlan`), and with ``labels=True``,
+
+and reports the bytes each retains. Conversion and ``struct`` caches are
+warmed first, so only the object itself counts. Then times a lookup of
+every ``(registry_id, offset)`` pair in each (``dict.get`` against
+``DaikinConverter.field``), and ``convert_field`` of every pair: the
+original one (dict lookup, payload slice and :func:`convert_raw_value`)
+against the converter's.
+
+Memory is measured with ``tracemalloc`` on CPython and ``gc.mem_alloc()``
+on MicroPython. The script only uses ``sys.argv`` and plain paths so it
+also runs on a board (copy ``daikin_converters.py`` and the model JSON
+next to it), where the numbers that matter come from.
+
+Usage::
+
+    python tools/mem_converter_index.py [MODEL_JSON]
+    mpremote run tools/mem_converter_index.py   # model JSON on the board
+"""
+
+import gc
+import sys
+
+try:
+    import ujson as json  # MicroPython
+except ImportError:
+    import json
+
+try:
+    import tracemalloc
+except ImportError:  # MicroPython
+    tracemalloc = None
+
+try:
+    from time import ticks_diff, ticks_us  # MicroPython
+except ImportError:
+    from time import perf_counter
+
+    def ticks_us():
+        return int(perf_counter() * 1000000)
+
+    def ticks_diff(a, b):
+        return a - b
+
+if tracemalloc is not None:  # CPython, run from the repository
+    import os
+
+    ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, ROOT)
+    DEFAULT_MODEL = os.path.join(ROOT, "altherma_ebla_edla_d_9_16_monobloc.json")
+else:  # MicroPython, files side by side on the board
+    DEFAULT_MODEL = "altherma_ebla_edla_d_9_16_monobloc.json"
+
+from daikin_converters import DaikinConverter, convert_raw_value  # noqa: E402
+
+
+def build_baseline(label_defs):
+    """Return the original converter's ``(registry_id, offset) -> (conv_id, data_size)`` dict."""
+
+    mapping = {}
+    for entry in label_defs:
+        data_size = int(entry.get("data_size", 0))
+        if data_size <= 0:
+            continue
+        key = (int(entry["registry_id"]) & 0xFF, int(entry["offset"]) & 0xFF)
+        mapping[key] = (int(entry["conv_id"]), data_size)
+    return mapping
+
+
+def build_int_dict(mapping):
+    return dict((((reg_id << 8) | offset), (conv_id, data_size))
+                for (reg_id, offset), (conv_id, data_size) in mapping.items())
+
+
+def baseline_convert(mapping):
+    """Return the original ``convert_field`` over *mapping*."""
+
+    def convert(reg_id, offset, payload):
+        meta = mapping.get((reg_id, offset))
+        if meta is None:
+            return [payload[offset]] if offset < len(payload) else []
+        return convert_raw_value(meta[0], payload[offset:offset + meta[1]])
+
+    return convert
+
+
+def lookup_converter(converter):
+    field = converter.field
+
+    def lookup(reg_id, offset):
+        record = field(reg_id, offset)
+        return None if record is None else (record[2], record[3])
+
+    return lookup
+
+
+def decode_all(converter):
+    payload = bytes(range(256))
+    for reg_id in converter.registry_ids():
+        converter.decode_registry(reg_id, payload)
+    return converter
+
+
+def measure(build, arg):
+    """Return ``(object, bytes retained)`` of ``build(arg)``."""
+
+    gc.collect()
+    if tracemalloc is not None:
+        tracemalloc.start()
+        obj = build(arg)
+        gc.collect()
+        used = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return obj, used
+    before = gc.mem_alloc()
+    obj = build(arg)
+    gc.collect()
+    return obj, gc.mem_alloc() - before
+
+
+def time_calls(call, pairs, args=(), repeat=20, rounds=5):
+    """Return microseconds per ``call(reg_id, offset, *args)`` of every pair, best of *rounds*."""
+
+    best = None
+    for _ in range(rounds):
+        t0 = ticks_us()
+        for _ in range(repeat):
+            for reg_id, offset in pairs:
+                call(reg_id, offset, *args)
+        us = ticks_diff(ticks_us(), t0) / (repeat * len(pairs))
+        if best is None or us < best:
+            best = us
+    return best
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_MODEL
+    with open(path, "r") as f:
+        label_defs = json.load(f)
+    payload = bytes(range(256))
+
+    # Warm the decoder, lookup and struct caches shared between converters
+    decode_all(DaikinConverter.from_json_file(path))
+    gc.collect()
+
+    mapping, baseline_bytes = measure(build_baseline, label_defs)
+    int_dict, int_bytes = measure(build_int_dict, mapping)
+    del label_defs
+    converter, built_bytes = measure(DaikinConverter.from_json_file, path)
+    _, plans_bytes = measure(decode_all, converter)
+    plans_bytes += built_bytes
+    labelled, labelled_bytes = measure(
+        lambda p: DaikinConverter.from_json_file(p, labels=True), path)
+    del labelled
+
+    pairs = sorted(mapping)
+    lookup = lookup_converter(converter)
+    convert = baseline_convert(mapping)
+    for reg_id, offset in pairs:
+        assert lookup(reg_id, offset) == mapping[(reg_id, offset)]
+    print("%s: %d fields in %d registries" % (
+        path, len(pairs), len(set(p[0] for p in pairs))))
+
+    lookup_us = time_calls(lambda r, o: mapping.get((r, o)), pairs)
+    convert_us = time_calls(convert, pairs, (payload,))
+    rows = (
+        ("dict, tuple keys", baseline_bytes, lookup_us, convert_us),
+        ("dict, int keys", int_bytes,
+         time_calls(lambda r, o: int_dict.get((r << 8) | o), pairs), None),
+        ("DaikinConverter", built_bytes, time_calls(lookup, pairs),
+         time_calls(converter.convert_field, pairs, (payload,))),
+        ("... every plan", plans_bytes, None, None),
+        ("... labels=True", labelled_bytes, None, None),
+    )
+    print("%-18s %9s %9s %10s %10s" % ("layout", "bytes", "vs dict", "us/lookup", "us/convert"))
+    for name, nbytes, us, convert_us in rows:
+        print("%-18s %9d %8.2fx %10s %10s" % (
+            name, nbytes, nbytes / baseline_bytes,
+            "" if us is None else "%.3f" % us,
+            "" if convert_us is None else "%.3f" % convert_us))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Peak heap of building a DaikinConverter from a model file, per loading mode.
+
+Builds the converter for a model JSON:
+
+- the former way, ``json.load`` of the whole file then the constructor,
+- ``from_json_file`` (streamed entry by entry), without labels as the
+  bridge loads it, and with ``labels=True``,
+- ``from_json_file(allow_labels=...)`` keeping only the first *N* labels
+  (default 20), as a board serving a few fields would,
+- ``from_model_file`` if the compiled ``.dkm`` next to the JSON exists
+  (see ``tools/compile_model.py``),
+- import of the generated ``<model>_frozen`` module plus
+  ``from_model_module``, if it is on the path (see
+  ``tools/convert_altherma_header.py --frozen``; on a board, frozen into
+  the firmware or as ``.mpy``),
+
+and reports load (or import) time, best of five, peak heap and the heap
+still held by the converter, i.e. what startup takes from the free heap.
+On CPython the peak comes from ``tracemalloc``; on MicroPython the
+collector is disabled during the load and ``gc.mem_alloc()`` gives the
+bytes allocated, an upper bound of the peak. Like
+``tools/mem_converter_index.py``, it only uses ``sys.argv`` so it also runs
+on a board (``daikin_converters.py`` and the model files next to it).
+
+Usage::
+
+    python tools/mem_model_load.py [MODEL_JSON] [N_FIELDS]
+    mpremote run tools/mem_model_load.py
+"""
+
+import gc
+import sys
+
+try:
+    import ujson as json  # MicroPython
+except ImportError:
+    import json
+
+try:
+    import tracemalloc
+except ImportError:  # MicroPython
+    tracemalloc = None
+
+try:
+    from time import ticks_diff, ticks_us  # MicroPython
+except ImportError:
+    from time import perf_counter
+
+    def ticks_us():
+        return int(perf_counter() * 1000000)
+
+    def ticks_diff(a, b):
+        return a - b
+
+if tracemalloc is not None:  # CPython, run from the repository
+    import os
+
+    ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, ROOT)
+    DEFAULT_MODEL = os.path.join(ROOT, "altherma_ebla_edla_d_9_16_monobloc.json")
+else:  # MicroPython, files side by side on the board
+    DEFAULT_MODEL = "altherma_ebla_edla_d_9_16_monobloc.json"
+
+from daikin_converters import DaikinConverter, iter_json_file  # noqa: E402
+
+
+def load_whole(path):
+    """The former ``from_json_file``: parse the whole list, then build."""
+
+    with open(path, "r") as f:
+        label_defs = json.load(f)
+    return DaikinConverter(label_defs)
+
+
+def measure(load, repeat=5):
+    """Return ``(converter, ms, peak bytes, retained bytes)`` of ``load()``.
+
+    The time is the best of *repeat* untraced loads, so that neither the
+    tracer nor one-off warm-up work (lookup tables, ``struct`` formats)
+    counts; peak and retained heap are those of one more load.
+    """
+
+    ms = None
+    for _ in range(repeat):
+        t0 = ticks_us()
+        converter = load()
+        t = ticks_diff(ticks_us(), t0) / 1000.0
+        converter = None
+        if ms is None or t < ms:
+            ms = t
+
+    gc.collect()
+    if tracemalloc is not None:
+        tracemalloc.start()
+        converter = load()
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return converter, ms, peak, retained
+    before = gc.mem_alloc()
+    gc.disable()
+    try:
+        converter = load()
+        peak = gc.mem_alloc() - before
+    finally:
+        gc.enable()
+    gc.collect()
+    return converter, ms, peak, gc.mem_alloc() - before
+
+
+def load_module(name):
+    """Import the generated model module afresh and build its converter."""
+
+    sys.modules.pop(name, None)
+    module = __import__(name)
+    return DaikinConverter.from_model_module(module)
+
+
+def file_exists(path):
+    try:
+        open(path, "rb").close()
+        return True
+    except OSError:
+        return False
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_MODEL
+    n_fields = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    allow = []
+    for record in iter_json_file(path, labels=True):
+        if record[4] not in allow:
+            allow.append(record[4])
+        if len(allow) == n_fields:
+            break
+
+    loads = [
+        ("json.load + DaikinConverter", lambda: load_whole(path)),
+        ("from_json_file", lambda: DaikinConverter.from_json_file(path)),
+        ("from_json_file(labels=True)",
+         lambda: DaikinConverter.from_json_file(path, labels=True)),
+        ("... allow_labels (%d)" % len(allow),
+         lambda: DaikinConverter.from_json_file(path, allow_labels=allow)),
+    ]
+    model = path[:-5] + ".dkm" if path.endswith(".json") else None
+    if model and file_exists(model):
+        loads.append(("from_model_file",
+                      lambda: DaikinConverter.from_model_file(model)))
+
+    module_name = path.rsplit("/", 1)[-1]
+    if module_name.endswith(".json"):
+        module_name = module_name[:-5] + "_frozen"
+        try:
+            __import__(module_name)
+        except ImportError:
+            pass
+        else:
+            loads.append(("import + from_model_module",
+                          lambda: load_module(module_name)))
+
+    print(path)
+    print("%-32s %8s %8s %10s %10s" % ("mode", "fields", "ms", "peak B", "retained B"))
+    payload = bytes(range(256))
+    reference = None
+    for name, load in loads:
+        converter, ms, peak, retained = measure(load)
+        n = sum(len(converter.decode_registry(r, payload)) for r in converter.registry_ids())
+        if reference is None:
+            reference = converter
+        elif n == sum(len(reference.decode_registry(r, payload))
+                      for r in reference.registry_ids()):
+            for reg_id in reference.registry_ids():
+                assert converter.decode_registry(reg_id, payload) == \
+                    reference.decode_registry(reg_id, payload), (name, reg_id)
+        print("%-32s %8d %8.1f %10d %10d" % (name, n, ms, peak, retained))
+        converter = None
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Check the protocol probe (`daikin_probe`) against emulated heat pumps.
+
+Runs :func:`daikin_probe.probe` / :func:`daikin_probe.detect` against the
+in-process emulator (`tools/hp_emulator.py`) speaking protocol I, protocol S
+and nothing at all, and checks the detected protocol, the responsive
+registry set, the time budget and the flash cache (hit, ``refresh`` and a
+corrupt file). The checks are plain ``test_*`` functions with ``assert``,
+so pytest collects them too; run as a script, it exits non-zero on any
+failure. No board is needed.
+
+Usage::
+
+    python tools/probe_emulator.py [--budget-ms 1500] [--latency-ms 40]
+    python -m pytest tools/probe_emulator.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from daikin_probe import detect, load_probe_cache, probe, save_probe_cache  # noqa: E402
+from daikin_serial import DaikinSerialError  # noqa: E402
+from hp_emulator import EmulatedUART  # noqa: E402
+
+I_REGISTRIES = [0x10, 0x11, 0x20, 0x21, 0x30, 0x60, 0x61, 0x62, 0x63, 0x64, 0x65, 0xA0, 0xA1]
+S_REGISTRIES = [0x50, 0x53, 0x54, 0x55, 0x56]
+
+
+class ModelUART(EmulatedUART):
+    """Emulated heat pump answering only *known* registries."""
+
+    def __init__(self, known, silent=False, **kwargs):
+        self.known = set(known)
+        self.silent = silent
+        super().__init__(**kwargs)
+
+    def reply_for(self, data: bytes):
+        if self.silent:
+            return b""
+        reply = super().reply_for(data)
+        if reply != b"\x15\xea" and reply[1 if self.protocol == "I" else 0] not in self.known:
+            return b"\x15\xea"
+        return reply
+
+
+# Set by main() from the command line
+BUDGET_MS = 1500
+LATENCY_MS = 40.0
+
+
+def _probe(protocol, candidates, known):
+    uart = ModelUART(known, protocol=protocol, latency_ms=LATENCY_MS)
+    try:
+        t0 = time.monotonic()
+        result = probe(uart, budget_ms=BUDGET_MS, registries=candidates)
+        wall = (time.monotonic() - t0) * 1000.0
+    finally:
+        uart.close()
+    assert result["protocol"] == protocol, result
+    assert result["registries"] == sorted(known), result
+    assert result["complete"], result
+    assert wall <= BUDGET_MS + 50, "%.0f ms over a %d ms budget" % (wall, BUDGET_MS)
+
+
+def test_probe_i():
+    _probe("I", I_REGISTRIES, [0x10, 0x20, 0x60, 0x61])
+
+
+def test_probe_s():
+    _probe("S", S_REGISTRIES, [0x53, 0x54, 0x55])
+
+
+def test_probe_silent_line():
+    """A silent line must fail within the budget."""
+
+    uart = ModelUART((), silent=True, latency_ms=LATENCY_MS)
+    try:
+        t0 = time.monotonic()
+        try:
+            probe(uart, budget_ms=BUDGET_MS)
+            raise AssertionError("probe of a silent line did not fail")
+        except DaikinSerialError:
+            pass
+        wall = (time.monotonic() - t0) * 1000.0
+    finally:
+        uart.close()
+    assert wall <= BUDGET_MS + 50, "%.0f ms over a %d ms budget" % (wall, BUDGET_MS)
+
+
+def _cache_path():
+    fd, cache = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    os.unlink(cache)
+    return cache
+
+
+def test_detect_cache_hit():
+    """The second detect() reads the cache and sends no frame."""
+
+    cache = _cache_path()
+    uart = ModelUART([0x53, 0x54], protocol="S", latency_ms=LATENCY_MS)
+    try:
+        daikin, info = detect(uart, cache_path=cache, registries=S_REGISTRIES, logger=False)
+        sent = uart.requests
+        assert sent > 0
+        assert not info["cached"]
+        daikin2, info2 = detect(uart, cache_path=cache, logger=False)
+        assert daikin.protocol == daikin2.protocol == "S"
+        assert info2["cached"]
+        assert info2["registries"] == [0x53, 0x54]
+        assert uart.requests == sent, "cache hit sent %d frames" % (uart.requests - sent)
+    finally:
+        uart.close()
+        if os.path.exists(cache):
+            os.unlink(cache)
+
+
+def test_detect_cache_invalidation():
+    """refresh=True and an unreadable cache re-probe and rewrite the cache."""
+
+    cache = _cache_path()
+    uart = ModelUART([0x53, 0x54], protocol="S", latency_ms=LATENCY_MS)
+    try:
+        # Stale entry from another heat pump
+        save_probe_cache({"protocol": "I", "registries": [0x10]}, cache)
+        daikin, info = detect(uart, cache_path=cache, logger=False)
+        assert info["cached"] and daikin.protocol == "I"
+
+        sent = uart.requests
+        daikin, info = detect(uart, cache_path=cache, registries=S_REGISTRIES,
+                              refresh=True, logger=False)
+        assert not info["cached"] and daikin.protocol == "S"
+        assert uart.requests > sent
+        assert load_probe_cache(cache)["protocol"] == "S"
+
+        # Corrupt file: ignored, probed again
+        with open(cache, "w") as f:
+            f.write("{not json")
+        sent = uart.requests
+        daikin, info = detect(uart, cache_path=cache, registries=S_REGISTRIES, logger=False)
+        assert not info["cached"] and daikin.protocol == "S"
+        assert uart.requests > sent
+        assert load_probe_cache(cache) == {"protocol": "S", "registries": [0x53, 0x54]}
+    finally:
+        uart.close()
+        if os.path.exists(cache):
+            os.unlink(cache)
+
+
+TESTS = (
+    test_probe_i,
+    test_probe_s,
+    test_probe_silent_line,
+    test_detect_cache_hit,
+    test_detect_cache_invalidation,
+)
+
+
+def main() -> int:
+    global BUDGET_MS, LATENCY_MS
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=int, default=BUDGET_MS)
+    parser.add_argument("--latency-ms", type=float, default=LATENCY_MS)
+    args = parser.parse_args()
+    BUDGET_MS = args.budget_ms
+    LATENCY_MS = args.latency_ms
+
+    failed = 0
+    for test in TESTS:
+        try:
+            test()
+        except AssertionError as exc:
+            failed += 1
+            print("FAIL %s: %s" % (test.__name__, exc))
+        else:
+            print("ok   %s" % test.__name__)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""Check learned reply lengths (`DaikinSerial.reply_lengths`) against an emulated heat pump.
+
+A learned or cached I frame length only seeds the receive loop: a stale one
+(shorter than the real frame) must not make every query of that registry
+time out, and a reply that times out or announces another length must make
+the driver forget it. Runs against the in-process emulator
+(`tools/hp_emulator.py`) with every wait strategy. The checks are plain
+``test_*`` functions with ``assert``, so pytest collects them too; run as a
+script, it exits non-zero on any failure. No board is needed.
+
+Usage::
+
+    python tools/reply_len_emulator.py [--latency-ms 5]
+    python -m pytest tools/reply_len_emulator.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "tools"))
+
+from daikin_serial import (  # noqa: E402
+    WAIT_BLOCK,
+    WAIT_POLL,
+    WAIT_SLEEP,
+    DaikinCRCError,
+    DaikinSerial,
+    DaikinTimeoutError,
+    sum_and_invert,
+)
+from hp_emulator import (  # noqa: E402
+    ROTEX_S_PAYLOADS,
+    ROTEX_S_REPLIES,
+    EmulatedUART,
+    s_payload_len,
+)
+
+REG_ID = 0x10
+PAYLOAD = bytes(range(40))
+# 0x40, reg_id, length byte, payload, CRC
+FRAME_LEN = 3 + len(PAYLOAD) + 1
+STALE_LEN = 12
+
+# Set by main() from the command line
+LATENCY_MS = 5.0
+
+
+def _driver(wait, **kwargs):
+    uart = EmulatedUART(protocol="I", latency_ms=LATENCY_MS, payloads={REG_ID: PAYLOAD},
+                        timeout_ms=50, **kwargs)
+    return uart, DaikinSerial(uart, protocol="I", logger=False, wait=wait)
+
+
+def _stale_length(wait):
+    uart, daikin = _driver(wait)
+    try:
+        daikin._reply_lens[REG_ID] = STALE_LEN
+        for _ in range(3):
+            assert daikin.query_registry(REG_ID) == PAYLOAD
+        assert daikin.reply_lengths() == {REG_ID: FRAME_LEN}
+    finally:
+        uart.close()
+
+
+def test_stale_length_sleep():
+    _stale_length(WAIT_SLEEP)
+
+
+def test_stale_length_poll():
+    _stale_length(WAIT_POLL)
+
+
+def test_stale_length_block():
+    _stale_length(WAIT_BLOCK)
+
+
+def test_stale_length_batch():
+    """A stale length does not leave bytes behind for the next registry."""
+
+    uart, daikin = _driver(WAIT_BLOCK)
+    try:
+        daikin._reply_lens[REG_ID] = STALE_LEN
+        results = daikin.query_registries([REG_ID, 0x11, REG_ID])
+        assert results[REG_ID] == PAYLOAD
+        assert set(results) == {REG_ID, 0x11}
+    finally:
+        uart.close()
+
+
+def _cache_file(lengths):
+    fd, path = tempfile.mkstemp(suffix=".json")
+    with os.fdopen(fd, "w") as f:
+        json.dump({"protocol": "I", "lengths": lengths}, f)
+    return path
+
+
+def test_stale_cache_file():
+    """A stale persisted length is replaced on the first reply and saved."""
+
+    path = _cache_file({str(REG_ID): STALE_LEN})
+    uart = EmulatedUART(protocol="I", latency_ms=LATENCY_MS, payloads={REG_ID: PAYLOAD})
+    try:
+        daikin = DaikinSerial(uart, protocol="I", logger=False, reply_len_cache=path)
+        assert daikin.reply_lengths() == {REG_ID: STALE_LEN}
+        assert daikin.query_registry(REG_ID) == PAYLOAD
+        with open(path) as f:
+            assert json.load(f)["lengths"] == {str(REG_ID): FRAME_LEN}
+    finally:
+        uart.close()
+        os.unlink(path)
+
+
+def test_timeout_forgets_length():
+    """A registry that stops answering loses its learned length (and cache entry)."""
+
+    path = _cache_file({str(REG_ID): FRAME_LEN})
+    uart = EmulatedUART(protocol="I", latency_ms=LATENCY_MS, payloads={REG_ID: PAYLOAD},
+                        drop_rate=1.0)
+    try:
+        daikin = DaikinSerial(uart, protocol="I", logger=False, timeout_ms=100,
+                              reply_len_cache=path)
+        try:
+            daikin.query_registry(REG_ID)
+            raise AssertionError("query of a silent registry did not time out")
+        except DaikinTimeoutError:
+            pass
+        assert daikin.reply_lengths() == {}
+        with open(path) as f:
+            assert json.load(f)["lengths"] == {}
+    finally:
+        uart.close()
+        os.unlink(path)
+
+
+def test_length_mismatch_forgets_length():
+    """A failed reply announcing another length drops the learned one."""
+
+    uart, daikin = _driver(WAIT_SLEEP, crc_error_rate=1.0)
+    try:
+        daikin._reply_lens[REG_ID] = STALE_LEN
+        try:
+            daikin.query_registry(REG_ID)
+            raise AssertionError("corrupted reply was accepted")
+        except DaikinCRCError:
+            pass
+        assert daikin.reply_lengths() == {}
+    finally:
+        uart.close()
+
+
+def test_s_reply_lengths():
+    """S reply lengths match the Rotex capture, in the emulator and the driver."""
+
+    for reply in ROTEX_S_REPLIES:
+        assert s_payload_len(reply[0]) == len(reply) - 2, "0x%02X" % reply[0]
+
+    # Emulated replies of unknown S payloads are sized like the capture
+    uart = EmulatedUART(protocol="S", latency_ms=LATENCY_MS, timeout_ms=50)
+    try:
+        for reply in ROTEX_S_REPLIES:
+            command = bytes([0x02, reply[0]])
+            uart.write(command + bytes([sum_and_invert(command)]))
+            got = b""
+            while True:
+                data = uart.read(64)
+                if not data:
+                    break
+                got += data
+            assert len(got) == len(reply), "0x%02X: %d != %d" % (reply[0], len(got), len(reply))
+    finally:
+        uart.close()
+
+    uart = EmulatedUART(protocol="S", latency_ms=LATENCY_MS, payloads=ROTEX_S_PAYLOADS)
+    try:
+        daikin = DaikinSerial(uart, protocol="S", logger=False)
+        for reply in ROTEX_S_REPLIES:
+            assert daikin.query_registry(reply[0]) == reply[1:-1], "0x%02X" % reply[0]
+    finally:
+        uart.close()
+
+
+TESTS = (
+    test_stale_length_sleep,
+    test_stale_length_poll,
+    test_stale_length_block,
+    test_stale_length_batch,
+    test_stale_cache_file,
+    test_timeout_forgets_length,
+    test_length_mismatch_forgets_length,
+    test_s_reply_lengths,
+)
+
+
+def main() -> int:
+    global LATENCY_MS
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=LATENCY_MS)
+    args = parser.parse_args()
+    LATENCY_MS = args.latency_ms
+
+    failed = 0
+    for test in TESTS:
+        try:
+            test()
+        except AssertionError as exc:
+            failed += 1
+            print("FAIL %s: %s" % (test.__name__, exc))
+        else:
+            print("ok   %s" % test.__name__)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,455 @@
+"""Parser and replay transport for captured serial traffic.
+
+``doc/seriallogs`` holds dumps recorded with a serial monitor on a real
+heat pump line: UTF-16 text, one line per burst, each starting with a
+timestamp and followed by the bytes seen on the wire::
+
+    (09.50.35.898) 03h 22h 42h 98h 0Dh 22h 61h C0h 36h 01h 56h FFh ...
+    (09.51.05.966) 03h 22h 42h 98h
+                   0Dh 22h 61h C0h 36h 01h 56h FFh 00h 00h 00h 00h 00h 23h
+
+:func:`parse_capture` turns such a file into ``(t_ms, data)`` records and
+:func:`exchanges` into ``(t_ms, command, reply)`` exchanges: each line
+starts with a command (``LEN ... CRC``, 3 or 4 bytes), the rest of the line
+and any untimestamped continuation lines are its reply. Bit errors,
+truncated replies and unanswered commands are kept as recorded. Plain hex
+files with one frame per line (``doc/seriallogs/RX``) parse too, without
+timing.
+
+:class:`ReplayUART` feeds the recorded replies back to
+`daikin_serial.DaikinSerial` through the same UART subset as
+`hp_emulator.EmulatedUART` (no ``fileno``, so the driver sleeps between
+polls). It runs in one of two timing modes:
+
+* ``"original"``: a reply is not released before its recorded time
+  relative to the first exchange of the replay (scaled by ``speed``), and
+  its bytes then arrive at the baud rate;
+* ``"fast"``: replies are available as soon as the command is written.
+
+The captures in ``doc/seriallogs`` are of the ``0x22`` bus (``03 22 REG
+CRC`` answered by ``0D 22 61 ... CRC``), not of the I/S service port. With
+``reframe="I"`` or ``"S"``, each recorded reply payload is wrapped into a
+reply frame of that protocol for the registry the driver asked for,
+preserving recorded CRC errors and truncation, so the driver, the
+converters and the bridge see real byte values and error patterns.
+Without ``reframe``, written commands are matched byte for byte against
+the capture (for captures of the service port itself).
+
+Example::
+
+    from serial_replay import ReplayUART
+    from daikin_serial import DaikinSerial
+
+    uart = ReplayUART.from_capture("doc/seriallogs/dump.2.txt",
+                                   timing="original", reframe="I")
+    daikin = DaikinSerial(uart, protocol="I", logger=False)
+    payload = daikin.query_registry(0x61)
+
+``python tools/serial_replay.py CAPTURE`` prints a summary of a capture;
+with ``--replay I`` (or ``S``) it also replays every answered exchange
+through `DaikinSerial` and prints the driver's outcome counters.
+
+Usage::
+
+    python tools/serial_replay.py "doc/seriallogs/dump.1 (1).txt" [--frames]
+        [--replay I] [--reg 0x61] [--timing original] [--speed 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+for _path in (ROOT, ROOT / "tools"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from daikin_serial import sum_and_invert  # noqa: E402
+from hp_emulator import BITS_PER_BYTE, build_reply, s_payload_len  # noqa: E402
+
+# Timing modes
+TIMING_ORIGINAL = "original"
+TIMING_FAST = "fast"
+
+# "(HH.MM.SS.mmm)" at the start of a line
+_STAMP = re.compile(r"\s*\((\d+)\.(\d+)\.(\d+)\.(\d+)\)")
+# Fallback for lines bytes.fromhex() rejects
+_HEX_TOKEN = re.compile(r"\b([0-9A-Fa-f]{2})h?\b")
+
+# Header bytes before the payload in a captured reply: LEN, address, registry
+CAPTURE_REPLY_HEADER = 3
+
+
+# ----------------------------------------------------------------------
+# Parsing
+# ----------------------------------------------------------------------
+
+
+def read_capture_text(path) -> str:
+    """Return the text of a capture file (UTF-16 with BOM, else UTF-8)."""
+
+    raw = Path(path).read_bytes()
+    if raw[:2] in (b"\xff\xfe", b"\xfe\xff"):
+        return raw.decode("utf-16")
+    return raw.decode("utf-8", errors="replace")
+
+
+def parse_capture(source):
+    """Return the ``(t_ms, data)`` records of a capture.
+
+    *source* is a path or the capture text. ``t_ms`` is the time of day in
+    ms of the line's timestamp; untimestamped lines (continuations and plain
+    hex files) get the time of the previous record, or ``None``. Blank lines
+    are skipped.
+    """
+
+    text = source if isinstance(source, str) and "\n" in source else read_capture_text(source)
+    records = []
+    append = records.append
+    t_ms = None
+    fromhex = bytes.fromhex
+    for line in text.splitlines():
+        m = _STAMP.match(line)
+        if m is not None:
+            h, mi, s, ms = m.groups()
+            t_ms = ((int(h) * 60 + int(mi)) * 60 + int(s)) * 1000 + int(ms)
+            line = line[m.end():]
+        elif not line or line.isspace():
+            continue
+        try:
+            data = fromhex(line.replace("h", " "))
+        except ValueError:
+            data = bytes(int(tok, 16) for tok in _HEX_TOKEN.findall(line))
+        if data:
+            append((t_ms, data))
+    return records
+
+
+def _command_len(data, pos):
+    """Length of the command frame at *pos*, or 0 if none starts there.
+
+    A command is ``LEN ... CRC`` with LEN 2 (S) or 3 (I and the 0x22 bus)
+    and a valid checksum.
+    """
+
+    n = data[pos] + 1
+    if n not in (3, 4) or pos + n > len(data):
+        return 0
+    return n if sum_and_invert(data[pos:pos + n - 1]) == data[pos + n - 1] else 0
+
+
+def exchanges(source):
+    """Return the ``(t_ms, command, reply)`` exchanges of a capture.
+
+    *source* is a path, the capture text or a :func:`parse_capture` result.
+    Every timestamped record starts a new exchange; its first frame is the
+    command (four bytes if the length byte is corrupted) and everything up
+    to the next valid command is the reply (``b""`` if unanswered). A
+    record without timestamp continues the previous reply, unless it starts
+    with a valid command (plain hex files).
+    """
+
+    records = source if isinstance(source, list) else parse_capture(source)
+    result = []
+    prev_t = object()
+    for t_ms, data in records:
+        pos = 0
+        if t_ms == prev_t and result and not _command_len(data, 0):
+            t, command, reply = result[-1]
+            result[-1] = (t, command, reply + data)
+            continue
+        prev_t = t_ms
+        while pos < len(data):
+            n = _command_len(data, pos) or 4
+            command = bytes(data[pos:pos + n])
+            pos += n
+            end = pos
+            while end < len(data) and not _command_len(data, end):
+                end += 1
+            result.append((t_ms, command, bytes(data[pos:end])))
+            pos = end
+    return result
+
+
+def reply_is_valid(reply) -> bool:
+    """True if a captured reply is complete (``LEN``) with a valid CRC."""
+
+    return (len(reply) >= 2 and len(reply) == reply[0] + 1
+            and sum_and_invert(reply[:-1]) == reply[-1])
+
+
+def reframe_reply(protocol: str, reg_id: int, reply) -> bytes:
+    """Wrap the payload of captured *reply* into an I/S reply for *reg_id*.
+
+    A recorded CRC error becomes a CRC error of the new frame, a truncated
+    reply loses as many trailing bytes, and ``0x15 0xEA`` passes through.
+    S payloads are cut or zero-padded to the fixed S reply length.
+    """
+
+    if reply[:2] == b"\x15\xea":
+        return bytes(reply)
+    full = reply[0] + 1 if reply else 0
+    payload = bytes(reply[CAPTURE_REPLY_HEADER:full - 1])
+    if protocol == "S":
+        length = s_payload_len(reg_id)
+        payload = payload[:length] + bytes(length - len(payload[:length]))
+    frame = build_reply(protocol, reg_id, payload)
+    missing = full - len(reply)
+    if missing > 0:
+        return frame[:max(len(frame) - missing, 0)]
+    if not reply_is_valid(reply):
+        return frame[:-1] + bytes([frame[-1] ^ 0xFF])
+    return frame
+
+
+# ----------------------------------------------------------------------
+# Replay transport
+# ----------------------------------------------------------------------
+
+
+class ReplayUART:
+    """UART-like object that answers with the replies of a capture.
+
+    Parameters
+    ----------
+    exchanges:
+        ``(t_ms, command, reply)`` tuples, e.g. from :func:`exchanges`.
+    timing:
+        ``"original"`` or ``"fast"`` (default); see the module docstring.
+    reframe:
+        ``None`` (default) to match written commands byte for byte and send
+        the recorded reply unchanged, or ``"I"`` / ``"S"`` to answer every
+        command with the next answered exchange of the capture, reframed
+        for the requested registry (see :func:`reframe_reply`).
+    baudrate:
+        Pacing of reply bytes in ``"original"`` mode (default: 9600).
+    speed:
+        Playback speed factor for the recorded timing (default: 1.0).
+    loop:
+        Start over at the end of the capture (default: True). Otherwise
+        commands written after the end get no reply.
+    timeout_ms:
+        Read timeout used by blocking :meth:`read` calls.
+    """
+
+    def __init__(self, exchanges, timing=TIMING_FAST, reframe=None,
+                 baudrate=9600, speed=1.0, loop=True, timeout_ms=0):
+        if timing not in (TIMING_ORIGINAL, TIMING_FAST):
+            raise ValueError("timing must be 'original' or 'fast'")
+        self.timing = timing
+        self.reframe = reframe.upper() if reframe else None
+        self.speed = float(speed)
+        self.loop = loop
+        self.timeout = timeout_ms / 1000.0
+        self.byte_time = BITS_PER_BYTE / float(baudrate)
+        if self.reframe:
+            exchanges = [e for e in exchanges if e[2]]
+        self.exchanges = list(exchanges)
+        if not self.exchanges:
+            raise ValueError("capture holds no exchanges")
+
+        self.requests = 0
+        self.replies = 0
+        self.unmatched = 0
+
+        self._pos = 0
+        self._origin = None  # (wall clock, recorded t_ms) of the replay start
+        self._reply = b""
+        self._read = 0
+        self._start = 0.0
+
+    @classmethod
+    def from_capture(cls, path, **kwargs):
+        """Create a replay of capture file *path*."""
+
+        return cls(exchanges(path), **kwargs)
+
+    @property
+    def exhausted(self) -> bool:
+        """True once a non-looping replay has used every exchange."""
+
+        return not self.loop and self._pos >= len(self.exchanges)
+
+    # ------------------------------------------------------------------
+    # UART API
+    # ------------------------------------------------------------------
+
+    def write(self, data) -> int:
+        now = time.perf_counter()
+        self.requests += 1
+        found = self._next(bytes(data))
+        # Like a half-duplex line: a new command drops unread reply bytes
+        self._reply = b""
+        self._read = 0
+        if found is None:
+            self.unmatched += 1
+            return len(data)
+
+        t_ms, _command, reply = found
+        if self.reframe:
+            reg_id = data[2] if self.reframe == "I" else data[1]
+            reply = reframe_reply(self.reframe, reg_id, reply)
+        if not reply:
+            return len(data)
+        self.replies += 1
+        self._reply = reply
+        start = now
+        if self.timing == TIMING_ORIGINAL:
+            origin = self._origin
+            if origin is None or t_ms is None or origin[1] is None or t_ms < origin[1]:
+                # First exchange, or the capture wrapped / has no timing
+                origin = self._origin = (now, t_ms)
+            release = origin[0] + (t_ms - origin[1]) / 1000.0 / self.speed if t_ms is not None else now
+            # Reply starts once the command is on the wire
+            start = max(now, release) + len(data) * self.byte_time
+        self._start = start
+        return len(data)
+
+    def any(self) -> int:
+        return self._arrived(time.perf_counter()) - self._read
+
+    def read(self, n: int = -1):
+        if self.timeout > 0 and not self.any() and self._read < len(self._reply):
+            deadline = time.perf_counter() + self.timeout
+            while not self.any():
+                now = time.perf_counter()
+                if now >= deadline:
+                    break
+                next_byte = self._start + (self._read + 1) * self.byte_time
+                time.sleep(min(next_byte, deadline) - now)
+        waiting = self.any()
+        if not waiting:
+            return None
+        if 0 <= n < waiting:
+            waiting = n
+        data = self._reply[self._read:self._read + waiting]
+        self._read += waiting
+        return data
+
+    def readinto(self, buf, n: int = -1):
+        mv = memoryview(buf)
+        if n >= 0:
+            mv = mv[:n]
+        data = self.read(len(mv))
+        if not data:
+            return None
+        mv[:len(data)] = data
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    # ------------------------------------------------------------------
+    # Replay
+    # ------------------------------------------------------------------
+
+    def _arrived(self, now) -> int:
+        """Number of reply bytes received by time *now*."""
+
+        total = len(self._reply)
+        if self.timing == TIMING_FAST or not total:
+            return total
+        if now < self._start:
+            return 0
+        n = int((now - self._start) / self.byte_time)
+        return n if n < total else total
+
+    def _next(self, command):
+        """Return the exchange answering *command* and advance, or ``None``."""
+
+        ex = self.exchanges
+        count = len(ex)
+        pos = self._pos
+        if pos >= count:
+            if not self.loop:
+                return None
+            pos = 0
+        if self.reframe:
+            self._pos = pos + 1
+            return ex[pos]
+        # Search forward (wrapping if looping) for the same command
+        for i in range(count if self.loop else count - pos):
+            j = (pos + i) % count
+            if ex[j][1] == command:
+                self._pos = j + 1
+                return ex[j]
+        return None
+
+
+# ----------------------------------------------------------------------
+# Command line
+# ----------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", help="capture file, e.g. doc/seriallogs/dump.2.txt")
+    parser.add_argument("--frames", action="store_true", help="print every exchange")
+    parser.add_argument("--replay", choices=("I", "S"),
+                        help="replay the answered exchanges through DaikinSerial")
+    parser.add_argument("--reg", type=lambda v: int(v, 0), default=0x61,
+                        help="registry queried during the replay (default: 0x61)")
+    parser.add_argument("--timing", choices=(TIMING_ORIGINAL, TIMING_FAST),
+                        default=TIMING_FAST)
+    parser.add_argument("--speed", type=float, default=1.0)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    records = parse_capture(args.capture)
+    result = exchanges(records)
+    parse_ms = (time.perf_counter() - t0) * 1000.0
+
+    answered = [e for e in result if e[2]]
+    valid = sum(1 for e in answered if reply_is_valid(e[2]))
+    commands = {}
+    for _t, command, _reply in result:
+        commands[command] = commands.get(command, 0) + 1
+    stamps = [e[0] for e in result if e[0] is not None]
+
+    print("%s: %d records, %d exchanges parsed in %.1f ms" % (
+        Path(args.capture).name, len(records), len(result), parse_ms))
+    if stamps:
+        print("Span: %.1f s" % ((stamps[-1] - stamps[0]) / 1000.0))
+    print("Replies: %d (%d valid, %d corrupted or truncated), %d unanswered" % (
+        len(answered), valid, len(answered) - valid, len(result) - len(answered)))
+    print("Commands:")
+    for command, n in sorted(commands.items(), key=lambda kv: -kv[1]):
+        print("  %s  x%d" % (command.hex(" "), n))
+    if args.frames:
+        for t_ms, command, reply in result:
+            print("%8s  %s  %s" % ("-" if t_ms is None else t_ms,
+                                   command.hex(" "), reply.hex(" ")))
+    if args.replay:
+        replay(result, args.replay, args.reg, args.timing, args.speed)
+
+
+def replay(result, protocol, reg_id, timing, speed) -> None:
+    """Query *reg_id* once per answered exchange and print the outcomes."""
+
+    from daikin_serial import DaikinSerial, DaikinSerialError
+
+    uart = ReplayUART(result, timing=timing, reframe=protocol, speed=speed, loop=False)
+    daikin = DaikinSerial(uart, protocol=protocol, logger=False)
+    t0 = time.perf_counter()
+    while not uart.exhausted:
+        try:
+            daikin.query_registry(reg_id)
+        except DaikinSerialError:
+            pass
+    wall = time.perf_counter() - t0
+
+    stats = daikin.telemetry.snapshot(reg_id)
+    print("Replay (%s, %s): %d queries in %.2f s" % (protocol, timing, stats["requests"], wall))
+    print("  ok %d, timeouts %d, CRC errors %d, protocol errors %d" % (
+        stats["ok"], stats["timeouts"], stats["crc_errors"], stats["protocol_errors"]))
+
+
+if __name__ == "__main__":
+    main()